@@ -1,8 +1,57 @@
 """
 DistancePy - A comprehensive distance metrics library implemented from scratch.
+
+Public names are imported on first access (module ``__getattr__``), so
+``import distancepy`` itself loads neither the metric modules nor pandas;
+pandas is only imported when a file is parsed.
 """
 
-from .api.interface import euclidean_distance
+import importlib
 
 __version__ = "0.1.0"
-__all__ = ["euclidean_distance"]
\ No newline at end of file
+
+# Public names by the module that defines them.
+_EXPORTS = {
+    ".api.interface": (
+        "euclidean_distance",
+        "cosine_distance",
+        "cosine_similarity",
+        "angular_distance",
+        "hamming_distance",
+        "jaccard_distance",
+        "dice_distance",
+        "kl_divergence",
+        "jensen_shannon_distance",
+        "hellinger_distance",
+        "bhattacharyya_distance",
+        "wasserstein_distance",
+        "dtw_distance",
+        "levenshtein_distance",
+        "gower_distance",
+        "categorical_distance",
+        "mahalanobis_distance",
+        "cdist",
+    ),
+    ".api.neighbors": ("knn", "radius_neighbors"),
+    ".api.service": ("AsyncDistanceService",),
+    ".core.parsers": ("BinarySource",),
+    ".core.prepared": ("PreparedData", "prepare"),
+    ".metrics.binary": ("PackedBits", "pack_bits"),
+    ".metrics.learned": ("LinearMapDistance", "MahalanobisDistance", "load_metric"),
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,73 @@
-"""Public API for DistancePy."""
+"""
+Public API for DistancePy.
 
-from .interface import euclidean_distance
+The neighbour searches and the asyncio service are imported on first access,
+so the distance functions don't load asyncio or the search code.
+"""
 
-__all__ = ["euclidean_distance"]
\ No newline at end of file
+import importlib
+from .interface import (
+    angular_distance,
+    bhattacharyya_distance,
+    categorical_distance,
+    cdist,
+    cosine_distance,
+    cosine_similarity,
+    dice_distance,
+    dtw_distance,
+    euclidean_distance,
+    gower_distance,
+    hamming_distance,
+    hellinger_distance,
+    jaccard_distance,
+    jensen_shannon_distance,
+    kl_divergence,
+    levenshtein_distance,
+    mahalanobis_distance,
+    wasserstein_distance,
+)
+
+# Names imported on first access, by the module that defines them.
+_LAZY_EXPORTS = {
+    ".neighbors": ("knn", "radius_neighbors"),
+    ".service": ("AsyncDistanceService", "ServiceStats"),
+}
+_LAZY_MODULES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+__all__ = [
+    "euclidean_distance",
+    "cosine_distance",
+    "cosine_similarity",
+    "angular_distance",
+    "hamming_distance",
+    "jaccard_distance",
+    "dice_distance",
+    "kl_divergence",
+    "jensen_shannon_distance",
+    "hellinger_distance",
+    "bhattacharyya_distance",
+    "wasserstein_distance",
+    "dtw_distance",
+    "levenshtein_distance",
+    "gower_distance",
+    "categorical_distance",
+    "mahalanobis_distance",
+    "cdist",
+    "knn",
+    "radius_neighbors",
+    "AsyncDistanceService",
+    "ServiceStats",
+]
+
+
+def __getattr__(name):
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
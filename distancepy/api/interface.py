@@ -1,9 +1,10 @@
 """Public API interface for DistancePy."""
 
-from ..metrics import euclidean
+from .. import metrics
 
 
-def euclidean_distance(x, y=None, axis=0):
+def euclidean_distance(x, y=None, axis=0, condensed=False, memory_budget=None, out=None,
+                       n_jobs=None, chunk_size=None, dtype=None, accumulate=None, pairwise=False):
     """
     Calculate Euclidean distance with flexible input support.
     
@@ -11,9 +12,27 @@ def euclidean_distance(x, y=None, axis=0):
         x: First input (number, list, array, or file path)
         y: Second input (number, list, array, or file path). If None, compute pairwise distances.
         axis: Axis along which to compute distances (0=rows, 1=columns)
+        condensed: For pairwise distances, return the condensed upper triangle
+            (n*(n-1)/2 entries, row-major) instead of the square matrix
+        memory_budget: Approximate working-set size in bytes for each block of
+            the computation
+        out: Path of a ``.npy`` file (or an array) to write the result into.
+            Pairwise results are streamed to disk block by block, and rerunning
+            an interrupted call resumes from the finished blocks.
+        n_jobs: Number of worker processes to split the work across (-1 for all
+            CPUs). Results are identical to the single-process computation.
+        chunk_size: When comparing a point against a CSV/text file, read the file
+            in blocks of this many rows instead of loading it whole
+        dtype: Floating-point type of inputs and results (e.g. ``numpy.float32``);
+            float64 by default
+        accumulate: Floating-point type used inside the kernels; defaults to
+            ``dtype``. ``dtype=numpy.float32, accumulate=numpy.float64`` stores
+            float32 data and results while computing in float64.
+        pairwise: With ``y``, return the (M, N) distances between every point of
+            x and every point of y instead of matching points (see ``cdist``)
     
     Returns:
-        float or numpy.ndarray: Distance(s)
+        float or numpy.ndarray: Distance(s). A ``numpy.memmap`` when ``out`` is a path.
     
     Examples:
         # Point to point
@@ -33,5 +52,397 @@ def euclidean_distance(x, y=None, axis=0):
         array([[0, 2.828427, 5.656854],
                [2.828427, 0, 2.828427],
                [5.656854, 2.828427, 0]])
+        
+        # Condensed pairwise distances
+        >>> euclidean_distance([[1, 2], [3, 4], [5, 6]], condensed=True)
+        array([2.828427, 5.656854, 2.828427])
+        
+        # Distances between every point of two sets
+        >>> euclidean_distance([[1, 2], [3, 4]], [[1, 2], [3, 4], [5, 6]], pairwise=True)
+        array([[0, 2.828427, 5.656854],
+               [2.828427, 0, 2.828427]])
+        
+        # Pairwise distances written to a memory-mapped file
+        >>> euclidean_distance("large.csv", out="distances.npy")
+        memmap([[...]])
+    """
+    return metrics.euclidean(x, y, axis, condensed=condensed, memory_budget=memory_budget, out=out,
+                     n_jobs=n_jobs, chunk_size=chunk_size, dtype=dtype, accumulate=accumulate,
+                     pairwise=pairwise)
+
+
+def cosine_distance(x, y=None, axis=0, **options):
+    """
+    Calculate cosine distance (1 - cosine similarity) with flexible input support.
+    
+    Rows are normalized once and all-pairs distances are computed as blocked
+    matrix multiplies. A zero vector is at distance 1 from every non-zero
+    vector and 0 from another zero vector.
+    
+    Args:
+        x: First input (number, list, array, file path, or PreparedData)
+        y: Second input. If None, compute pairwise distances.
+        axis: Axis along which to compute distances (0=rows, 1=columns)
+        **options: Any option of ``euclidean_distance`` (condensed, memory_budget,
+            out, n_jobs, chunk_size, dtype, accumulate)
+    
+    Returns:
+        float or numpy.ndarray: Distance(s) in [0, 2]
+    
+    Examples:
+        >>> cosine_distance([1, 0], [0, 1])
+        1.0
+    """
+    return metrics.cosine(x, y, axis, **options)
+
+
+def cosine_similarity(x, y=None, axis=0, **options):
+    """
+    Calculate cosine similarity with flexible input support.
+    
+    Takes the same arguments as ``cosine_distance``. Pairwise results have ones
+    on the diagonal.
+    
+    Returns:
+        float or numpy.ndarray: Similarity (or similarities) in [-1, 1]
+    
+    Examples:
+        >>> cosine_similarity([1, 1], [2, 2])
+        1.0
+    """
+    return metrics.cosine_similarity(x, y, axis, **options)
+
+
+def angular_distance(x, y=None, axis=0, **options):
+    """
+    Calculate angular distance (arccos of cosine similarity, divided by pi).
+    
+    Takes the same arguments as ``cosine_distance``. Unlike cosine distance,
+    angular distance satisfies the triangle inequality.
+    
+    Returns:
+        float or numpy.ndarray: Distance(s) in [0, 1]
+    
+    Examples:
+        >>> angular_distance([1, 0], [0, 1])
+        0.5
+    """
+    return metrics.angular_metric(x, y, axis, **options)
+
+
+def hamming_distance(x, y=None, axis=0, **options):
+    """
+    Calculate Hamming distance between binary vectors: the fraction of differing bits.
+    
+    Inputs are packed 8 bits per byte (non-zero values count as 1) and
+    compared with XOR and a popcount, so memory is 1/64 of the float64
+    representation. ``PackedBits`` from ``pack_bits`` are used as they are,
+    which avoids re-packing data that is compared repeatedly.
+    
+    Args:
+        x: First input (list, array, file path, or PackedBits)
+        y: Second input. If None, compute pairwise distances.
+        axis: Axis along which to compute distances (0=rows, 1=columns);
+            must be 0 for PackedBits
+        **options: Any option of ``euclidean_distance`` except chunk_size
+    
+    Returns:
+        float or numpy.ndarray: Distance(s) in [0, 1]
+    
+    Examples:
+        >>> hamming_distance([1, 0, 1, 1], [1, 1, 1, 0])
+        0.5
+    """
+    return metrics.hamming(x, y, axis, **options)
+
+
+def jaccard_distance(x, y=None, axis=0, **options):
+    """
+    Calculate Jaccard distance between binary vectors: 1 - |x AND y| / |x OR y|.
+    
+    Takes the same arguments as ``hamming_distance``. Two all-zero vectors
+    are at distance 0.
+    
+    Returns:
+        float or numpy.ndarray: Distance(s) in [0, 1]
+    
+    Examples:
+        >>> jaccard_distance([1, 1, 0, 0], [1, 0, 1, 0])
+        0.6666666666666667
+    """
+    return metrics.jaccard(x, y, axis, **options)
+
+
+def dice_distance(x, y=None, axis=0, **options):
+    """
+    Calculate Dice distance between binary vectors: 1 - 2|x AND y| / (|x| + |y|).
+    
+    Takes the same arguments as ``hamming_distance``. Two all-zero vectors
+    are at distance 0.
+    
+    Returns:
+        float or numpy.ndarray: Distance(s) in [0, 1]
+    
+    Examples:
+        >>> dice_distance([1, 1, 0, 0], [1, 0, 1, 0])
+        0.5
+    """
+    return metrics.dice(x, y, axis, **options)
+
+
+def kl_divergence(x, y=None, axis=0, eps=None, **options):
+    """
+    Calculate the Kullback-Leibler divergence KL(x || y) between distributions.
+    
+    Rows are non-negative weights such as histogram counts; they are floored
+    at ``eps`` and normalized to sum to 1. The divergence is not symmetric:
+    pairwise results are full matrices (``condensed`` is not available) and
+    entry ``[i, j]`` is KL(x_i || x_j).
+    
+    Args:
+        x: First input (list, array, file path, or PreparedData)
+        y: Second input. If None, compute pairwise divergences.
+        axis: Axis along which to compute divergences (0=rows, 1=columns)
+        eps: Floor for probabilities so that empty bins stay finite
+            (default 1e-10); 0 disables it, making KL infinite where y has
+            an empty bin that x does not
+        **options: Any option of ``euclidean_distance`` (memory_budget, out,
+            n_jobs, chunk_size, dtype, accumulate)
+    
+    Returns:
+        float or numpy.ndarray: Divergence(s) in nats
+    
+    Examples:
+        >>> kl_divergence([0.5, 0.5], [0.9, 0.1])
+        0.5108256237659906
+    """
+    metric = metrics.kl_divergence if eps is None else metrics.KLDivergence(eps)
+    return metric(x, y, axis, **options)
+
+
+def jensen_shannon_distance(x, y=None, axis=0, eps=None, **options):
+    """
+    Calculate the Jensen-Shannon distance (square root of the JS divergence).
+    
+    Takes the same arguments as ``kl_divergence``. Unlike KL, it is symmetric,
+    bounded by sqrt(ln 2) and satisfies the triangle inequality.
+    
+    Returns:
+        float or numpy.ndarray: Distance(s)
+    
+    Examples:
+        >>> jensen_shannon_distance([1, 0], [0, 1], eps=0)
+        0.8325546111576977
+    """
+    metric = metrics.jensen_shannon if eps is None else metrics.JensenShannonDistance(eps)
+    return metric(x, y, axis, **options)
+
+
+def hellinger_distance(x, y=None, axis=0, eps=None, **options):
+    """
+    Calculate the Hellinger distance between distributions.
+    
+    Takes the same arguments as ``kl_divergence``; no floor is applied by
+    default (``eps=0``) since empty bins need no special handling.
+    
+    Returns:
+        float or numpy.ndarray: Distance(s) in [0, 1]
+    
+    Examples:
+        >>> hellinger_distance([1, 0], [0, 1])
+        1.0
+    """
+    metric = metrics.hellinger if eps is None else metrics.HellingerDistance(eps)
+    return metric(x, y, axis, **options)
+
+
+def bhattacharyya_distance(x, y=None, axis=0, eps=None, **options):
+    """
+    Calculate the Bhattacharyya distance -ln(sum(sqrt(p * q))) between distributions.
+    
+    Takes the same arguments as ``kl_divergence``. Distributions with disjoint
+    support are at infinite distance unless ``eps`` > 0.
+    
+    Returns:
+        float or numpy.ndarray: Distance(s)
+    
+    Examples:
+        >>> bhattacharyya_distance([0.5, 0.5], [0.5, 0.5])
+        0.0
+    """
+    metric = metrics.bhattacharyya if eps is None else metrics.BhattacharyyaDistance(eps)
+    return metric(x, y, axis, **options)
+
+
+def wasserstein_distance(x, y=None, axis=0, **options):
+    """
+    Calculate the 1-D Wasserstein (earth mover's) distance between samples.
+    
+    Each row (or column with axis=1) is a set of samples of a one-dimensional
+    distribution, and rows are sorted once before all pairs are compared.
+    
+    Args:
+        x: First input (list, array, file path, or PreparedData)
+        y: Second input with the same number of samples per row. If None,
+            compute pairwise distances.
+        axis: Axis along which to compute distances (0=rows, 1=columns)
+        **options: Any option of ``euclidean_distance``
+    
+    Returns:
+        float or numpy.ndarray: Distance(s)
+    
+    Examples:
+        >>> wasserstein_distance([0, 1, 3], [5, 6, 8])
+        5.0
+    """
+    return metrics.wasserstein(x, y, axis, **options)
+
+
+def dtw_distance(x, y=None, axis=0, window=None, **options):
+    """
+    Calculate dynamic time warping distance between sequences of any lengths.
+    
+    Args:
+        x: A sequence (1-D list or array), a batch of equal-length sequences
+            (2-D array or file, one per row), or a list of sequences of
+            different lengths
+        y: Sequence(s) to compare with. If None, compute pairwise distances.
+        axis: With 2-D inputs, whether sequences are rows (0) or columns (1)
+        window: Sakoe-Chiba band width in samples (None for no constraint)
+        **options: condensed, memory_budget, out and dtype, as for
+            ``euclidean_distance``
+    
+    Returns:
+        float or numpy.ndarray: Distance(s)
+    
+    Examples:
+        >>> dtw_distance([0, 1, 2], [0, 0, 1, 1, 2])
+        0.0
+        >>> dtw_distance([[0, 1, 2], [5, 5]])  # Ragged batch
+        array([[0.        , 7.07106781],
+               [7.07106781, 0.        ]])
+    """
+    metric = metrics.dtw if window is None else metrics.DTWDistance(window)
+    return metric(x, y, axis, **options)
+
+
+def levenshtein_distance(x, y=None, axis=0, **options):
+    """
+    Calculate Levenshtein (edit) distance between strings or sequences.
+    
+    Takes the same inputs as ``dtw_distance``; strings and lists of strings
+    are compared character by character.
+    
+    Returns:
+        float or numpy.ndarray: Number(s) of insertions, deletions and substitutions
+    
+    Examples:
+        >>> levenshtein_distance("kitten", "sitting")
+        3.0
+    """
+    return metrics.levenshtein(x, y, axis, **options)
+
+
+def gower_distance(x, y=None, categorical=None, **options):
+    """
+    Calculate Gower distance between records with numeric and string columns.
+    
+    String and boolean columns are kept (not dropped as by the numeric
+    metrics) and encoded once into integer codes; numeric columns are divided
+    by their range over both inputs. The distance is the mean over columns of
+    the scaled absolute differences and of 0/1 category mismatches, skipping
+    missing values.
+    
+    Args:
+        x: Records (file path, pandas DataFrame, list of rows, or MixedData),
+            or a single record as a flat list
+        y: Record(s) to compare with. If None, compute pairwise distances.
+        categorical: Numeric columns to treat as categorical (names or
+            positions), or True for all columns
+        **options: Any option of ``euclidean_distance`` except axis and chunk_size
+    
+    Returns:
+        float or numpy.ndarray: Distance(s) in [0, 1]
+    
+    Examples:
+        >>> gower_distance([["A", 1.0], ["B", 3.0], ["A", 2.0]])
+        array([[0.  , 1.  , 0.25],
+               [1.  , 0.  , 0.75],
+               [0.25, 0.75, 0.  ]])
+    """
+    metric = metrics.gower if categorical is None else metrics.GowerDistance(categorical)
+    return metric(x, y, **options)
+
+
+def categorical_distance(x, y=None, **options):
+    """
+    Calculate the overlap distance: the fraction of columns whose values differ.
+    
+    Every column is treated as categorical. Takes the same inputs as
+    ``gower_distance``.
+    
+    Returns:
+        float or numpy.ndarray: Distance(s) in [0, 1]
+    
+    Examples:
+        >>> categorical_distance(["red", "S", 1], ["red", "M", 1])
+        0.3333333333333333
+    """
+    return metrics.categorical_metric(x, y, **options)
+
+
+def mahalanobis_distance(x, y=None, axis=0, covariance=None, **options):
+    """
+    Calculate Mahalanobis distance sqrt((x - y)^T S^-1 (x - y)).
+    
+    The covariance S is factored once and the points are whitened a single
+    time, after which distances are computed with the blocked Euclidean
+    kernels. To reuse a covariance across calls (or save it), fit a
+    ``MahalanobisDistance`` and call it directly.
+    
+    Args:
+        x: First input (list, array, file path, or PreparedData)
+        y: Second input. If None, compute pairwise distances.
+        axis: Axis along which to compute distances (0=rows, 1=columns)
+        covariance: (d, d) covariance matrix. If None, it is estimated from
+            the points of x and y.
+        **options: Any option of ``euclidean_distance``
+    
+    Returns:
+        float or numpy.ndarray: Distance(s)
+    
+    Examples:
+        >>> mahalanobis_distance([0, 0], [2, 0], covariance=[[4, 0], [0, 1]])
+        1.0
+    """
+    metric = metrics.mahalanobis if covariance is None else metrics.MahalanobisDistance(covariance)
+    return metric(x, y, axis, **options)
+
+
+def cdist(x, y, metric="euclidean", axis=0, **options):
+    """
+    Calculate distances between every point of x and every point of y.
+    
+    Shorthand for calling a metric with ``pairwise=True``: the (M, N) result is
+    computed in tiles sized to ``memory_budget`` with the metric's vectorized
+    cross kernel, optionally across processes (``n_jobs``) or into a
+    resumable ``.npy`` file (``out``). Points must have the same number of
+    dimensions.
+    
+    Args:
+        x: First set of points (list, array, file path, or PreparedData)
+        y: Second set of points. A 1-D input is a single point.
+        metric: Metric name (see ``distancepy.metrics.METRICS``) or instance
+        axis: Axis along which points lie (0=rows, 1=columns)
+        **options: Any option of the metric, e.g. ``memory_budget``, ``out``,
+            ``n_jobs`` or ``dtype``
+    
+    Returns:
+        numpy.ndarray: Distances of shape (M, N)
+    
+    Examples:
+        >>> cdist([[0, 0], [3, 4]], [[0, 0], [6, 8], [3, 0]])
+        array([[0., 10., 3.],
+               [5., 5., 4.]])
     """
-    return euclidean(x, y, axis)
\ No newline at end of file
+    return metrics.get_metric(metric)(x, y, axis, pairwise=True, **options)
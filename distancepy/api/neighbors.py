@@ -0,0 +1,136 @@
+"""Neighbour queries for DistancePy."""
+
+from ..core.blocking import resolve_dtypes
+from ..core.parsers import DataParser
+from ..core.prepared import PreparedData
+from ..core.exceptions import InputError
+from ..core.search import knn_search, radius_search
+from ..metrics import SequenceDistance, get_metric
+
+
+def _parse_points(data, metric, dtype, compute_dtype):
+    """
+    Parse an input into a 2-D array of points.
+    
+    Returns:
+        points, precomputation (for prepared inputs, else None), whether the
+        input was a single 1-D point
+    """
+    array = DataParser.parse_single_input(data, dtype)
+    if array.ndim == 1:
+        return array.reshape(1, -1), None, True
+    aux = data.aux(metric, compute_dtype) if isinstance(data, PreparedData) else None
+    return array, aux, False
+
+
+def knn(query, data=None, k=1, metric="euclidean", exclude_self=None,
+        memory_budget=None, dtype=None, accumulate=None):
+    """
+    Find the exact k nearest neighbours of each query point.
+    
+    Data is processed block by block while a running top-k is kept per query,
+    so memory does not grow with the size of the full distance matrix.
+    
+    Args:
+        query: Query point or points (list, array, file path, or PreparedData)
+        data: Points to search (list, array, file path, or PreparedData).
+            If None, the query points are searched against themselves.
+        k: Number of neighbours to return per query
+        metric: Metric name or instance (e.g. "euclidean"). Sequence metrics
+            such as "dtw" accept ragged lists of sequences and skip candidates
+            using cheap lower bounds (see ``SequenceDistance.knn``).
+        exclude_self: Do not report a point as its own neighbour. Defaults to
+            True when searching a dataset against itself.
+        memory_budget: Approximate working-set size in bytes per block
+        dtype, accumulate: Floating-point types of the data and of the
+            computation, as for ``euclidean_distance``
+    
+    Returns:
+        indices, distances: arrays of shape (n_queries, k) sorted by increasing
+        distance, or shape (k,) for a single query point
+    
+    Examples:
+        >>> indices, distances = knn([0, 0], [[3, 4], [1, 1], [6, 8]], k=2)
+        >>> indices
+        array([1, 0])
+        >>> distances
+        array([1.414214, 5.      ])
+    """
+    metric = get_metric(metric)
+    out_dtype, compute_dtype = resolve_dtypes(dtype, accumulate)
+    if isinstance(metric, SequenceDistance):
+        indices, distances = metric.knn(query, data, k, exclude_self=exclude_self,
+                                        memory_budget=memory_budget)
+        return indices, distances.astype(out_dtype, copy=False)
+    self_search = data is None or data is query
+    if exclude_self is None:
+        exclude_self = self_search
+    
+    metric, query, data, _ = metric._bind_inputs(query, None if self_search else data)
+    queries, query_aux, single = _parse_points(query, metric, dtype, compute_dtype)
+    if self_search:
+        points, data_aux = queries, query_aux
+    else:
+        points, data_aux, _ = _parse_points(data, metric, dtype, compute_dtype)
+    
+    indices, distances = knn_search(metric, queries, points, k, exclude_self=exclude_self,
+                                    memory_budget=memory_budget, compute_dtype=compute_dtype,
+                                    query_aux=query_aux, data_aux=data_aux)
+    distances = distances.astype(out_dtype, copy=False)
+    if single:
+        return indices[0], distances[0]
+    return indices, distances
+
+
+def radius_neighbors(x, y=None, r=None, metric="euclidean", exclude_self=None,
+                     memory_budget=None, dtype=None, accumulate=None):
+    """
+    Find all pairs of points within distance ``r`` without building a dense matrix.
+    
+    The distance matrix is computed block by block and only matching pairs are
+    kept, in a compact CSR-style layout.
+    
+    Args:
+        x: Query point or points (list, array, file path, or PreparedData)
+        y: Points to search. If None, the points of ``x`` are searched against
+            themselves.
+        r: Distance threshold; pairs at distance <= r match
+        metric: Metric name or instance (e.g. "euclidean")
+        exclude_self: Do not report a point as its own neighbour. Defaults to
+            True when searching a dataset against itself.
+        memory_budget: Approximate working-set size in bytes per block
+        dtype, accumulate: Floating-point types of the data and of the
+            computation, as for ``euclidean_distance``
+    
+    Returns:
+        RadiusNeighbors(indptr, indices, distances): the neighbours of query i
+        are ``indices[indptr[i]:indptr[i + 1]]``, in increasing index order
+    
+    Examples:
+        >>> result = radius_neighbors([[0, 0], [0, 1], [5, 5]], r=1.5)
+        >>> result.indptr
+        array([0, 1, 2, 2])
+        >>> result.indices
+        array([1, 0])
+    """
+    if r is None:
+        raise InputError("radius_neighbors requires a distance threshold r")
+    metric = get_metric(metric)
+    if isinstance(metric, SequenceDistance):
+        raise InputError(f"radius_neighbors does not support the sequence metric {metric.name}")
+    out_dtype, compute_dtype = resolve_dtypes(dtype, accumulate)
+    self_search = y is None or y is x
+    if exclude_self is None:
+        exclude_self = self_search
+    
+    metric, x, y, _ = metric._bind_inputs(x, None if self_search else y)
+    queries, query_aux, _ = _parse_points(x, metric, dtype, compute_dtype)
+    if self_search:
+        points, data_aux = queries, query_aux
+    else:
+        points, data_aux, _ = _parse_points(y, metric, dtype, compute_dtype)
+    
+    result = radius_search(metric, queries, points, float(r), exclude_self=exclude_self,
+                           memory_budget=memory_budget, compute_dtype=compute_dtype,
+                           query_aux=query_aux, data_aux=data_aux)
+    return result._replace(distances=result.distances.astype(out_dtype, copy=False))
@@ -0,0 +1,194 @@
+"""Asyncio front end that batches concurrent point queries against one reference set."""
+
+import asyncio
+import time
+import numpy as np
+from collections import namedtuple
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, List, Optional, Set, Tuple
+from ..core.exceptions import DimensionMismatchError, InputError
+from ..core.parsers import DataParser
+from ..core.prepared import PreparedData, prepare
+from ..metrics import SequenceDistance, get_metric
+from ..metrics.categorical import GowerDistance
+from ..metrics.learned import LinearMapDistance
+
+ServiceStats = namedtuple("ServiceStats", ["requests", "batches", "mean_batch_size", "mean_latency",
+                                           "max_latency", "compute_time", "throughput"])
+
+
+class AsyncDistanceService:
+    """
+    Serve distances from query points to a fixed reference set without blocking the event loop.
+    
+    Queries that arrive within ``max_wait`` seconds of each other are stacked
+    into one M x N cross computation (see ``cdist``), which runs in an
+    executor while the event loop keeps accepting requests. A batch is sent
+    as soon as it holds ``max_batch_size`` points, so the wait only adds
+    latency under light load. The reference is prepared once, so its
+    per-row precomputation (e.g. squared norms) is shared by every batch.
+    A Mahalanobis metric without a covariance is fitted once on the
+    reference, so a query's distances do not depend on what shares its batch.
+    
+    Args:
+        reference: Reference points (list, array, file path, or PreparedData)
+        metric: Metric name or instance (see ``distancepy.metrics.METRICS``)
+        max_batch_size: Number of query points at which a batch is sent at once
+        max_wait: Longest time in seconds a query waits for others to join its batch
+        executor: Executor running the computations. Defaults to a
+            single-thread pool owned (and shut down) by the service.
+        **options: Options of the metric call, e.g. ``memory_budget`` or ``dtype``
+    
+    Examples:
+        >>> async with AsyncDistanceService("reference.csv", max_wait=0.002) as service:
+        ...     distances = await service.distance([0.5, 1.0])
+        ...     service.stats()
+    """
+    
+    def __init__(self, reference: Any, metric: Any = "euclidean", max_batch_size: int = 64,
+                 max_wait: float = 0.002, executor: Optional[Executor] = None, **options: Any):
+        metric = get_metric(metric)
+        if isinstance(metric, SequenceDistance):
+            raise InputError(f"{metric.name} compares sequences; the service needs points")
+        if isinstance(metric, GowerDistance):
+            raise InputError(f"{metric.name} scales columns by the ranges of its inputs, "
+                             f"which would change from batch to batch")
+        if max_batch_size < 1:
+            raise InputError(f"max_batch_size must be positive, got {max_batch_size}")
+        if max_wait < 0:
+            raise InputError(f"max_wait must be non-negative, got {max_wait}")
+        self.reference = reference if isinstance(reference, PreparedData) else prepare(reference)
+        if self.reference.ndim != 2:
+            raise DimensionMismatchError(
+                f"Reference must be a 2-D array of points. Got shape {self.reference.shape}"
+            )
+        if isinstance(metric, LinearMapDistance):
+            metric = metric._fitted_for(self.reference, None, 0)
+        self.metric = metric
+        self.max_batch_size = int(max_batch_size)
+        self.max_wait = float(max_wait)
+        self._options = options
+        self._owns_executor = executor is None
+        self._executor = executor if executor is not None else ThreadPoolExecutor(max_workers=1)
+        
+        self._pending: List[Tuple[np.ndarray, asyncio.Future, float]] = []
+        self._pending_points = 0
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._batches: Set[asyncio.Task] = set()
+        self._closed = False
+        self.reset_stats()
+    
+    async def __aenter__(self) -> "AsyncDistanceService":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+    
+    async def distance(self, query: Any) -> np.ndarray:
+        """
+        Distances from a query point (or several, one per row) to every reference point.
+        
+        Returns:
+            Array of shape (N,) for a single point, (k, N) for k points
+        """
+        if self._closed:
+            raise InputError("AsyncDistanceService is closed")
+        points = DataParser.parse_single_input(query)
+        single = points.ndim == 1
+        if single:
+            points = points.reshape(1, -1)
+        if points.ndim != 2 or points.shape[1] != self.reference.shape[1]:
+            raise DimensionMismatchError(
+                f"Queries must have {self.reference.shape[1]} dimensions. Got shape {points.shape}"
+            )
+        
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((points, future, time.perf_counter()))
+        self._pending_points += points.shape[0]
+        if self._pending_points >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+        result = await future
+        return result[0] if single else result
+    
+    async def close(self) -> None:
+        """Send the pending queries, wait for every batch and release the executor."""
+        self._closed = True
+        self._flush()
+        if self._batches:
+            await asyncio.gather(*self._batches)
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+    
+    def stats(self) -> ServiceStats:
+        """
+        Return request and batch counts, latencies and throughput.
+        
+        Latencies run from the call of ``distance`` to its result, in seconds;
+        ``compute_time`` is the total time spent in batch computations and
+        ``throughput`` the number of requests answered per second since the
+        first request.
+        """
+        requests, batches = self._requests, self._batch_count
+        elapsed = (self._last_done - self._first_request) if requests else 0.0
+        return ServiceStats(
+            requests=requests,
+            batches=batches,
+            mean_batch_size=self._points / batches if batches else 0.0,
+            mean_latency=self._total_latency / requests if requests else 0.0,
+            max_latency=self._max_latency,
+            compute_time=self._compute_time,
+            throughput=requests / elapsed if elapsed > 0 else 0.0,
+        )
+    
+    def reset_stats(self) -> None:
+        """Reset the statistics returned by ``stats``."""
+        self._requests = self._batch_count = self._points = 0
+        self._total_latency = self._max_latency = self._compute_time = 0.0
+        self._first_request = self._last_done = None
+    
+    def _flush(self) -> None:
+        """Send the pending queries as one batch."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending, self._pending_points = self._pending, [], 0
+        task = asyncio.ensure_future(self._run_batch(batch))
+        self._batches.add(task)
+        task.add_done_callback(self._batches.discard)
+    
+    def _compute(self, queries: np.ndarray) -> np.ndarray:
+        return self.metric(queries, self.reference, pairwise=True, **self._options)
+    
+    async def _run_batch(self, batch: List[Tuple[np.ndarray, asyncio.Future, float]]) -> None:
+        """Compute one batch in the executor and hand each request its rows."""
+        loop = asyncio.get_running_loop()
+        queries = batch[0][0] if len(batch) == 1 else np.vstack([points for points, _, _ in batch])
+        start = time.perf_counter()
+        try:
+            distances = await loop.run_in_executor(self._executor, self._compute, queries)
+        except Exception as e:
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        done = time.perf_counter()
+        
+        offset = 0
+        for points, future, submitted in batch:
+            if not future.done():  # The caller may have been cancelled
+                future.set_result(distances[offset:offset + points.shape[0]])
+            offset += points.shape[0]
+            self._total_latency += done - submitted
+            self._max_latency = max(self._max_latency, done - submitted)
+            if self._first_request is None or submitted < self._first_request:
+                self._first_request = submitted
+        self._requests += len(batch)
+        self._batch_count += 1
+        self._points += queries.shape[0]
+        self._compute_time += done - start
+        self._last_done = done
@@ -8,7 +8,9 @@ from .exceptions import (
     FileFormatError, 
     ParsingError
 )
-from .parsers import DataParser, DistanceInputParser
+from .mixed import MixedData
+from .parsers import BinarySource, DataParser, DistanceInputParser
+from .prepared import PreparedData, prepare
 from .validators import validate_numeric_array, validate_dimensions, validate_file_path
 
 __all__ = [
@@ -19,8 +21,12 @@ __all__ = [
     "DimensionMismatchError",
     "FileFormatError",
     "ParsingError",
+    "BinarySource",
     "DataParser",
     "DistanceInputParser",
+    "MixedData",
+    "PreparedData",
+    "prepare",
     "validate_numeric_array",
     "validate_dimensions",
     "validate_file_path",
@@ -2,13 +2,49 @@
 
 from abc import ABC, abstractmethod
 import numpy as np
-from typing import Union, Any
-from .parsers import DistanceInputParser
+from pathlib import Path
+from typing import Union, Any, Iterator, Optional, Tuple
+from .blocking import (
+    allocate_pairwise,
+    as_float,
+    concat_aux,
+    iter_row_blocks,
+    iter_tiles,
+    resolve_block_size,
+    resolve_dtypes,
+    resolve_row_block,
+    slice_aux,
+    write_tile,
+)
+from .output import data_fingerprint, open_output, store_result
+from .parallel import resolve_n_jobs, run_rows_parallel, run_tiles_parallel
+from .exceptions import DimensionMismatchError, InputError
+from .parsers import DEFAULT_CHUNK_SIZE, DataParser, DistanceInputParser
+from .prepared import PreparedData
 from .validators import validate_dimensions
 
 
 class BaseDistance(ABC):
-    """Abstract base class for all distance metrics."""
+    """
+    Abstract base class for all distance metrics.
+
+    Subclasses must implement ``_compute`` for a single pair of points. They can
+    also override the batched kernels (``_compute_one_to_many``,
+    ``_compute_rowwise``, ``_compute_cross`` and ``_compute_self``) with
+    whole-array implementations; the defaults here fall back to calling
+    ``_compute`` once per pair.
+
+    Metrics with ``symmetric = False`` (d(x, y) != d(y, x)) get every tile of
+    a pairwise computation computed rather than mirrored. Metrics with
+    ``similarity = True`` grow as points get closer; they can be called
+    directly but not used where results are ranked as distances.
+    """
+    
+    # Whether d(x, y) == d(y, x)
+    symmetric = True
+    
+    # Whether larger values mean closer points (a similarity, not a distance)
+    similarity = False
     
     def __init__(self, name: str):
         self.name = name
@@ -18,7 +54,12 @@ class BaseDistance(ABC):
         """Compute distance between two arrays. Must be implemented by subclasses."""
         pass
     
-    def __call__(self, x: Any, y: Any = None, axis: int = 0) -> Union[float, np.ndarray]:
+    def __call__(self, x: Any, y: Any = None, axis: int = 0,
+                 condensed: bool = False, memory_budget: Optional[int] = None,
+                 out: Union[str, Path, np.ndarray, None] = None,
+                 n_jobs: Optional[int] = None,
+                 chunk_size: Optional[int] = None, dtype: Any = None,
+                 accumulate: Any = None, pairwise: bool = False) -> Union[float, np.ndarray]:
         """
         Calculate distance with flexible input parsing.
         
@@ -26,75 +67,402 @@ class BaseDistance(ABC):
             x: First input (point, list, array, or file)
             y: Second input (point, list, array, or file). If None, compute pairwise distances.
             axis: Axis along which to compute distances (0=rows, 1=columns)
+            condensed: For pairwise distances, return the condensed upper triangle
+                (n*(n-1)/2 entries) instead of the square matrix
+            memory_budget: Approximate working-set size in bytes for each block of
+                the computation. Defaults to ``DEFAULT_MEMORY_BUDGET``.
+            out: Path of a ``.npy`` file (or an array) to write array results into.
+                Pairwise results are streamed to the file tile by tile and an
+                interrupted run resumes from the finished tiles. For paths the
+                returned array is a ``np.memmap``.
+            n_jobs: Number of worker processes for pairwise, point-to-array and
+                array-to-array distances (-1 for all CPUs). Inputs and outputs
+                are shared with the workers through shared memory, and results
+                are identical to the single-process path.
+            chunk_size: When one input is a point and the other a CSV/text file,
+                read the file in blocks of this many rows instead of loading it
+                whole (see ``iter_point_to_array``).
+            dtype: Floating-point type of inputs and results, e.g. ``np.float32``
+                to halve memory and bandwidth. Defaults to float64 results.
+            accumulate: Floating-point type the kernels compute in. Defaults to
+                ``dtype``; use ``np.float64`` with ``dtype=np.float32`` to keep
+                float32 storage with float64 accuracy.
+            pairwise: With ``y``, compare every row of x with every row of y and
+                return the (M, N) matrix (like ``scipy.spatial.distance.cdist``)
+                instead of matching rows. A 1-D input counts as one point.
         
         Returns:
             Distance(s) as float or numpy array
         """
-        x_array, y_array, calc_type = DistanceInputParser.parse_distance_inputs(x, y, axis)
+        metric, x, y, axis = self._bind_inputs(x, y, axis)
+        return metric._evaluate(x, y, axis, condensed=condensed, memory_budget=memory_budget,
+                                out=out, n_jobs=n_jobs, chunk_size=chunk_size, dtype=dtype,
+                                accumulate=accumulate, pairwise=pairwise)
+    
+    def _evaluate(self, x: Any, y: Any, axis: int, condensed: bool = False,
+                  memory_budget: Optional[int] = None,
+                  out: Union[str, Path, np.ndarray, None] = None,
+                  n_jobs: Optional[int] = None, chunk_size: Optional[int] = None,
+                  dtype: Any = None, accumulate: Any = None,
+                  pairwise: bool = False) -> Union[float, np.ndarray]:
+        """Parse the inputs and dispatch to the calculation type (see ``__call__``)."""
+        out_dtype, compute_dtype = resolve_dtypes(dtype, accumulate)
+        
+        if chunk_size is not None and y is not None and axis == 0 and not pairwise:
+            x_is_file, y_is_file = isinstance(x, (str, Path)), isinstance(y, (str, Path))
+            if x_is_file != y_is_file:
+                point, source = (y, x) if x_is_file else (x, y)
+                blocks = list(self.iter_point_to_array(point, source, chunk_size, compute_dtype,
+                                                       point_first=not x_is_file))
+                result = np.concatenate(blocks) if blocks else np.empty(0)
+                result = result.astype(out_dtype, copy=False)
+                return result if out is None else store_result(out, result)
+        
+        x_array, y_array, calc_type = DistanceInputParser.parse_distance_inputs(x, y, axis, dtype,
+                                                                                pairwise)
+        prepared = {id(item.array): item for item in (x, y) if isinstance(item, PreparedData)}
+        options = {"memory_budget": memory_budget, "n_jobs": n_jobs,
+                   "out_dtype": out_dtype, "compute_dtype": compute_dtype}
         
         if calc_type == "point_to_point":
             x_array, y_array = validate_dimensions(x_array, y_array)
-            return float(self._compute(x_array, y_array))
+            return float(self._compute(self._as_compute_block(x_array, compute_dtype),
+                                       self._as_compute_block(y_array, compute_dtype)))
         
         elif calc_type == "array_to_array":
-            return self._compute_array_to_array(x_array, y_array, axis)
+            result = self._compute_array_to_array(x_array, y_array, axis, **options)
         
         elif calc_type == "point_to_array":
-            return self._compute_point_to_array(x_array, y_array, axis)
+            result = self._compute_point_to_array(x_array, y_array, axis, **options)
+        
+        elif calc_type == "array_to_point":
+            result = self._compute_array_to_point(x_array, y_array, axis, **options)
         
         elif calc_type == "pairwise":
-            return self._compute_pairwise(x_array, axis)
+            aux = None
+            if id(x_array) in prepared and axis == 0:
+                aux = prepared[id(x_array)].aux(self, compute_dtype)
+            return self._compute_pairwise(x_array, axis, condensed, out=out, aux=aux, **options)
+        
+        else:  # cross
+            if condensed:
+                raise InputError("Condensed output is only available for distances within one input")
+            aux = [prepared[id(array)].aux(self, compute_dtype)
+                   if id(array) in prepared and axis == 0 and array.ndim == 2 else None
+                   for array in (x_array, y_array)]
+            return self._compute_cross_pairwise(x_array, y_array, axis, out=out, aux=aux, **options)
+        
+        return result if out is None else store_result(out, result)
+    
+    # ------------------------------------------------------------------
+    # Batched kernels. Every kernel works on rows; column-wise requests are
+    # transposed before they get here.
+    # ------------------------------------------------------------------
+    
+    def _bind_inputs(self, x: Any, y: Any = None, axis: int = 0) -> Tuple[Any, Any, Any, int]:
+        """
+        Hook for metrics whose parameters or input representation depend on the inputs.
+        
+        Returns the metric instance to evaluate with (``self`` or a configured
+        copy) and the inputs and axis to pass to it. Neighbour searches call it
+        too, so that every entry point sees the same inputs.
+        """
+        return self, x, y, axis
+    
+    def _as_compute_block(self, block: np.ndarray, compute_dtype: Any = None) -> np.ndarray:
+        """Convert a block of input rows to the representation the kernels expect."""
+        return as_float(block, compute_dtype)
+    
+    def _aux_key(self) -> Any:
+        """
+        Key under which ``PreparedData`` caches this metric's precomputation.
+        
+        Metrics whose precomputation depends on parameters must include them.
+        """
+        return self.name
+    
+    def _precompute(self, array: np.ndarray) -> Any:
+        """
+        Return per-row auxiliary data reused by ``_compute_cross``/``_compute_self``.
         
-        else:  # mixed
-            return self._compute_mixed(x_array, y_array, axis)
+        The result is either None, or an array (or tuple of arrays) whose first
+        axis matches the rows of ``array`` so that it can be sliced per block.
+        """
+        return None
+    
+    def _compute_one_to_many(self, point: np.ndarray, array: np.ndarray) -> np.ndarray:
+        """Compute distances from ``point`` to each row of ``array``."""
+        return np.array([self._compute(point, array[i]) for i in range(array.shape[0])])
     
-    def _compute_array_to_array(self, x: np.ndarray, y: np.ndarray, axis: int) -> np.ndarray:
+    def _compute_rowwise(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """Compute distances between matching rows of ``x`` and ``y``."""
+        return np.array([self._compute(x[i], y[i]) for i in range(x.shape[0])])
+    
+    def _compute_cross(self, x: np.ndarray, y: np.ndarray,
+                       x_aux: Any = None, y_aux: Any = None) -> np.ndarray:
+        """Compute the (len(x), len(y)) matrix of distances between all rows."""
+        distances = np.empty((x.shape[0], y.shape[0]))
+        for i in range(x.shape[0]):
+            for j in range(y.shape[0]):
+                distances[i, j] = self._compute(x[i], y[j])
+        return distances
+    
+    def _compute_self(self, x: np.ndarray, aux: Any = None) -> np.ndarray:
+        """Compute the symmetric, zero-diagonal matrix of distances between rows of ``x``."""
+        if not self.symmetric:
+            return self._compute_cross(x, x, aux, aux)
+        n = x.shape[0]
+        distances = np.zeros((n, n))
+        for i in range(n):
+            for j in range(i + 1, n):
+                distances[i, j] = distances[j, i] = self._compute(x[i], x[j])
+        return distances
+    
+    # ------------------------------------------------------------------
+    # Calculation types
+    # ------------------------------------------------------------------
+    
+    def _compute_array_to_array(self, x: np.ndarray, y: np.ndarray, axis: int,
+                                **options: Any) -> np.ndarray:
         """Compute element-wise distances between two arrays."""
-        if axis == 0:  # Row-wise
-            return np.array([self._compute(x[i], y[i]) for i in range(x.shape[0])])
-        else:  # Column-wise
-            return np.array([self._compute(x[:, i], y[:, i]) for i in range(x.shape[1])])
+        if axis == 1:  # Column-wise
+            x, y = x.T, y.T
+        return self._compute_row_blocks(x, y, rowwise=True, **options)
     
-    def _compute_point_to_array(self, point: np.ndarray, array: np.ndarray, axis: int) -> np.ndarray:
+    def _compute_point_to_array(self, point: np.ndarray, array: np.ndarray, axis: int,
+                                **options: Any) -> np.ndarray:
         """Compute distances from a point to each row/column in an array."""
-        if axis == 0:  # Point to each row
-            return np.array([self._compute(point, array[i]) for i in range(array.shape[0])])
-        else:  # Point to each column
-            return np.array([self._compute(point, array[:, i]) for i in range(array.shape[1])])
-    
-    def _compute_pairwise(self, array: np.ndarray, axis: int) -> np.ndarray:
-        """Compute pairwise distances within an array."""
-        if axis == 0:  # Between rows
-            n = array.shape[0]
-            distances = np.zeros((n, n))
-            for i in range(n):
-                for j in range(i + 1, n):
-                    dist = self._compute(array[i], array[j])
-                    distances[i, j] = distances[j, i] = dist
-            return distances
-        else:  # Between columns
-            n = array.shape[1]
-            distances = np.zeros((n, n))
-            for i in range(n):
-                for j in range(i + 1, n):
-                    dist = self._compute(array[:, i], array[:, j])
-                    distances[i, j] = distances[j, i] = dist
-            return distances
-    
-    def _compute_mixed(self, x: np.ndarray, y: np.ndarray, axis: int) -> np.ndarray:
-        """Handle mixed/irregular array shapes."""
-        # Try to flatten and compute if possible
+        if axis == 1:  # Point to each column
+            array = array.T
+        return self._compute_row_blocks(point, array, rowwise=False, **options)
+    
+    def _compute_array_to_point(self, array: np.ndarray, point: np.ndarray, axis: int,
+                                **options: Any) -> np.ndarray:
+        """Compute distances from each row/column in an array to a point."""
+        if self.symmetric:
+            return self._compute_point_to_array(point, array, axis, **options)
+        if axis == 1:
+            array = array.T
+        # Keep the argument order: the row-wise kernel against the repeated point
+        return self._compute_row_blocks(array, np.broadcast_to(point, array.shape),
+                                        rowwise=True, **options)
+    
+    def _compute_row_blocks(self, other: np.ndarray, rows: np.ndarray, rowwise: bool,
+                            memory_budget: Optional[int] = None, n_jobs: Optional[int] = None,
+                            out_dtype: Any = np.float64, compute_dtype: Any = None) -> np.ndarray:
+        """Run the one-to-many or row-wise kernel over blocks of ``rows``."""
+        n = rows.shape[0]
+        block = resolve_row_block(n, rows.shape[1], memory_budget=memory_budget)
+        n_jobs = resolve_n_jobs(n_jobs)
+        if block == n and n_jobs == 1:
+            result = self._compute_row_block(other, rows, 0, n, rowwise, compute_dtype)
+            return result.astype(out_dtype, copy=False)
+        
+        blocks = list(iter_row_blocks(n, block))
+        result = np.empty(n, dtype=out_dtype)
+        if n_jobs > 1 and len(blocks) > 1:
+            run_rows_parallel(self, other, rows, blocks, result, n_jobs, rowwise, compute_dtype)
+            return result
+        for start, stop in blocks:
+            result[start:stop] = self._compute_row_block(other, rows, start, stop, rowwise, compute_dtype)
+        return result
+    
+    def _compute_row_block(self, other: np.ndarray, rows: np.ndarray, start: int, stop: int,
+                           rowwise: bool, compute_dtype: Any = None) -> np.ndarray:
+        """
+        Compute one block of a one-to-many or row-wise computation.
+        
+        Only the block is converted to the compute dtype, so integer or
+        memory-mapped inputs are never converted as a whole.
+        """
+        if rowwise:
+            return self._compute_rowwise(self._as_compute_block(other[start:stop], compute_dtype),
+                                         self._as_compute_block(rows[start:stop], compute_dtype))
+        return self._compute_one_to_many(self._as_compute_block(other, compute_dtype),
+                                         self._as_compute_block(rows[start:stop], compute_dtype))
+    
+    def _compute_pairwise(self, array: np.ndarray, axis: int, condensed: bool = False,
+                          memory_budget: Optional[int] = None,
+                          out: Union[str, Path, np.ndarray, None] = None,
+                          n_jobs: Optional[int] = None, aux: Any = None,
+                          out_dtype: Any = np.float64, compute_dtype: Any = None) -> np.ndarray:
+        """
+        Compute pairwise distances within an array.
+        
+        The rows are processed in square tiles on and above the diagonal, each
+        sized to ``memory_budget``, and written into a square or condensed result.
+        When ``out`` is a path, tiles already recorded by an interrupted run
+        are skipped. ``aux`` is the rows' precomputation, if already known.
+        """
+        if condensed and not self.symmetric:
+            raise InputError(f"{self.name} is not symmetric; condensed output is not available")
+        rows = self._pairwise_rows(array, axis)
+        n = rows.shape[0]
+        block = resolve_block_size(n, rows.shape[1], memory_budget=memory_budget)
+        n_jobs = resolve_n_jobs(n_jobs)
+        
+        if out is None:
+            result, journal = allocate_pairwise(n, condensed, out_dtype), None
+        else:
+            shape = (n * (n - 1) // 2,) if condensed else (n, n)
+            header = {"metric": self.name, "block": block, "condensed": condensed,
+                      "accumulate": None if compute_dtype is None else np.dtype(compute_dtype).str,
+                      "data": data_fingerprint(rows)}
+            result, journal = open_output(out, shape, out_dtype, header=header)
+        
+        tiles = [(tile_id,) + bounds
+                 for tile_id, bounds in enumerate(iter_tiles(n, block, self.symmetric))
+                 if journal is None or tile_id not in journal.done]
+        if aux is None:
+            aux = self._precompute_rows(rows, memory_budget, compute_dtype)
+        try:
+            if n_jobs > 1 and len(tiles) > 1:
+                run_tiles_parallel(self, rows, aux, tiles, result, condensed, n_jobs, journal,
+                                   compute_dtype)
+            else:
+                for tile_id, i0, i1, j0, j1 in tiles:
+                    tile = self._compute_tile(rows, aux, i0, i1, j0, j1, compute_dtype)
+                    write_tile(result, tile, i0, i1, j0, j1, condensed, self.symmetric)
+                    if journal is not None:
+                        journal.mark(tile_id, result)
+        finally:
+            if journal is not None:
+                journal.close()
+        
+        if journal is not None:
+            journal.finish()
+        return result
+    
+    def _compute_cross_pairwise(self, x: np.ndarray, y: np.ndarray, axis: int,
+                                memory_budget: Optional[int] = None,
+                                out: Union[str, Path, np.ndarray, None] = None,
+                                n_jobs: Optional[int] = None, aux: Any = (None, None),
+                                out_dtype: Any = np.float64, compute_dtype: Any = None) -> np.ndarray:
+        """
+        Compute the (M, N) distances between every row of ``x`` and every row of ``y``.
+        
+        Works like ``_compute_pairwise``: the result is filled tile by tile with
+        the cross kernel, tiles are sized to ``memory_budget``, can run in worker
+        processes and, when ``out`` is a path, resume after an interruption.
+        ``aux`` holds the precomputations of x and y, where already known.
+        """
+        x_rows, y_rows = self._cross_rows(x, axis), self._cross_rows(y, axis)
+        m, n = x_rows.shape[0], y_rows.shape[0]
+        block = resolve_block_size(max(m, n), x_rows.shape[1], memory_budget=memory_budget)
+        n_jobs = resolve_n_jobs(n_jobs)
+        
+        if out is None:
+            result, journal = np.empty((m, n), dtype=out_dtype), None
+        else:
+            header = {"metric": self.name, "block": block, "cross": True,
+                      "accumulate": None if compute_dtype is None else np.dtype(compute_dtype).str,
+                      "data": [data_fingerprint(x_rows), data_fingerprint(y_rows)]}
+            result, journal = open_output(out, (m, n), out_dtype, header=header)
+        
+        tiles = [(tile_id, i0, i1, j0, j1)
+                 for tile_id, (i0, i1, j0, j1) in enumerate(
+                     (i0, i1, j0, j1) for i0, i1 in iter_row_blocks(m, block)
+                     for j0, j1 in iter_row_blocks(n, block))
+                 if journal is None or tile_id not in journal.done]
+        x_aux, y_aux = (rows_aux if rows_aux is not None
+                        else self._precompute_rows(rows, memory_budget, compute_dtype)
+                        for rows, rows_aux in zip((x_rows, y_rows), aux))
         try:
-            x_flat = x.flatten()
-            y_flat = y.flatten()
-            min_len = min(len(x_flat), len(y_flat))
-            return self._compute(x_flat[:min_len], y_flat[:min_len])
-        except Exception:
-            raise ValueError(f"Cannot compute distance between arrays of shapes {x.shape} and {y.shape}")
+            if n_jobs > 1 and len(tiles) > 1:
+                run_tiles_parallel(self, x_rows, x_aux, tiles, result, False, n_jobs, journal,
+                                   compute_dtype, columns=y_rows, columns_aux=y_aux)
+            else:
+                for tile_id, i0, i1, j0, j1 in tiles:
+                    result[i0:i1, j0:j1] = self._compute_tile(x_rows, x_aux, i0, i1, j0, j1,
+                                                              compute_dtype, y_rows, y_aux)
+                    if journal is not None:
+                        journal.mark(tile_id, result)
+        finally:
+            if journal is not None:
+                journal.close()
+        
+        if journal is not None:
+            journal.finish()
+        return result
+    
+    @staticmethod
+    def _cross_rows(array: np.ndarray, axis: int) -> np.ndarray:
+        """Return the 2-D array whose rows are one side of a cross computation."""
+        if array.ndim == 1:  # A single point
+            return array.reshape(1, -1)
+        return array if axis == 0 else array.T
+    
+    @staticmethod
+    def _pairwise_rows(array: np.ndarray, axis: int) -> np.ndarray:
+        """Return the 2-D array whose rows are compared in a pairwise computation."""
+        if array.ndim == 1:  # Each value is a one-dimensional point
+            return array.reshape(-1, 1)
+        return array if axis == 0 else array.T  # Between rows / between columns
+    
+    def _precompute_rows(self, rows: np.ndarray, memory_budget: Optional[int] = None,
+                         compute_dtype: Any = None) -> Any:
+        """Run ``_precompute`` over blocks of rows and join the results."""
+        n = rows.shape[0]
+        block = resolve_row_block(n, rows.shape[1], memory_budget=memory_budget)
+        return concat_aux([self._precompute(self._as_compute_block(rows[start:stop],
+                                                                   compute_dtype))
+                           for start, stop in iter_row_blocks(n, block)])
+    
+    def _compute_tile(self, rows: np.ndarray, aux: Any, i0: int, i1: int, j0: int, j1: int,
+                      compute_dtype: Any = None, columns: Optional[np.ndarray] = None,
+                      columns_aux: Any = None) -> np.ndarray:
+        """
+        Compute one tile of a pairwise computation.
+        
+        With ``columns``, the tile compares rows ``i0:i1`` with rows ``j0:j1``
+        of ``columns`` (a cross computation) instead of with its own rows.
+        """
+        if columns is not None:
+            return self._compute_cross(self._as_compute_block(rows[i0:i1], compute_dtype),
+                                       self._as_compute_block(columns[j0:j1], compute_dtype),
+                                       slice_aux(aux, i0, i1), slice_aux(columns_aux, j0, j1))
+        if i0 == j0:
+            return self._compute_self(self._as_compute_block(rows[i0:i1], compute_dtype),
+                                      slice_aux(aux, i0, i1))
+        return self._compute_cross(self._as_compute_block(rows[i0:i1], compute_dtype),
+                                   self._as_compute_block(rows[j0:j1], compute_dtype),
+                                   slice_aux(aux, i0, i1), slice_aux(aux, j0, j1))
+    
+    def iter_point_to_array(self, point: Any, source: Any, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                            dtype: Any = None, point_first: bool = True) -> Iterator[np.ndarray]:
+        """
+        Stream distances from a point to every row of a file, block by block.
+        
+        Only one block of ``chunk_size`` rows is held in memory at a time, so
+        the file can be larger than the available memory.
+        
+        Args:
+            point: The query point (list, array, or single-row file)
+            source: Path of the CSV/text/Excel file to compare against
+            chunk_size: Number of rows to read per block
+            dtype: Floating-point type to compute in
+            point_first: Compute d(point, row) (the default) or, when False,
+                d(row, point); only non-symmetric metrics tell them apart
+        
+        Yields:
+            1-D arrays with the distances of consecutive blocks of rows
+        """
+        point_array = self._as_compute_block(DataParser.parse_single_input(point).reshape(-1), dtype)
+        for block in DataParser.iter_file_blocks(source, chunk_size):
+            if block.shape[1] != point_array.shape[0]:
+                raise DimensionMismatchError(
+                    f"Point has {point_array.shape[0]} dimensions but rows of {source} "
+                    f"have {block.shape[1]}"
+                )
+            block = self._as_compute_block(block, dtype)
+            if point_first or self.symmetric:
+                yield self._compute_one_to_many(point_array, block)
+            else:  # Keep the argument order: the row-wise kernel against the repeated point
+                yield self._compute_rowwise(block, np.broadcast_to(point_array, block.shape))
 
 
 class NumericDistance(BaseDistance):
     """Base class for numeric distance metrics."""
     
     def __init__(self, name: str):
-        super().__init__(name)
\ No newline at end of file
+        super().__init__(name)
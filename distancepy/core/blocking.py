@@ -0,0 +1,158 @@
+"""Tiling helpers for blocked distance computations."""
+
+import math
+import numpy as np
+from typing import Any, Iterator, Optional, Tuple
+from .exceptions import InputError
+
+
+# Default working-set size for a single tile when the caller gives no budget.
+DEFAULT_MEMORY_BUDGET = 64 * 1024 * 1024
+
+
+def _check_budget(memory_budget: Optional[int]) -> int:
+    """Return the memory budget in bytes, falling back to the default."""
+    if memory_budget is None:
+        return DEFAULT_MEMORY_BUDGET
+    if memory_budget <= 0:
+        raise InputError(f"memory_budget must be a positive number of bytes, got {memory_budget}")
+    return int(memory_budget)
+
+
+def resolve_block_size(n_rows: int, n_features: int, itemsize: int = 8,
+                       memory_budget: Optional[int] = None) -> int:
+    """
+    Choose a square tile size for pairwise computations.
+    
+    A tile of ``b`` rows against ``b`` columns needs roughly ``2*b*b`` values for
+    the result and its temporaries plus ``2*b*d`` values of input, so ``b`` is the
+    largest size that keeps this within ``memory_budget`` bytes.
+    """
+    budget = _check_budget(memory_budget) / itemsize
+    d = max(n_features, 1)
+    block = int((-d + math.sqrt(d * d + 2 * budget)) / 2)
+    return max(1, min(block, n_rows))
+
+
+def resolve_row_block(n_rows: int, n_features: int, itemsize: int = 8,
+                      memory_budget: Optional[int] = None) -> int:
+    """Choose how many rows to process at once for row-wise and one-to-many kernels."""
+    budget = _check_budget(memory_budget) / itemsize
+    block = int(budget // (2 * max(n_features, 1) + 1))
+    return max(1, min(block, n_rows))
+
+
+def iter_row_blocks(n_rows: int, block: int) -> Iterator[Tuple[int, int]]:
+    """Yield ``(start, stop)`` bounds covering ``n_rows`` in steps of ``block``."""
+    for start in range(0, n_rows, block):
+        yield start, min(start + block, n_rows)
+
+
+def iter_tiles(n: int, block: int, symmetric: bool = True) -> Iterator[Tuple[int, int, int, int]]:
+    """
+    Yield ``(i0, i1, j0, j1)`` for every tile on or above the diagonal.
+    
+    Non-symmetric metrics need every tile, so ``symmetric=False`` yields all of them.
+    """
+    for i0, i1 in iter_row_blocks(n, block):
+        for j0, j1 in iter_row_blocks(n, block):
+            if j0 >= i0 or not symmetric:
+                yield i0, i1, j0, j1
+
+
+def resolve_dtypes(dtype: Any = None, accumulate: Any = None) -> Tuple[np.dtype, Optional[np.dtype]]:
+    """
+    Return the result dtype and the dtype kernels compute in.
+    
+    ``dtype`` selects the type of inputs and results (float64 by default) and
+    ``accumulate`` the type blocks are converted to before entering a kernel
+    (``dtype`` by default). A compute dtype of None keeps floating inputs in
+    their own type and converts other inputs to float64.
+    """
+    for option, value in (("dtype", dtype), ("accumulate", accumulate)):
+        if value is not None and not np.issubdtype(np.dtype(value), np.floating):
+            raise InputError(f"{option} must be a floating-point type, got {np.dtype(value)}")
+    output = np.dtype(dtype) if dtype is not None else np.dtype(np.float64)
+    if accumulate is not None:
+        return output, np.dtype(accumulate)
+    return output, (np.dtype(dtype) if dtype is not None else None)
+
+
+def as_float(block: np.ndarray, dtype: Optional[np.dtype] = None) -> np.ndarray:
+    """
+    Convert a block to the compute dtype without copying when it already matches.
+    
+    Without a compute dtype, floating blocks are returned unchanged and other
+    blocks are converted to float64.
+    """
+    if dtype is not None:
+        return np.asarray(block, dtype=dtype)
+    if np.issubdtype(block.dtype, np.floating):
+        return block
+    return block.astype(np.float64)
+
+
+def concat_aux(parts: list) -> Any:
+    """Join per-block auxiliary data back into per-row auxiliary data."""
+    if parts[0] is None:
+        return None
+    if isinstance(parts[0], tuple):
+        return tuple(concat_aux([part[k] for part in parts]) for k in range(len(parts[0])))
+    return np.concatenate(parts)
+
+
+def slice_aux(aux: Any, start: int, stop: int) -> Any:
+    """Slice per-row auxiliary data returned by ``BaseDistance._precompute``."""
+    if aux is None:
+        return None
+    if isinstance(aux, tuple):
+        return tuple(slice_aux(item, start, stop) for item in aux)
+    return aux[start:stop]
+
+
+def condensed_size(n: int) -> int:
+    """Number of entries in the condensed upper triangle of an n x n matrix."""
+    return n * (n - 1) // 2
+
+
+def condensed_offset(n: int, i: int) -> int:
+    """Position of entry ``(i, i + 1)`` in the condensed vector."""
+    return n * i - i * (i + 1) // 2
+
+
+def condensed_index(n: int, i: int, j: int) -> int:
+    """Position of entry ``(i, j)`` (``i != j``) in the condensed vector."""
+    if i > j:
+        i, j = j, i
+    return condensed_offset(n, i) + (j - i - 1)
+
+
+def allocate_pairwise(n: int, condensed: bool = False, dtype: Any = np.float64) -> np.ndarray:
+    """Allocate the result of a pairwise computation."""
+    if condensed:
+        return np.zeros(condensed_size(n), dtype=dtype)
+    return np.zeros((n, n), dtype=dtype)
+
+
+def write_tile(result: np.ndarray, tile: np.ndarray, i0: int, i1: int,
+               j0: int, j1: int, condensed: bool = False, symmetric: bool = True) -> None:
+    """
+    Store a tile of a pairwise computation.
+    
+    Square results receive the tile and, for symmetric metrics, its mirror
+    image; condensed results receive only the entries strictly above the
+    diagonal, in the usual row-major condensed layout.
+    """
+    if not condensed:
+        result[i0:i1, j0:j1] = tile
+        if i0 != j0 and symmetric:
+            result[j0:j1, i0:i1] = tile.T
+        return
+    
+    n = int(round((1 + math.sqrt(1 + 8 * result.shape[0])) / 2))
+    for i in range(i0, i1):
+        start = max(j0, i + 1)
+        if start >= j1:
+            continue
+        offset = condensed_offset(n, i) + (start - i - 1)
+        result[offset:offset + (j1 - start)] = tile[i - i0, start - j0:]
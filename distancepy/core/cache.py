@@ -0,0 +1,122 @@
+"""In-process LRU caches of arrays (parsed file inputs, computed rows)."""
+
+import threading
+import numpy as np
+from collections import OrderedDict, namedtuple
+from pathlib import Path
+from typing import Hashable, Iterable, Optional, Tuple
+from .exceptions import InputError
+
+
+# Default upper bound on the memory held by cached arrays.
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions", "entries", "current_bytes", "max_bytes"])
+
+
+class LRUCache:
+    """
+    LRU cache of arrays, bounded by the total number of bytes held.
+    
+    Cached arrays are made read-only because they are shared between callers.
+    """
+    
+    def __init__(self, max_bytes: int = DEFAULT_CACHE_BYTES):
+        self._entries: "OrderedDict[Hashable, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_bytes = self._check_size(max_bytes)
+        self._current_bytes = 0
+        self._hits = self._misses = self._evictions = 0
+    
+    @staticmethod
+    def _check_size(max_bytes: int) -> int:
+        if max_bytes < 0:
+            raise InputError(f"Cache size must be non-negative, got {max_bytes}")
+        return int(max_bytes)
+    
+    def get(self, key: Hashable) -> Optional[np.ndarray]:
+        """Return the cached array for ``key``, or None on a miss."""
+        with self._lock:
+            array = self._entries.get(key)
+            if array is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return array
+    
+    def get_any(self, keys: Iterable[Hashable]) -> Tuple[Optional[Hashable], Optional[np.ndarray]]:
+        """
+        Return the first of ``keys`` that is cached and its array, or (None, None).
+        
+        The lookup counts as a single hit or miss however many keys it tries.
+        """
+        with self._lock:
+            for key in keys:
+                array = self._entries.get(key)
+                if array is not None:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return key, array
+            self._misses += 1
+            return None, None
+    
+    def put(self, key: Hashable, array: np.ndarray) -> np.ndarray:
+        """
+        Store ``array`` under ``key`` and return it as a read-only array.
+        
+        Arrays larger than the whole budget are returned without being cached.
+        """
+        array.setflags(write=False)
+        with self._lock:
+            if array.nbytes > self._max_bytes:
+                return array
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._current_bytes -= previous.nbytes
+            self._entries[key] = array
+            self._current_bytes += array.nbytes
+            self._evict()
+        return array
+    
+    def _evict(self) -> None:
+        while self._current_bytes > self._max_bytes and self._entries:
+            _, array = self._entries.popitem(last=False)
+            self._current_bytes -= array.nbytes
+            self._evictions += 1
+    
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._current_bytes = 0
+            self._hits = self._misses = self._evictions = 0
+    
+    def resize(self, max_bytes: int) -> None:
+        """Change the byte budget, evicting least recently used entries if needed."""
+        with self._lock:
+            self._max_bytes = self._check_size(max_bytes)
+            self._evict()
+    
+    def info(self) -> CacheInfo:
+        """Return hit/miss statistics and the current size of the cache."""
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             len(self._entries), self._current_bytes, self._max_bytes)
+
+
+class ParsedFileCache(LRUCache):
+    """
+    LRU cache of parsed file inputs.
+    
+    Entries are keyed on the resolved path together with the file's size and
+    modification time (see ``key``), so editing a file naturally invalidates
+    its entry.
+    """
+    
+    @staticmethod
+    def key(path: Path) -> Tuple[str, int, int]:
+        """Build the cache key of a file from its resolved path, size and mtime."""
+        path = Path(path).resolve()
+        stat = path.stat()
+        return str(path), stat.st_size, stat.st_mtime_ns
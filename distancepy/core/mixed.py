@@ -0,0 +1,138 @@
+"""Tables with numeric and categorical columns, categorical values coded as integers."""
+
+import numpy as np
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
+from .exceptions import DimensionMismatchError, InputError
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+def is_record(data: Any) -> bool:
+    """Whether a list or array input is a single record (a flat sequence of values)."""
+    return (isinstance(data, (list, tuple, np.ndarray)) and len(data) > 0
+            and all(np.ndim(value) == 0 for value in data))
+
+
+class MixedData:
+    """
+    A table whose categorical columns are stored as integer codes.
+    
+    Each categorical column is encoded once into codes ``0..k-1`` with a
+    per-column dictionary (``categories[c][code]`` is the original value), so
+    comparing two values is an integer comparison. Missing values are NaN in
+    ``numeric`` and -1 in ``codes``. Create instances with
+    ``DataParser.parse_mixed_input``.
+    
+    Args:
+        numeric: (n, p) float array of the numeric columns
+        codes: (n, q) integer array of the categorical columns
+        categories: One array of labels per categorical column
+        numeric_names, categorical_names: Column names, if known
+    """
+    
+    def __init__(self, numeric: np.ndarray, codes: np.ndarray, categories: Sequence[np.ndarray],
+                 numeric_names: Optional[List[Any]] = None,
+                 categorical_names: Optional[List[Any]] = None):
+        self.numeric = np.asarray(numeric, dtype=np.float64).reshape(len(codes), -1)
+        self.codes = np.asarray(codes, dtype=np.int64).reshape(len(self.numeric), -1)
+        self.categories = [np.asarray(labels, dtype=object) for labels in categories]
+        if len(self.categories) != self.codes.shape[1]:
+            raise InputError("MixedData needs one dictionary per categorical column")
+        p, q = self.numeric.shape[1], self.codes.shape[1]
+        if numeric_names is None:
+            numeric_names = range(p)
+        if categorical_names is None:
+            categorical_names = range(p, p + q)
+        self.numeric_names = list(numeric_names)
+        self.categorical_names = list(categorical_names)
+    
+    @classmethod
+    def from_frame(cls, frame: "pd.DataFrame", categorical: Any = None) -> "MixedData":
+        """
+        Encode a DataFrame; non-numeric and boolean columns become categorical.
+        
+        Args:
+            frame: Table to encode
+            categorical: Column names or positions to treat as categorical even
+                though they are numeric (e.g. integer IDs), or True for all columns
+        """
+        import pandas as pd
+        if frame.shape[0] == 0 or frame.shape[1] == 0:
+            raise InputError("Mixed data cannot be empty")
+        forced = set()
+        if categorical is True:
+            forced = set(range(frame.shape[1]))
+        elif categorical is not None:
+            for column in ([categorical] if np.isscalar(categorical) else categorical):
+                if column in frame.columns:
+                    forced.add(frame.columns.get_loc(column))
+                elif isinstance(column, (int, np.integer)) and 0 <= column < frame.shape[1]:
+                    forced.add(int(column))
+                else:
+                    raise InputError(f"Unknown column: {column!r}")
+        
+        numeric, numeric_names, codes, categories, categorical_names = [], [], [], [], []
+        for position, name in enumerate(frame.columns):
+            column = frame.iloc[:, position]
+            is_number = (pd.api.types.is_numeric_dtype(column.dtype)
+                         and not pd.api.types.is_bool_dtype(column.dtype))
+            if is_number and position not in forced:
+                values = column.to_numpy(dtype=np.float64, na_value=np.nan)
+                if np.isinf(values).any():
+                    raise InputError(f"Column {name!r} contains infinite values")
+                numeric.append(values)
+                numeric_names.append(name)
+            else:
+                column_codes, labels = pd.factorize(column)  # Missing values get code -1
+                codes.append(column_codes)
+                categories.append(np.asarray(labels, dtype=object))
+                categorical_names.append(name)
+        
+        n = frame.shape[0]
+        return cls(np.column_stack(numeric) if numeric else np.empty((n, 0)),
+                   np.column_stack(codes) if codes else np.empty((n, 0), dtype=np.int64),
+                   categories, numeric_names, categorical_names)
+    
+    @property
+    def shape(self):
+        return (self.numeric.shape[0], self.numeric.shape[1] + self.codes.shape[1])
+    
+    def __len__(self) -> int:
+        return self.numeric.shape[0]
+    
+    def __repr__(self) -> str:
+        return (f"MixedData(rows={len(self)}, numeric={self.numeric_names}, "
+                f"categorical={self.categorical_names})")
+    
+    def recode(self, other: "MixedData") -> "MixedData":
+        """
+        Express ``other``'s categorical columns in this table's dictionaries.
+        
+        Values that this table has never seen get new codes after the existing
+        ones, so they differ from every value here. The tables must have the
+        same numbers of numeric and categorical columns.
+        """
+        import pandas as pd
+        own = (self.numeric.shape[1], self.codes.shape[1])
+        if (other.numeric.shape[1], other.codes.shape[1]) != own:
+            raise DimensionMismatchError(
+                f"Tables have different columns: {own[0]} numeric and {own[1]} categorical "
+                f"vs {other.numeric.shape[1]} and {other.codes.shape[1]}"
+            )
+        codes = np.empty_like(other.codes)
+        categories = []
+        for c, labels in enumerate(self.categories):
+            mapping = pd.Index(labels).get_indexer(other.categories[c])
+            unseen = mapping < 0
+            mapping[unseen] = len(labels) + np.arange(unseen.sum())
+            codes[:, c] = np.append(mapping, -1)[other.codes[:, c]]  # -1 stays missing
+            categories.append(np.concatenate([labels, other.categories[c][unseen]]))
+        return MixedData(other.numeric, codes, categories, other.numeric_names,
+                         other.categorical_names)
+    
+    def to_array(self) -> np.ndarray:
+        """Numeric columns followed by codes as floats, with NaN for every missing value."""
+        codes = self.codes.astype(np.float64)
+        codes[self.codes < 0] = np.nan
+        return np.hstack([self.numeric, codes])
@@ -0,0 +1,147 @@
+"""Output targets for distance results, including resumable .npy memmaps."""
+
+import hashlib
+import json
+import numpy as np
+from pathlib import Path
+from typing import Any, Optional, Set, Tuple, Union
+from .blocking import iter_row_blocks
+from .exceptions import DimensionMismatchError, InputError
+
+
+def data_fingerprint(array: np.ndarray, block: int = 65536) -> str:
+    """Hash the contents of an array block by block, without copying it whole."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str((array.shape, array.dtype.str)).encode())
+    rows = array.reshape(array.shape[0], -1) if array.ndim > 1 else array.reshape(-1, 1)
+    for start, stop in iter_row_blocks(rows.shape[0], block):
+        digest.update(np.ascontiguousarray(rows[start:stop]).tobytes())
+    return digest.hexdigest()
+
+
+class TileJournal:
+    """
+    Append-only record of the finished tiles of a memmapped result.
+    
+    The journal lives next to the ``.npy`` file as ``<name>.npy.progress``. Its
+    first line describes the computation; every further line is the index of a
+    tile whose values have been flushed to disk. The journal is removed once
+    the result is complete, so a leftover journal always means an interrupted
+    run that can be resumed.
+    """
+    
+    def __init__(self, path: Path, header: dict, done: Optional[Set[int]] = None):
+        self.path = path
+        self.header = header
+        self.done = done if done is not None else set()
+        self._file = None
+    
+    @staticmethod
+    def path_for(out_path: Path) -> Path:
+        return out_path.with_name(out_path.name + ".progress")
+    
+    @classmethod
+    def load(cls, out_path: Path, header: dict) -> Optional["TileJournal"]:
+        """Return the journal of an interrupted run matching ``header``, if any."""
+        path = cls.path_for(out_path)
+        if not path.exists():
+            return None
+        try:
+            lines = path.read_text().splitlines()
+            if not lines or json.loads(lines[0]) != header:
+                return None
+            # A torn final line from a killed process is simply ignored
+            done = {int(line) for line in lines[1:] if line.strip().isdigit()}
+        except (OSError, ValueError):
+            return None
+        return cls(path, header, done)
+    
+    def start(self, resume: bool = False) -> None:
+        """Open the journal for appending, or start a new one with its header."""
+        if resume:
+            self._file = open(self.path, "a")
+        else:
+            self._file = open(self.path, "w")
+            self._file.write(json.dumps(self.header) + "\n")
+            self._file.flush()
+    
+    def mark(self, tile_id: int, result: np.ndarray) -> None:
+        """Record ``tile_id`` as finished after flushing ``result`` to disk."""
+        if isinstance(result, np.memmap):
+            result.flush()
+        self._file.write(f"{tile_id}\n")
+        self._file.flush()
+        self.done.add(tile_id)
+    
+    def finish(self) -> None:
+        """Close and delete the journal of a completed run."""
+        self.close()
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+    
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def open_output(out: Union[str, Path, np.ndarray], shape: Tuple[int, ...],
+                dtype: Any = np.float64, header: Optional[dict] = None
+                ) -> Tuple[np.ndarray, Optional[TileJournal]]:
+    """
+    Prepare the array a result is written into.
+    
+    Args:
+        out: Path of a ``.npy`` file to create (or resume), or an existing array
+        shape: Shape of the result
+        dtype: Data type of the result
+        header: Description of the computation. When given together with a
+            path, a ``TileJournal`` is returned so the run can be resumed.
+    
+    Returns:
+        The output array (a ``np.memmap`` for paths) and the journal, if any
+    """
+    dtype = np.dtype(dtype)
+    if isinstance(out, np.ndarray):
+        if out.shape != tuple(shape):
+            raise DimensionMismatchError(
+                f"Output array must have shape {tuple(shape)}. Got {out.shape}"
+            )
+        if not np.can_cast(dtype, out.dtype, casting="same_kind"):
+            raise InputError(f"Output array of dtype {out.dtype} cannot hold {dtype} results")
+        return out, None
+    
+    if not isinstance(out, (str, Path)):
+        raise InputError(f"Unsupported output type: {type(out)}")
+    
+    path = Path(out)
+    if path.suffix.lower() != ".npy":
+        raise InputError(f"Output file must have a .npy extension. Got {path.suffix}")
+    
+    journal = None
+    if header is not None:
+        header = dict(header, shape=list(shape), dtype=dtype.str)
+        journal = TileJournal.load(path, header)
+        if journal is not None and path.exists():
+            result = np.lib.format.open_memmap(path, mode="r+")
+            if result.shape == tuple(shape) and result.dtype == dtype:
+                journal.start(resume=True)
+                return result, journal
+            del result
+        journal = TileJournal(TileJournal.path_for(path), header)
+    
+    result = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=tuple(shape))
+    if journal is not None:
+        journal.start()
+    return result, journal
+
+
+def store_result(out: Union[str, Path, np.ndarray], result: np.ndarray) -> np.ndarray:
+    """Copy an in-memory result into ``out`` and return the output array."""
+    target, _ = open_output(out, result.shape, result.dtype)
+    target[...] = result
+    if isinstance(target, np.memmap):
+        target.flush()
+    return target
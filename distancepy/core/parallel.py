@@ -0,0 +1,185 @@
+"""Multi-process execution of blocked distance computations over shared memory."""
+
+import os
+import numpy as np
+from concurrent.futures import as_completed
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from .blocking import write_tile
+from .exceptions import InputError
+
+
+def resolve_n_jobs(n_jobs: Optional[int]) -> int:
+    """Translate an ``n_jobs`` option into a number of worker processes."""
+    if n_jobs is None:
+        return 1
+    if not isinstance(n_jobs, (int, np.integer)) or n_jobs == 0:
+        raise InputError(f"n_jobs must be a non-zero integer or None, got {n_jobs!r}")
+    cpus = os.cpu_count() or 1
+    if n_jobs < 0:  # -1 means all CPUs, -2 all but one, ...
+        return max(1, cpus + 1 + int(n_jobs))
+    return int(n_jobs)
+
+
+class _SharedArrays:
+    """Places arrays in shared memory and describes them for worker processes."""
+    
+    def __init__(self):
+        self._blocks: List[shared_memory.SharedMemory] = []
+    
+    def share(self, array: Any) -> Any:
+        """Return a picklable descriptor of ``array`` (or of a tuple of arrays)."""
+        if array is None:
+            return None
+        if isinstance(array, tuple):
+            return tuple(self.share(item) for item in array)
+        array = np.asarray(array)
+        shm = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._blocks.append(shm)
+        shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+        shared[...] = array
+        return ("shm", shm.name, array.shape, array.dtype.str)
+    
+    def empty(self, shape: Tuple[int, ...], dtype: Any) -> Tuple[Any, np.ndarray]:
+        """Allocate a zeroed shared array, returning its descriptor and local view."""
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape)) * dtype.itemsize
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._blocks.append(shm)
+        view = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        view[...] = 0
+        return ("shm", shm.name, tuple(shape), dtype.str), view
+    
+    def release(self) -> None:
+        for shm in self._blocks:
+            shm.close()
+            shm.unlink()
+        self._blocks = []
+
+
+# Per-process state of pool workers, filled in by ``_init_worker``.
+_WORKER: Dict[str, Any] = {}
+
+
+def _attach(descriptor: Any, handles: list) -> Any:
+    if descriptor is None:
+        return None
+    if not isinstance(descriptor[0], str):  # Tuple of descriptors
+        return tuple(_attach(item, handles) for item in descriptor)
+    kind = descriptor[0]
+    if kind == "file":
+        _, filename, offset, shape, dtype = descriptor
+        return np.memmap(filename, dtype=np.dtype(dtype), mode="r+", offset=offset, shape=shape)
+    _, name, shape, dtype = descriptor
+    shm = shared_memory.SharedMemory(name=name)
+    handles.append(shm)
+    return np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def _process_pool(n_jobs: int, metric: Any, descriptors: Dict[str, Any], options: Dict[str, Any]) -> Any:
+    """Start a pool whose workers attach to ``descriptors`` once."""
+    # Imported here so that serial calls never load concurrent.futures.process.
+    from concurrent.futures import ProcessPoolExecutor
+    return ProcessPoolExecutor(max_workers=n_jobs, initializer=_init_worker,
+                               initargs=(metric, descriptors, options))
+
+
+def _init_worker(metric: Any, descriptors: Dict[str, Any], options: Dict[str, Any]) -> None:
+    handles: list = []
+    _WORKER.clear()
+    _WORKER["metric"] = metric
+    _WORKER["handles"] = handles
+    _WORKER.update({key: _attach(value, handles) for key, value in descriptors.items()})
+    _WORKER.update(options)
+
+
+def _run_tiles(tiles: Sequence[Tuple[int, int, int, int, int]]) -> List[int]:
+    metric, rows, aux, result = _WORKER["metric"], _WORKER["rows"], _WORKER["aux"], _WORKER["result"]
+    columns = _WORKER.get("columns")
+    for _, i0, i1, j0, j1 in tiles:
+        tile = metric._compute_tile(rows, aux, i0, i1, j0, j1, _WORKER["compute_dtype"],
+                                    columns, _WORKER.get("columns_aux"))
+        if columns is not None:  # Cross tiles are never mirrored
+            result[i0:i1, j0:j1] = tile
+        else:
+            write_tile(result, tile, i0, i1, j0, j1, _WORKER["condensed"], metric.symmetric)
+    if isinstance(result, np.memmap):
+        result.flush()
+    return [tile[0] for tile in tiles]
+
+
+def _run_row_blocks(blocks: Sequence[Tuple[int, int]]) -> None:
+    metric, rows, other, result = _WORKER["metric"], _WORKER["rows"], _WORKER["other"], _WORKER["result"]
+    for start, stop in blocks:
+        result[start:stop] = metric._compute_row_block(other, rows, start, stop, _WORKER["rowwise"],
+                                                       _WORKER["compute_dtype"])
+
+
+def _chunk(items: list, n_jobs: int) -> List[list]:
+    """Split work into a few tasks per worker so that progress is reported often."""
+    n_tasks = min(len(items), n_jobs * 4)
+    return [items[k::n_tasks] for k in range(n_tasks)]
+
+
+def _output_target(shared: _SharedArrays, result: np.ndarray) -> Tuple[Any, Optional[np.ndarray]]:
+    """
+    Describe where workers write, and return the shared view to copy back, if any.
+    
+    A result memory-mapped from a file is written through the file itself, so
+    workers map it rather than receiving a shared copy.
+    """
+    if isinstance(result, np.memmap) and result.filename is not None and result.flags.c_contiguous:
+        return ("file", result.filename, result.offset, result.shape, result.dtype.str), None
+    return shared.empty(result.shape, result.dtype)
+
+
+def run_tiles_parallel(metric: Any, rows: np.ndarray, aux: Any,
+                       tiles: Sequence[Tuple[int, int, int, int, int]], result: np.ndarray,
+                       condensed: bool, n_jobs: int, journal: Any = None,
+                       compute_dtype: Any = None, columns: Optional[np.ndarray] = None,
+                       columns_aux: Any = None) -> None:
+    """
+    Compute pairwise tiles in a process pool, writing them into ``result``.
+    
+    The input rows, the metric's auxiliary data and the output live in shared
+    memory (or in the output's backing file), so workers write their tiles in
+    place and only tile indices travel between processes. Every tile goes
+    through the same kernel as the serial path, so results are identical.
+    For cross computations, ``columns`` are the rows of the second input.
+    """
+    shared = _SharedArrays()
+    try:
+        descriptors = {"rows": shared.share(rows), "aux": shared.share(aux),
+                       "columns": shared.share(columns), "columns_aux": shared.share(columns_aux)}
+        descriptors["result"], local = _output_target(shared, result)
+        with _process_pool(n_jobs, metric, descriptors, {"condensed": condensed,
+                                                         "compute_dtype": compute_dtype}) as pool:
+            futures = [pool.submit(_run_tiles, task) for task in _chunk(list(tiles), n_jobs)]
+            for future in as_completed(futures):
+                finished = future.result()
+                if journal is not None:
+                    for tile_id in finished:
+                        journal.mark(tile_id, result)
+        if local is not None:
+            result[...] = local
+    finally:
+        shared.release()
+
+
+def run_rows_parallel(metric: Any, other: np.ndarray, rows: np.ndarray,
+                      blocks: Sequence[Tuple[int, int]], result: np.ndarray,
+                      n_jobs: int, rowwise: bool = False, compute_dtype: Any = None) -> None:
+    """
+    Compute one-to-many (``other`` is a point) or row-wise distances in a process pool.
+    """
+    shared = _SharedArrays()
+    try:
+        descriptors = {"rows": shared.share(rows), "other": shared.share(other)}
+        descriptors["result"], local = shared.empty(result.shape, result.dtype)
+        with _process_pool(n_jobs, metric, descriptors, {"rowwise": rowwise,
+                                                         "compute_dtype": compute_dtype}) as pool:
+            for future in [pool.submit(_run_row_blocks, task) for task in _chunk(list(blocks), n_jobs)]:
+                future.result()
+        result[...] = local
+    finally:
+        shared.release()
@@ -1,79 +1,291 @@
 """Input parsing utilities for different data formats."""
 
 import numpy as np
-import pandas as pd
 from pathlib import Path
-from typing import Union, List, Tuple, Any
-from .exceptions import ParsingError, FileFormatError
+from typing import Union, List, Tuple, Any, Iterator, Optional
+from .cache import CacheInfo, ParsedFileCache
+from .exceptions import DimensionMismatchError, InputError, ParsingError, FileFormatError
+from .mixed import MixedData, is_record
+from .prepared import PreparedData
+from .sidecar import SidecarCache
 from .validators import validate_file_path, validate_numeric_array
 
+# pandas (and openpyxl, through pandas.read_excel) is imported by the functions
+# that read files, so that importing the package stays fast for array inputs.
+
+# Number of rows per block when streaming a file.
+DEFAULT_CHUNK_SIZE = 100_000
+
+
+def _is_number(token: str) -> bool:
+    try:
+        float(token)
+        return True
+    except ValueError:
+        return False
+
+
+class BinarySource:
+    """
+    A binary array file whose contents need more than a path to be read.
+    
+    Args:
+        path: Path of a raw binary file or of an ``.npz`` archive
+        shape: Shape of a raw array. The first entry may be -1 to infer the
+            number of rows from the file size.
+        dtype: Data type of a raw array (little-endian float64 by default)
+        offset: Number of header bytes to skip in a raw file
+        key: Name of the array to select from an ``.npz`` archive
+    """
+    
+    def __init__(self, path: Union[str, Path], shape: Optional[Tuple[int, ...]] = None,
+                 dtype: Any = "<f8", offset: int = 0, key: Optional[str] = None):
+        self.path = Path(path)
+        self.shape = tuple(shape) if shape is not None else None
+        self.dtype = np.dtype(dtype)
+        self.offset = int(offset)
+        self.key = key
+    
+    def __repr__(self) -> str:
+        if self.key is not None:
+            return f"BinarySource({str(self.path)!r}, key={self.key!r})"
+        return f"BinarySource({str(self.path)!r}, shape={self.shape}, dtype={self.dtype.str!r})"
+
 
 class DataParser:
     """Handles parsing of various input formats into numpy arrays."""
     
+    # Parsed files, shared by every call in the process
+    _file_cache = ParsedFileCache()
+    # Optional on-disk cache shared between processes (see enable_sidecar_cache)
+    _sidecar_cache: Optional[SidecarCache] = None
+    
     @staticmethod
-    def parse_single_input(data: Any) -> np.ndarray:
-        """Parse a single input into a numpy array."""
-        if isinstance(data, (str, Path)):
-            return DataParser._parse_file(data)
+    def parse_single_input(data: Any, dtype: Any = None) -> np.ndarray:
+        """
+        Parse a single input into a numpy array.
+        
+        Args:
+            data: Input (number, list, array, file path, BinarySource or PreparedData)
+            dtype: Floating-point type to convert the result to. Prepared and
+                memory-mapped inputs are returned as they are.
+        """
+        if isinstance(data, PreparedData):
+            return data.array  # Validated when it was prepared
+        elif isinstance(data, (str, Path)):
+            return DataParser._convert(DataParser._parse_file(data), dtype)
+        elif isinstance(data, BinarySource):
+            return DataParser._convert(DataParser._parse_binary(data), dtype)
         elif isinstance(data, (list, tuple)):
-            return validate_numeric_array(np.array(data))
+            return validate_numeric_array(np.array(data), dtype=dtype)
         elif isinstance(data, np.ndarray):
-            return validate_numeric_array(data)
+            return validate_numeric_array(data, dtype=dtype)
         elif isinstance(data, (int, float)):
-            return validate_numeric_array(np.array([data]))
+            return validate_numeric_array(np.array([data]), dtype=dtype)
         else:
             raise ParsingError(f"Unsupported input type: {type(data)}")
     
+    @staticmethod
+    def parse_mixed_input(data: Any, categorical: Any = None,
+                          header: Optional[bool] = None) -> MixedData:
+        """
+        Parse a table whose columns may hold strings, keeping those columns.
+        
+        Unlike ``parse_single_input``, which drops non-numeric columns, string
+        (and boolean) columns are encoded once into integer codes with a
+        dictionary per column, see ``MixedData``.
+        
+        Args:
+            data: Table (file path, pandas DataFrame, list of rows, or array),
+                a single record (flat list), or MixedData (returned as is)
+            categorical: Columns to encode even though they are numeric, by
+                name or position, or True for all columns
+            header: Whether a CSV/text file starts with a header line. Sniffed
+                from the first lines by default.
+        
+        Returns:
+            MixedData with one row per record
+        
+        Examples:
+            >>> table = DataParser.parse_mixed_input("mixed_data.csv")
+            >>> table.categorical_names
+            ['name', 'category']
+        """
+        if isinstance(data, MixedData):
+            return data
+        import pandas as pd
+        if isinstance(data, (str, Path)):
+            path = validate_file_path(data)
+            try:
+                if path.suffix.lower() in ['.xlsx', '.xls']:
+                    frame = pd.read_excel(path)
+                elif path.suffix.lower() in ['.npy', '.npz']:
+                    frame = pd.DataFrame(DataParser._parse_file(path))
+                else:
+                    delimiter, has_header = DataParser._sniff(path)
+                    has_header = has_header if header is None else header
+                    frame = pd.read_csv(path, sep=r"\s+" if delimiter is None else delimiter,
+                                        header=0 if has_header else None)
+            except (ParsingError, InputError):
+                raise
+            except Exception as e:
+                raise ParsingError(f"Failed to parse {path.name}: {str(e)}")
+        elif isinstance(data, pd.DataFrame):
+            frame = data
+        elif isinstance(data, (list, tuple, np.ndarray)):
+            frame = pd.DataFrame([data] if is_record(data) else list(data)).infer_objects()
+        else:
+            raise ParsingError(f"Unsupported input type: {type(data)}")
+        return MixedData.from_frame(frame, categorical)
+    
+    @staticmethod
+    def _convert(array: np.ndarray, dtype: Any) -> np.ndarray:
+        """Convert an already validated (possibly cached) array to ``dtype``."""
+        if dtype is None or array.dtype == dtype or isinstance(array, np.memmap):
+            return array
+        return array.astype(dtype)
+    
     @staticmethod
     def _parse_file(file_path: Union[str, Path]) -> np.ndarray:
-        """Parse file into numpy array."""
+        """
+        Parse and validate a file into a numpy array.
+        
+        Results are cached per resolved path, size and modification time (see
+        ``cache_info``), and the returned array is read-only. When the sidecar
+        cache is enabled, parsed text and Excel files are also saved as ``.npy``
+        files and memory-mapped by later calls in any process.
+        """
         path = validate_file_path(file_path)
+        if path.suffix.lower() == '.npy':
+            return DataParser._parse_npy(path)
+        if path.suffix.lower() == '.npz':
+            return DataParser._parse_binary(BinarySource(path))
+        
+        key = ParsedFileCache.key(path)
+        cached = DataParser._file_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        sidecar = DataParser._sidecar_cache
+        if sidecar is not None:
+            stored = sidecar.load(path)
+            if stored is not None:
+                return DataParser._file_cache.put(key, stored)
         
         try:
             if path.suffix.lower() == '.csv':
-                return DataParser._parse_csv(path)
+                array = DataParser._parse_csv(path)
             elif path.suffix.lower() in ['.xlsx', '.xls']:
-                return DataParser._parse_excel(path)
+                array = DataParser._parse_excel(path)
             elif path.suffix.lower() == '.txt':
-                return DataParser._parse_txt(path)
+                array = DataParser._parse_txt(path)
         except Exception as e:
             raise FileFormatError(f"Failed to parse file {path}: {str(e)}")
+        
+        array = validate_numeric_array(array, name=str(path))
+        if sidecar is not None:
+            sidecar.store(path, array)
+        return DataParser._file_cache.put(key, array)
+    
+    @staticmethod
+    def _parse_npy(path: Path) -> np.ndarray:
+        """Memory-map a ``.npy`` file read-only; the data is never copied."""
+        try:
+            array = np.load(path, mmap_mode='r')
+        except Exception as e:
+            raise FileFormatError(f"Failed to parse file {path}: {str(e)}")
+        return validate_numeric_array(array, name=str(path))
+    
+    @staticmethod
+    def _parse_binary(source: BinarySource) -> np.ndarray:
+        """Read an array from an ``.npz`` archive or memory-map a raw binary file."""
+        path = validate_file_path(source.path, check_extension=False)
+        
+        if path.suffix.lower() == '.npz':
+            key = (ParsedFileCache.key(path), source.key)
+            cached = DataParser._file_cache.get(key)
+            if cached is not None:
+                return cached
+            try:
+                with np.load(path) as archive:
+                    names = archive.files
+                    if source.key is None and len(names) != 1:
+                        raise ParsingError(
+                            f"Archive contains {len(names)} arrays; select one of {names} with key="
+                        )
+                    name = names[0] if source.key is None else source.key
+                    if name not in names:
+                        raise ParsingError(f"Array {name!r} not found in archive; available: {names}")
+                    array = archive[name]
+            except ParsingError:
+                raise
+            except Exception as e:
+                raise FileFormatError(f"Failed to parse file {path}: {str(e)}")
+            array = validate_numeric_array(array, name=f"{path}[{name}]")
+            return DataParser._file_cache.put(key, array)
+        
+        if source.shape is None:
+            raise InputError(f"Reading raw binary file {path} requires an explicit shape")
+        shape = list(source.shape)
+        available = path.stat().st_size - source.offset
+        row_bytes = int(np.prod(shape[1:], dtype=np.int64)) * source.dtype.itemsize
+        if shape and shape[0] == -1:
+            if row_bytes == 0 or available % row_bytes:
+                raise FileFormatError(
+                    f"Size of {path} is not a multiple of the row size ({row_bytes} bytes)"
+                )
+            shape[0] = available // row_bytes
+        if shape[0] * row_bytes > available:
+            raise FileFormatError(
+                f"File {path} holds {available} bytes, too few for shape {tuple(shape)} "
+                f"of {source.dtype}"
+            )
+        array = np.memmap(path, dtype=source.dtype, mode='r', offset=source.offset, shape=tuple(shape))
+        return validate_numeric_array(array, name=str(path))
+    
+    @staticmethod
+    def cache_info() -> CacheInfo:
+        """Return hit/miss statistics and the memory used by the parsed-file cache."""
+        return DataParser._file_cache.info()
+    
+    @staticmethod
+    def clear_cache() -> None:
+        """Drop every parsed file from the cache."""
+        DataParser._file_cache.clear()
+    
+    @staticmethod
+    def set_cache_size(max_bytes: int) -> None:
+        """Set the byte budget of the parsed-file cache (0 disables caching)."""
+        DataParser._file_cache.resize(max_bytes)
+    
+    @staticmethod
+    def enable_sidecar_cache(directory: Union[str, Path, None] = None) -> SidecarCache:
+        """
+        Save parsed CSV, text and Excel files as ``.npy`` sidecars in ``directory``.
+        
+        Defaults to ``~/.cache/distancepy``. Returns the cache, whose ``clear``
+        and ``invalidate`` methods manage the stored files.
+        """
+        DataParser._sidecar_cache = SidecarCache(directory)
+        return DataParser._sidecar_cache
+    
+    @staticmethod
+    def disable_sidecar_cache() -> None:
+        """Stop reading and writing sidecars; existing files are left in place."""
+        DataParser._sidecar_cache = None
     
     @staticmethod
     def _parse_csv(path: Path) -> np.ndarray:
         """Parse CSV file."""
         try:
-            # Try reading without header first
-            df = pd.read_csv(path, header=None)
-            # Check if first row contains non-numeric data (likely header)
-            if df.iloc[0].dtype == 'object' or not pd.api.types.is_numeric_dtype(df.iloc[0]):
-                try:
-                    # Try reading first row as strings
-                    first_row = pd.read_csv(path, nrows=1).iloc[0]
-                    if first_row.dtype == 'object':
-                        # Likely header, skip it
-                        df = pd.read_csv(path, header=0)
-                except:
-                    pass
-            
-            # Convert to numeric, coerce errors to NaN
-            df = df.apply(pd.to_numeric, errors='coerce')
-            
-            # Drop rows/columns that are all NaN
-            df = df.dropna(how='all').dropna(axis=1, how='all')
-            
-            if df.empty:
-                raise ParsingError("No numeric data found in CSV file")
-            
-            return df.values
-            
+            return DataParser._parse_delimited(path)
         except Exception as e:
             raise ParsingError(f"Failed to parse CSV: {str(e)}")
     
     @staticmethod
     def _parse_excel(path: Path) -> np.ndarray:
         """Parse Excel file."""
+        import pandas as pd
         try:
             df = pd.read_excel(path)
             
@@ -93,44 +305,172 @@ class DataParser:
     
     @staticmethod
     def _parse_txt(path: Path) -> np.ndarray:
-        """Parse text file (assuming space/tab delimited)."""
+        """Parse text file (space/tab or otherwise delimited)."""
         try:
-            # Try different delimiters
-            for delimiter in [None, '\t', ' ', ',']:
-                try:
-                    df = pd.read_csv(path, delimiter=delimiter, header=None)
-                    df = df.apply(pd.to_numeric, errors='coerce')
-                    df = df.dropna(how='all').dropna(axis=1, how='all')
-                    
-                    if not df.empty:
-                        return df.values
-                except:
-                    continue
-            
-            raise ParsingError("Could not parse text file with any delimiter")
-            
+            return DataParser._parse_delimited(path)
         except Exception as e:
             raise ParsingError(f"Failed to parse text file: {str(e)}")
+    
+    @staticmethod
+    def _sniff(path: Path, n_lines: int = 5) -> Tuple[Optional[str], bool]:
+        """
+        Guess the delimiter and whether there is a header from the first lines.
+        
+        The delimiter is the first candidate that splits every sampled line into
+        the same number (more than one) of fields; otherwise fields are assumed
+        to be separated by whitespace. The first line is a header when it has a
+        non-numeric token in a column whose other sampled values are numeric,
+        or, for a single-line file, any non-numeric token.
+        
+        Returns:
+            delimiter (None for whitespace), has_header
+        """
+        lines = []
+        with open(path, "r", newline="") as f:
+            for line in f:
+                if line.strip():
+                    lines.append(line.strip())
+                    if len(lines) == n_lines:
+                        break
+        if not lines:
+            raise ParsingError(f"File is empty: {path}")
+        
+        delimiter = None
+        for candidate in [",", "\t", ";", "|"]:
+            counts = {line.count(candidate) for line in lines}
+            if len(counts) == 1 and counts.pop() > 0:
+                delimiter = candidate
+                break
+        
+        rows = [[token.strip() for token in line.split(delimiter)] for line in lines]
+        header, body = rows[0], rows[1:]
+        if not body:
+            return delimiter, any(token and not _is_number(token) for token in header)
+        has_header = any(
+            token and not _is_number(token)
+            and all(col < len(row) and _is_number(row[col]) for row in body)
+            for col, token in enumerate(header)
+        )
+        return delimiter, has_header
+    
+    @staticmethod
+    def _parse_delimited(path: Path) -> np.ndarray:
+        """
+        Read a delimited text file in a single pass.
+        
+        The delimiter and header are sniffed from the first lines, then the file
+        is read once. When every column is already numeric the frame is copied
+        straight into a float array; otherwise non-numeric values are coerced to
+        NaN and all-NaN rows and columns are dropped.
+        """
+        import pandas as pd
+        delimiter, has_header = DataParser._sniff(path)
+        sep = r"\s+" if delimiter is None else delimiter
+        df = pd.read_csv(path, sep=sep, header=0 if has_header else None)
+        
+        if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in df.dtypes):
+            df = df.apply(pd.to_numeric, errors='coerce')
+        array = df.to_numpy(dtype=float)
+        
+        if np.isnan(array).any():
+            missing = np.isnan(array)
+            array = array[~missing.all(axis=1)][:, ~missing.all(axis=0)]
+        
+        if array.size == 0:
+            raise ParsingError("No numeric data found in file")
+        
+        return array
+    
+    @staticmethod
+    def iter_file_blocks(file_path: Union[str, Path],
+                         chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[np.ndarray]:
+        """
+        Parse a file as a sequence of row blocks of at most ``chunk_size`` rows.
+        
+        CSV and text files are read incrementally, so memory use is bounded by
+        the block size rather than the file size. The header is detected from
+        the first line, the numeric columns are fixed by the first block, and
+        every block is validated on its own. ``.npy`` files are memory-mapped
+        and sliced; Excel and ``.npz`` files cannot be read incrementally and
+        are parsed whole before being split into blocks.
+        
+        Yields:
+            2-D numpy arrays with the same number of columns
+        """
+        if chunk_size <= 0:
+            raise InputError(f"chunk_size must be positive, got {chunk_size}")
+        path = validate_file_path(file_path)
+        
+        if path.suffix.lower() in ['.xlsx', '.xls', '.npy', '.npz']:
+            array = DataParser._parse_file(path)
+            array = array.reshape(-1, 1) if array.ndim == 1 else array
+            for start in range(0, array.shape[0], chunk_size):
+                yield array[start:start + chunk_size]
+            return
+        
+        import pandas as pd
+        delimiter, has_header = DataParser._sniff(path)
+        sep = r"\s+" if delimiter is None else delimiter
+        try:
+            reader = pd.read_csv(path, sep=sep, header=0 if has_header else None,
+                                 chunksize=chunk_size)
+        except Exception as e:
+            raise FileFormatError(f"Failed to parse file {path}: {str(e)}")
+        
+        columns = None
+        for index, chunk in enumerate(reader):
+            chunk = chunk.apply(pd.to_numeric, errors='coerce')
+            if columns is None:
+                # Columns without any numeric value in the first block are dropped
+                columns = chunk.columns[chunk.notna().any()]
+                if len(columns) == 0:
+                    raise ParsingError(f"No numeric data found in {path}")
+            block = chunk[columns].dropna(how='all')
+            if block.empty:
+                continue
+            yield validate_numeric_array(block.to_numpy(dtype=float),
+                                         name=f"block {index} of {path.name}")
 
 
 class DistanceInputParser:
     """Handles parsing of inputs specifically for distance calculations."""
     
     @staticmethod
-    def parse_distance_inputs(x: Any, y: Any = None, axis: int = 0) -> Tuple[np.ndarray, np.ndarray, str]:
+    def parse_distance_inputs(x: Any, y: Any = None, axis: int = 0, dtype: Any = None,
+                              pairwise: bool = False) -> Tuple[np.ndarray, np.ndarray, str]:
         """
         Parse inputs for distance calculation.
         
+        With ``pairwise=True`` and two inputs, every point of x is compared with
+        every point of y ("cross"); a 1-D input is then a single point.
+        
         Returns:
             x_array, y_array, calculation_type
+        
+        Raises:
+            DimensionMismatchError: If the shapes do not fit any calculation type
         """
-        x_array = DataParser.parse_single_input(x)
+        x_array = DataParser.parse_single_input(x, dtype)
         
         if y is None:
             # Pairwise distances within x
             return x_array, x_array, "pairwise"
         
-        y_array = DataParser.parse_single_input(y)
+        y_array = DataParser.parse_single_input(y, dtype)
+        
+        if pairwise:
+            if x_array.ndim > 2 or y_array.ndim > 2:
+                raise DimensionMismatchError(
+                    f"Cross distances need 1-D or 2-D inputs. Got shapes {x_array.shape} "
+                    f"and {y_array.shape}"
+                )
+            x_size = x_array.shape[0] if x_array.ndim == 1 else x_array.shape[1 - axis]
+            y_size = y_array.shape[0] if y_array.ndim == 1 else y_array.shape[1 - axis]
+            if x_size != y_size:
+                raise DimensionMismatchError(
+                    f"Points of x have {x_size} dimensions and points of y have {y_size}"
+                )
+            return x_array, y_array, "cross"
         
         # Determine calculation type
         if x_array.shape == y_array.shape:
@@ -139,9 +479,22 @@ class DistanceInputParser:
             else:
                 return x_array, y_array, "array_to_array"
         elif x_array.ndim == 1 and y_array.ndim == 2:
+            DistanceInputParser._check_point(x_array, y_array, axis)
             return x_array, y_array, "point_to_array"
         elif x_array.ndim == 2 and y_array.ndim == 1:
-            return y_array, x_array, "point_to_array"  # Swap for consistency
+            DistanceInputParser._check_point(y_array, x_array, axis)
+            return x_array, y_array, "array_to_point"
         else:
-            # Try to broadcast or handle different shapes
-            return x_array, y_array, "mixed"
\ No newline at end of file
+            hint = " (use pairwise=True for all pairs)" if x_array.ndim == y_array.ndim == 2 else ""
+            raise DimensionMismatchError(
+                f"Cannot compare inputs of shapes {x_array.shape} and {y_array.shape}{hint}"
+            )
+    
+    @staticmethod
+    def _check_point(point: np.ndarray, array: np.ndarray, axis: int) -> None:
+        """Check that a point has as many dimensions as the rows (axis=0) or columns of ``array``."""
+        features = array.shape[1 - axis]
+        if point.shape[0] != features:
+            raise DimensionMismatchError(
+                f"Point has {point.shape[0]} dimensions but the points of the array have {features}"
+            )
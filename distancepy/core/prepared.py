@@ -0,0 +1,100 @@
+"""Inputs that are validated once and reused across distance calls."""
+
+import numpy as np
+from typing import Any, Dict, Hashable
+from .exceptions import InputError
+
+
+class PreparedData:
+    """
+    A validated, read-only, C-contiguous array plus per-metric precomputations.
+    
+    Passing a ``PreparedData`` to any metric skips parsing, validation and dtype
+    conversion, and metric-specific data such as the row squared norms used by
+    Euclidean distance is computed on first use and then reused by every later
+    call. Create instances with ``prepare``.
+    """
+    
+    def __init__(self, array: np.ndarray):
+        self._array = array
+        self._aux: Dict[Hashable, Any] = {}
+    
+    @property
+    def array(self) -> np.ndarray:
+        return self._array
+    
+    @property
+    def shape(self):
+        return self._array.shape
+    
+    @property
+    def ndim(self) -> int:
+        return self._array.ndim
+    
+    @property
+    def dtype(self) -> np.dtype:
+        return self._array.dtype
+    
+    def __len__(self) -> int:
+        return len(self._array)
+    
+    def __array__(self, dtype=None, copy=None):
+        return self._array if dtype is None else self._array.astype(dtype)
+    
+    def __repr__(self) -> str:
+        return f"PreparedData(shape={self.shape}, dtype={self.dtype}, cached={list(self._aux)})"
+    
+    def aux(self, metric: Any, dtype: Any = None) -> Any:
+        """
+        Return ``metric``'s per-row precomputation for this data, computing it once.
+        
+        ``dtype`` is the compute dtype of the calling computation, if any.
+        """
+        key = (metric._aux_key(), None if dtype is None else np.dtype(dtype).str)
+        if key not in self._aux:
+            rows = self._array.reshape(-1, 1) if self._array.ndim == 1 else self._array
+            self._aux[key] = metric._precompute_rows(rows, compute_dtype=dtype)
+        return self._aux[key]
+
+
+def prepare(data: Any, dtype: Any = None, metric: Any = None) -> PreparedData:
+    """
+    Parse and validate an input once so that it can be reused cheaply.
+    
+    Args:
+        data: Input to prepare (list, array, or file path)
+        dtype: Floating-point type to store the data in. Defaults to the input's
+            own floating type, or float64 for integer inputs.
+        metric: Metric instance (or list of instances) whose precomputations
+            should be done now rather than on first use
+    
+    Returns:
+        PreparedData accepted by every metric in place of the raw input
+    
+    Examples:
+        >>> reference = prepare("reference.csv")
+        >>> euclidean_distance([0, 0], reference)
+    """
+    from .parsers import DataParser
+    
+    if isinstance(data, PreparedData):
+        array = data.array
+    else:
+        array = DataParser.parse_single_input(data)
+    
+    if dtype is None:
+        dtype = array.dtype if np.issubdtype(array.dtype, np.floating) else np.float64
+    elif not np.issubdtype(np.dtype(dtype), np.floating):
+        raise InputError(f"dtype must be a floating-point type, got {np.dtype(dtype)}")
+    
+    converted = np.ascontiguousarray(array, dtype=dtype)
+    if converted.flags.writeable:
+        if isinstance(data, np.ndarray) and np.may_share_memory(converted, data):
+            converted = converted.copy()  # Do not freeze the caller's own array
+        converted.setflags(write=False)
+    
+    prepared = PreparedData(converted)
+    metrics = metric if isinstance(metric, (list, tuple)) else ([metric] if metric is not None else [])
+    for item in metrics:
+        prepared.aux(item)
+    return prepared
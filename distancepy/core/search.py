@@ -0,0 +1,146 @@
+"""Blocked neighbour searches built on the batched metric kernels."""
+
+import numpy as np
+from collections import namedtuple
+from typing import Any, Optional, Tuple
+from .blocking import iter_row_blocks, resolve_block_size, slice_aux
+from .exceptions import DimensionMismatchError, InputError
+
+
+# Sparse neighbour lists in CSR layout: the neighbours of query i are
+# indices[indptr[i]:indptr[i + 1]], at distances[indptr[i]:indptr[i + 1]].
+RadiusNeighbors = namedtuple("RadiusNeighbors", ["indptr", "indices", "distances"])
+
+
+def check_search_inputs(queries: np.ndarray, data: np.ndarray) -> None:
+    """Check that queries and data are 2-D arrays of points with the same dimension."""
+    if queries.ndim != 2 or data.ndim != 2:
+        raise DimensionMismatchError(
+            f"Queries and data must be 2-D arrays of points. Got {queries.shape} and {data.shape}"
+        )
+    if queries.shape[1] != data.shape[1]:
+        raise DimensionMismatchError(
+            f"Queries have {queries.shape[1]} dimensions but data has {data.shape[1]}"
+        )
+
+
+def knn_search(metric: Any, queries: np.ndarray, data: np.ndarray, k: int,
+               exclude_self: bool = False, memory_budget: Optional[int] = None,
+               compute_dtype: Any = None, query_aux: Any = None,
+               data_aux: Any = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the ``k`` nearest rows of ``data`` for every row of ``queries``.
+    
+    Queries and data are processed in tiles sized to ``memory_budget``; each
+    query keeps a running top-k that is merged with every tile through
+    ``np.argpartition``, so the full distance matrix is never materialized.
+    
+    Args:
+        metric: Metric instance providing ``_compute_cross``
+        queries: (m, d) array of query points
+        data: (n, d) array of reference points
+        k: Number of neighbours per query
+        exclude_self: Skip ``data[i]`` as a neighbour of ``queries[i]``, for
+            searches of a dataset against itself
+        memory_budget: Approximate working-set size in bytes per tile
+        compute_dtype: Floating-point type to compute in
+        query_aux, data_aux: Per-row precomputations, if already known
+    
+    Returns:
+        indices, distances: (m, k) arrays sorted by increasing distance
+    """
+    check_search_inputs(queries, data)
+    m, n = queries.shape[0], data.shape[0]
+    available = n - 1 if exclude_self else n
+    if not 1 <= k <= available:
+        raise InputError(f"k must be between 1 and {available}, got {k}")
+    
+    if query_aux is None:
+        query_aux = metric._precompute_rows(queries, memory_budget, compute_dtype)
+    if data_aux is None:
+        data_aux = metric._precompute_rows(data, memory_budget, compute_dtype)
+    block = resolve_block_size(max(m, n), data.shape[1], memory_budget=memory_budget)
+    
+    indices = np.empty((m, k), dtype=np.intp)
+    distances = np.empty((m, k))
+    for q0, q1 in iter_row_blocks(m, block):
+        query_block = metric._as_compute_block(queries[q0:q1], compute_dtype)
+        best_d = np.full((q1 - q0, 0), np.inf)
+        best_i = np.empty((q1 - q0, 0), dtype=np.intp)
+        for d0, d1 in iter_row_blocks(n, block):
+            data_block = metric._as_compute_block(data[d0:d1], compute_dtype)
+            tile = metric._compute_cross(query_block, data_block,
+                                         slice_aux(query_aux, q0, q1), slice_aux(data_aux, d0, d1))
+            tile = np.asarray(tile, dtype=np.float64)
+            if exclude_self and d0 < q1 and q0 < d1:
+                rows = np.arange(max(q0, d0), min(q1, d1))
+                tile[rows - q0, rows - d0] = np.inf
+            
+            cand_d = np.concatenate([best_d, tile], axis=1)
+            cand_i = np.concatenate([best_i, np.broadcast_to(np.arange(d0, d1), tile.shape)], axis=1)
+            if cand_d.shape[1] > k:
+                keep = np.argpartition(cand_d, k - 1, axis=1)[:, :k]
+                cand_d = np.take_along_axis(cand_d, keep, axis=1)
+                cand_i = np.take_along_axis(cand_i, keep, axis=1)
+            best_d, best_i = cand_d, cand_i
+        
+        order = np.argsort(best_d, axis=1, kind="stable")
+        distances[q0:q1] = np.take_along_axis(best_d, order, axis=1)
+        indices[q0:q1] = np.take_along_axis(best_i, order, axis=1)
+    return indices, distances
+
+
+def radius_search(metric: Any, queries: np.ndarray, data: np.ndarray, r: float,
+                  exclude_self: bool = False, memory_budget: Optional[int] = None,
+                  compute_dtype: Any = None, query_aux: Any = None,
+                  data_aux: Any = None) -> RadiusNeighbors:
+    """
+    Find every row of ``data`` within distance ``r`` of each row of ``queries``.
+    
+    Tiles of the distance matrix are computed one at a time and only their
+    matches are kept, so memory grows with the number of matches rather than
+    with the size of the matrix.
+    
+    Returns:
+        RadiusNeighbors with the matches of each query in increasing index order
+    """
+    check_search_inputs(queries, data)
+    if r < 0:
+        raise InputError(f"r must be non-negative, got {r}")
+    m, n = queries.shape[0], data.shape[0]
+    
+    if query_aux is None:
+        query_aux = metric._precompute_rows(queries, memory_budget, compute_dtype)
+    if data_aux is None:
+        data_aux = metric._precompute_rows(data, memory_budget, compute_dtype)
+    block = resolve_block_size(max(m, n), data.shape[1], memory_budget=memory_budget)
+    
+    counts = np.zeros(m, dtype=np.intp)
+    indices, distances = [], []
+    for q0, q1 in iter_row_blocks(m, block):
+        query_block = metric._as_compute_block(queries[q0:q1], compute_dtype)
+        rows, cols, dists = [], [], []
+        for d0, d1 in iter_row_blocks(n, block):
+            data_block = metric._as_compute_block(data[d0:d1], compute_dtype)
+            tile = metric._compute_cross(query_block, data_block,
+                                         slice_aux(query_aux, q0, q1), slice_aux(data_aux, d0, d1))
+            mask = tile <= r
+            if exclude_self and d0 < q1 and q0 < d1:
+                diagonal = np.arange(max(q0, d0), min(q1, d1))
+                mask[diagonal - q0, diagonal - d0] = False
+            row, col = np.nonzero(mask)
+            rows.append(row)
+            cols.append(col + d0)
+            dists.append(tile[row, col])
+        
+        rows = np.concatenate(rows)
+        order = np.argsort(rows, kind="stable")  # Columns stay increasing within a row
+        counts[q0:q1] = np.bincount(rows, minlength=q1 - q0)
+        indices.append(np.concatenate(cols)[order])
+        distances.append(np.concatenate(dists)[order])
+    
+    indptr = np.zeros(m + 1, dtype=np.intp)
+    np.cumsum(counts, out=indptr[1:])
+    return RadiusNeighbors(indptr,
+                           np.concatenate(indices) if indices else np.empty(0, dtype=np.intp),
+                           np.concatenate(distances) if distances else np.empty(0))
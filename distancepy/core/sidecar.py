@@ -0,0 +1,107 @@
+"""Persistent .npy sidecar cache for parsed CSV, text and Excel files."""
+
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+
+# Used when the sidecar cache is enabled without an explicit directory.
+DEFAULT_SIDECAR_DIR = Path.home() / ".cache" / "distancepy"
+
+
+def file_hash(path: Path, block: int = 1 << 20) -> str:
+    """Hash the contents of a file."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(block), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SidecarCache:
+    """
+    Directory of parsed arrays saved as ``.npy`` files, shared across processes.
+    
+    Each source file maps to ``<digest>.npy`` plus a ``<digest>.json`` record of
+    the source's size, modification time and content hash. A sidecar is used
+    while the size and mtime match; if only the mtime changed the content hash
+    decides, so touching or copying a file does not force a re-parse. Stale
+    sidecars are deleted when found.
+    """
+    
+    def __init__(self, directory: Union[str, Path, None] = None):
+        self.directory = Path(directory) if directory is not None else DEFAULT_SIDECAR_DIR
+        self.directory.mkdir(parents=True, exist_ok=True)
+    
+    def _entry_paths(self, source: Path) -> Tuple[Path, Path]:
+        digest = hashlib.blake2b(str(source).encode(), digest_size=16).hexdigest()
+        return self.directory / f"{digest}.npy", self.directory / f"{digest}.json"
+    
+    def load(self, path: Union[str, Path]) -> Optional[np.ndarray]:
+        """Memory-map the sidecar of ``path`` if it is still valid, else return None."""
+        source = Path(path).resolve()
+        array_path, meta_path = self._entry_paths(source)
+        try:
+            meta = json.loads(meta_path.read_text())
+            stat = source.stat()
+        except (OSError, ValueError):
+            return None
+        
+        if meta.get("source") != str(source) or meta.get("size") != stat.st_size:
+            self.invalidate(source)
+            return None
+        if meta.get("mtime_ns") != stat.st_mtime_ns:
+            if meta.get("hash") != file_hash(source):
+                self.invalidate(source)
+                return None
+            meta["mtime_ns"] = stat.st_mtime_ns
+            self._write_atomic(meta_path, json.dumps(meta).encode())
+        
+        try:
+            return np.load(array_path, mmap_mode="r")
+        except (OSError, ValueError):
+            self.invalidate(source)
+            return None
+    
+    def store(self, path: Union[str, Path], array: np.ndarray) -> None:
+        """Save ``array`` as the sidecar of ``path``."""
+        source = Path(path).resolve()
+        array_path, meta_path = self._entry_paths(source)
+        stat = source.stat()
+        meta = {
+            "source": str(source),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "hash": file_hash(source),
+        }
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".npy.tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(tmp_name, array_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        self._write_atomic(meta_path, json.dumps(meta).encode())
+    
+    def invalidate(self, path: Union[str, Path]) -> None:
+        """Delete the sidecar of ``path``, if any."""
+        for entry in self._entry_paths(Path(path).resolve()):
+            entry.unlink(missing_ok=True)
+    
+    def clear(self) -> None:
+        """Delete every sidecar in the cache directory."""
+        for entry in self.directory.glob("*.npy"):
+            entry.unlink(missing_ok=True)
+            entry.with_suffix(".json").unlink(missing_ok=True)
+    
+    def _write_atomic(self, target: Path, data: bytes) -> None:
+        # Readers in other processes never observe a partially written file
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, target)
@@ -5,8 +5,31 @@ from pathlib import Path
 from .exceptions import InputError, DimensionMismatchError
 
 
-def validate_numeric_array(arr, name="array"):
-    """Validate that array contains only numeric values."""
+# Elements checked at a time when scanning for NaN/inf, so that large (e.g.
+# memory-mapped) arrays are never materialized as a whole boolean mask.
+_FINITE_CHECK_BLOCK = 1 << 20
+
+
+def _all_finite(arr):
+    """Check that a numeric array has no NaN or infinite values, block by block."""
+    if not np.issubdtype(arr.dtype, np.inexact):
+        return True  # Integers and booleans cannot hold NaN or inf
+    if arr.size <= _FINITE_CHECK_BLOCK or arr.ndim == 0:
+        return bool(np.isfinite(arr).all())
+    rows_per_block = max(1, _FINITE_CHECK_BLOCK // (arr.size // arr.shape[0]))
+    for start in range(0, arr.shape[0], rows_per_block):
+        if not np.isfinite(arr[start:start + rows_per_block]).all():
+            return False
+    return True
+
+
+def validate_numeric_array(arr, name="array", dtype=None):
+    """
+    Validate that array contains only numeric values.
+    
+    When ``dtype`` is given the array is converted to it, except for memory-mapped
+    arrays, which are converted block by block during the computation instead.
+    """
     if not isinstance(arr, np.ndarray):
         arr = np.array(arr)
     
@@ -20,9 +43,12 @@ def validate_numeric_array(arr, name="array"):
         except (ValueError, TypeError):
             raise InputError(f"{name} must contain only numeric values")
     
-    if np.any(np.isnan(arr)) or np.any(np.isinf(arr)):
+    if not _all_finite(arr):
         raise InputError(f"{name} contains NaN or infinite values")
     
+    if dtype is not None and arr.dtype != dtype and not isinstance(arr, np.memmap):
+        arr = arr.astype(dtype)
+    
     return arr
 
 
@@ -38,7 +64,7 @@ def validate_dimensions(x, y):
     return x, y
 
 
-def validate_file_path(path):
+def validate_file_path(path, check_extension=True):
     """Validate file path exists and has supported extension."""
     path = Path(path)
     
@@ -48,8 +74,8 @@ def validate_file_path(path):
     if not path.is_file():
         raise InputError(f"Path is not a file: {path}")
     
-    supported_extensions = {'.csv', '.xlsx', '.xls', '.txt'}
-    if path.suffix.lower() not in supported_extensions:
+    supported_extensions = {'.csv', '.xlsx', '.xls', '.txt', '.npy', '.npz'}
+    if check_extension and path.suffix.lower() not in supported_extensions:
         raise InputError(
             f"Unsupported file format: {path.suffix}. "
             f"Supported formats: {', '.join(supported_extensions)}"
@@ -1,5 +1,107 @@
-"""Distance metrics implementations."""
+"""
+Distance metrics implementations.
 
-from .numeric import euclidean
+Metric modules are imported on first access (module ``__getattr__`` and
+``get_metric``), so computing a Euclidean distance never loads, e.g., the
+structural or categorical metrics.
+"""
 
-__all__ = ["euclidean"]
\ No newline at end of file
+import importlib
+from ..core.base import BaseDistance
+from ..core.exceptions import InputError
+
+# Public names by the submodule that defines them.
+_EXPORTS = {
+    ".angular": ("angular_metric", "cosine", "cosine_similarity"),
+    ".binary": ("PackedBits", "dice", "hamming", "jaccard", "pack_bits"),
+    ".categorical": ("GowerDistance", "categorical_metric", "gower"),
+    ".distribution": ("BhattacharyyaDistance", "HellingerDistance", "bhattacharyya", "hellinger", "wasserstein"),
+    ".information": ("JensenShannonDistance", "KLDivergence", "jensen_shannon", "kl_divergence"),
+    ".learned": ("LinearMapDistance", "MahalanobisDistance", "load_metric", "mahalanobis"),
+    ".structural": ("DTWDistance", "SequenceDistance", "dtw", "levenshtein"),
+    ".numeric": ("euclidean",),
+}
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+# Metric instances available by name, e.g. knn(..., metric="euclidean"), as
+# "module:attribute" so that only the requested metric's module is imported.
+METRICS = {
+    "euclidean": "numeric:euclidean",
+    "cosine": "angular:cosine",
+    "angular": "angular:angular_metric",
+    "hamming": "binary:hamming",
+    "jaccard": "binary:jaccard",
+    "dice": "binary:dice",
+    "kl_divergence": "information:kl_divergence",
+    "jensen_shannon": "information:jensen_shannon",
+    "hellinger": "distribution:hellinger",
+    "bhattacharyya": "distribution:bhattacharyya",
+    "wasserstein": "distribution:wasserstein",
+    "dtw": "structural:dtw",
+    "levenshtein": "structural:levenshtein",
+    "categorical": "categorical:categorical_metric",
+    "gower": "categorical:gower",
+    "mahalanobis": "learned:mahalanobis",
+}
+
+
+def get_metric(metric):
+    """
+    Resolve a metric name or instance into a metric instance.
+    
+    Similarities (e.g. ``cosine_similarity``) are rejected: every consumer of
+    this function ranks or thresholds its results as distances.
+    """
+    if isinstance(metric, BaseDistance):
+        if metric.similarity:
+            raise InputError(f"{metric.name} is a similarity, not a distance; "
+                             f"use a distance such as 'cosine' instead")
+        return metric
+    if isinstance(metric, str) and metric.lower() in METRICS:
+        module, name = METRICS[metric.lower()].split(":")
+        return getattr(importlib.import_module(f".{module}", __name__), name)
+    raise InputError(
+        f"Unknown metric: {metric!r}. Available metrics: {', '.join(sorted(METRICS))}"
+    )
+
+
+def __getattr__(name):
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__ = [
+    "euclidean",
+    "cosine",
+    "cosine_similarity",
+    "angular_metric",
+    "hamming",
+    "jaccard",
+    "dice",
+    "kl_divergence",
+    "jensen_shannon",
+    "hellinger",
+    "bhattacharyya",
+    "wasserstein",
+    "dtw",
+    "levenshtein",
+    "categorical_metric",
+    "gower",
+    "mahalanobis",
+    "SequenceDistance",
+    "LinearMapDistance",
+    "MahalanobisDistance",
+    "load_metric",
+    "PackedBits",
+    "pack_bits",
+    "METRICS",
+    "get_metric",
+]
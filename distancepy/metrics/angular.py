@@ -0,0 +1,119 @@
+"""Angular distance metrics (cosine similarity, cosine and angular distance)."""
+
+import numpy as np
+from abc import abstractmethod
+from typing import Tuple
+from ..core.base import NumericDistance
+
+
+class _CosineBase(NumericDistance):
+    """
+    Shared kernels of the metrics derived from cosine similarity.
+    
+    Rows are normalized once (see ``_precompute``), after which all-pairs and
+    cross similarities are a single matrix multiply per block. A zero vector
+    has similarity 0 to every non-zero vector and 1 to another zero vector,
+    so that its distance to itself is 0.
+    """
+    
+    @abstractmethod
+    def _from_similarity(self, similarity: np.ndarray) -> np.ndarray:
+        """Turn cosine similarities (clipped to [-1, 1]) into this metric's values."""
+        pass
+    
+    @staticmethod
+    def _normalize(array: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        norms = np.sqrt(np.einsum('ij,ij->i', array, array))
+        zero = norms == 0
+        normalized = array / np.where(zero, 1, norms)[:, None]
+        return normalized, zero
+    
+    def _precompute(self, array: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Unit-length rows and a mask of zero rows."""
+        return self._normalize(array)
+    
+    @staticmethod
+    def _similarity(products: np.ndarray, both_zero: np.ndarray) -> np.ndarray:
+        """Finish dot products of unit rows: zero-vector pairs and clipping."""
+        products[both_zero] = 1.0
+        return np.clip(products, -1.0, 1.0, out=products)
+    
+    def _compute(self, x: np.ndarray, y: np.ndarray) -> float:
+        """
+        Compute the metric between two points.
+        
+        Formula: cos = sum(x_i * y_i) / (|x| * |y|)
+        """
+        return float(self._compute_rowwise(np.atleast_2d(x), np.atleast_2d(y))[0])
+    
+    def _compute_one_to_many(self, point: np.ndarray, array: np.ndarray) -> np.ndarray:
+        point_n, point_zero = self._normalize(point.reshape(1, -1))
+        array_n, array_zero = self._normalize(array)
+        products = array_n @ point_n[0]
+        return self._from_similarity(self._similarity(products, array_zero & point_zero[0]))
+    
+    def _compute_rowwise(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        x_n, x_zero = self._normalize(x)
+        y_n, y_zero = self._normalize(y)
+        products = np.einsum('ij,ij->i', x_n, y_n)
+        return self._from_similarity(self._similarity(products, x_zero & y_zero))
+    
+    def _compute_cross(self, x: np.ndarray, y: np.ndarray, x_aux=None, y_aux=None) -> np.ndarray:
+        x_n, x_zero = x_aux if x_aux is not None else self._normalize(x)
+        y_n, y_zero = y_aux if y_aux is not None else self._normalize(y)
+        return self._from_similarity(self._similarity(x_n @ y_n.T, np.logical_and.outer(x_zero, y_zero)))
+    
+    def _compute_self(self, x: np.ndarray, aux=None) -> np.ndarray:
+        x_n, x_zero = aux if aux is not None else self._normalize(x)
+        # Mirror the upper triangle so the result is exactly symmetric
+        products = np.triu(x_n @ x_n.T, 1)
+        products += products.T
+        np.fill_diagonal(products, 1.0)
+        return self._from_similarity(self._similarity(products, np.logical_and.outer(x_zero, x_zero)))
+
+
+class CosineSimilarity(_CosineBase):
+    """Cosine similarity: 1 for vectors pointing the same way, -1 for opposite ones."""
+    
+    similarity = True
+    
+    def __init__(self):
+        super().__init__("cosine_similarity")
+    
+    def _from_similarity(self, similarity: np.ndarray) -> np.ndarray:
+        return similarity
+
+
+class CosineDistance(_CosineBase):
+    """
+    Cosine distance implementation.
+    
+    Formula: 1 - cos(x, y), in [0, 2]
+    """
+    
+    def __init__(self):
+        super().__init__("cosine")
+    
+    def _from_similarity(self, similarity: np.ndarray) -> np.ndarray:
+        return np.subtract(1.0, similarity, out=similarity)
+
+
+class AngularDistance(_CosineBase):
+    """
+    Angular distance implementation; unlike cosine distance it is a true metric.
+    
+    Formula: arccos(cos(x, y)) / pi, in [0, 1]
+    """
+    
+    def __init__(self):
+        super().__init__("angular")
+    
+    def _from_similarity(self, similarity: np.ndarray) -> np.ndarray:
+        return np.divide(np.arccos(similarity, out=similarity), np.pi, out=similarity)
+
+
+# Create singleton instances
+cosine_similarity = CosineSimilarity()
+cosine = CosineDistance()
+# Not "angular", which would clash with this module's name in the package
+angular_metric = AngularDistance()
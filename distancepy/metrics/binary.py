@@ -0,0 +1,285 @@
+"""Binary distance metrics on bit-packed vectors (Hamming, Jaccard, Dice)."""
+
+import copy
+import numpy as np
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, Optional, Tuple
+from ..core.base import BaseDistance
+from ..core.blocking import iter_row_blocks
+from ..core.exceptions import DimensionMismatchError, InputError
+from ..core.parsers import DataParser
+from ..core.prepared import PreparedData
+
+# Number of set bits in every byte value, used when numpy has no bitwise_count.
+_POPCOUNT_TABLE = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+_HAS_BITWISE_COUNT = hasattr(np, "bitwise_count")
+
+# Maximum number of words in the broadcast temporary of a cross computation.
+_CROSS_WORDS = 1 << 20
+
+# Rows packed at once by pack_bits, bounding the boolean temporary.
+_PACK_ROWS = 1 << 14
+
+
+class PackedBits(PreparedData):
+    """
+    Binary vectors stored as packed bits, 8 per byte.
+    
+    A 2048-bit row takes 256 bytes, 1/64 of its float64 representation.
+    Instances are accepted by the binary metrics (and the neighbour searches)
+    in place of raw inputs and are used as they are. Create them with
+    ``pack_bits``, or wrap words packed elsewhere; both inputs of a distance
+    must use the same bit layout.
+    
+    Args:
+        words: Unsigned integer array of packed bits, one row per vector
+            (e.g. the output of ``np.packbits(bits, axis=-1)`` or a view of it
+            as ``uint64``). Padding bits past ``n_bits`` must be zero.
+        n_bits: Number of meaningful bits per row. Defaults to all bits of the words.
+    """
+    
+    def __init__(self, words: Any, n_bits: Optional[int] = None):
+        words = np.asarray(words)
+        if not np.issubdtype(words.dtype, np.unsignedinteger):
+            raise InputError(f"Packed bits must be an unsigned integer array, got {words.dtype}")
+        if words.ndim not in (1, 2):
+            raise InputError(f"Packed bits must be 1-D or 2-D, got {words.ndim} dimensions")
+        words = np.ascontiguousarray(words).view(np.uint8)
+        capacity = words.shape[-1] * 8
+        if n_bits is None:
+            n_bits = capacity
+        elif not capacity - 8 < n_bits <= capacity:
+            raise InputError(f"n_bits={n_bits} does not fit rows of {words.shape[-1]} bytes")
+        if words.flags.writeable:
+            words = words.copy()
+            words.setflags(write=False)
+        super().__init__(words)
+        self.n_bits = int(n_bits)
+    
+    def __repr__(self) -> str:
+        return f"PackedBits(shape={self.shape}, n_bits={self.n_bits}, cached={list(self._aux)})"
+    
+    def unpack(self) -> np.ndarray:
+        """Return the vectors as a uint8 array of 0s and 1s."""
+        return np.unpackbits(self.array, axis=-1, count=self.n_bits)
+
+
+def _bit_array(data: Any) -> np.ndarray:
+    """
+    Parse binary input without converting it to floating point.
+    
+    Boolean and integer arrays (and lists, which numpy turns into them) are
+    used as they are, since ``np.packbits`` sets a bit for every non-zero
+    value; other inputs go through ``DataParser.parse_single_input``.
+    """
+    if isinstance(data, (list, tuple)):
+        data = np.asarray(data)
+    if isinstance(data, np.ndarray) and (data.dtype == np.bool_ or np.issubdtype(data.dtype, np.integer)):
+        if data.size == 0:
+            raise InputError("array cannot be empty")
+        return data
+    return DataParser.parse_single_input(data)
+
+
+def _pack_rows(array: np.ndarray) -> np.ndarray:
+    """Pack the rows of a 2-D array, ``_PACK_ROWS`` rows at a time."""
+    words = np.empty((array.shape[0], (array.shape[1] + 7) // 8), dtype=np.uint8)
+    exact = array.dtype == np.bool_ or np.issubdtype(array.dtype, np.integer)
+    for start, stop in iter_row_blocks(array.shape[0], _PACK_ROWS):
+        block = array[start:stop]
+        words[start:stop] = np.packbits(block if exact else block != 0, axis=-1)
+    return words
+
+
+def pack_bits(data: Any) -> PackedBits:
+    """
+    Parse an input and pack it into bits; non-zero values become 1.
+    
+    Boolean and integer arrays are packed without a floating-point copy,
+    and CSV/text files are read and packed block by block, so only the
+    packed bits of the whole input are held in memory.
+    
+    Args:
+        data: Binary vector(s) as a list, array, or file path
+    
+    Returns:
+        PackedBits accepted by ``hamming_distance``, ``jaccard_distance`` and
+        ``dice_distance``
+    
+    Examples:
+        >>> fingerprints = pack_bits("fingerprints.csv")
+        >>> jaccard_distance(fingerprints[0], fingerprints)
+    """
+    if isinstance(data, PackedBits):
+        return data
+    if isinstance(data, (str, Path)) and Path(data).suffix.lower() in ('.csv', '.txt'):
+        blocks = [(_pack_rows(block), block.shape[1]) for block in DataParser.iter_file_blocks(data)]
+        if not blocks:
+            raise InputError(f"No rows found in {data}")
+        return PackedBits(np.concatenate([words for words, _ in blocks]), blocks[0][1])
+    array = _bit_array(data)
+    if array.ndim == 1:
+        return PackedBits(np.packbits(array != 0), array.shape[0])
+    return PackedBits(_pack_rows(array), array.shape[1])
+
+
+def _words(array: np.ndarray) -> np.ndarray:
+    """View packed bytes as the widest words the popcount supports."""
+    array = np.ascontiguousarray(array)
+    if _HAS_BITWISE_COUNT and array.shape[-1] % 8 == 0:
+        return array.view(np.uint64)
+    return array
+
+
+def popcount(words: np.ndarray) -> np.ndarray:
+    """Count the set bits of each row (the last axis) of packed words."""
+    if _HAS_BITWISE_COUNT:
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    return _POPCOUNT_TABLE[words.view(np.uint8)].sum(axis=-1, dtype=np.int64)
+
+
+class BinaryDistance(BaseDistance):
+    """
+    Base class for metrics on binary vectors.
+    
+    Inputs are packed into bits (see ``PackedBits``) before the blocked engine
+    runs, so every block holds packed words and the kernels count bits of
+    ``_op`` (XOR or AND) of two rows with a popcount. Row popcounts are
+    precomputed once per input. Subclasses turn the counts into distances in
+    ``_finish``.
+    """
+    
+    _op = staticmethod(np.bitwise_and)
+    
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.n_bits: Optional[int] = None
+    
+    @abstractmethod
+    def _finish(self, counts: np.ndarray, x_counts: np.ndarray,
+                y_counts: np.ndarray) -> np.ndarray:
+        """Turn pair counts of ``_op`` and the rows' own popcounts into distances."""
+        pass
+    
+    def _pack(self, data: Any, axis: int) -> PackedBits:
+        if isinstance(data, PackedBits):
+            if axis != 0:
+                raise InputError("Packed bits hold one vector per row; use axis=0")
+            return data
+        if axis == 0:
+            return pack_bits(data)
+        array = _bit_array(data)
+        return pack_bits(array.T if array.ndim == 2 else array)
+    
+    def _bind_inputs(self, x: Any, y: Any = None, axis: int = 0) -> Tuple[Any, Any, Any, int]:
+        """Pack both inputs and return a copy of the metric that knows their bit length."""
+        x = self._pack(x, axis)
+        y = None if y is None else self._pack(y, axis)
+        if y is not None and x.n_bits != y.n_bits:
+            raise DimensionMismatchError(
+                f"Binary inputs have different lengths: {x.n_bits} and {y.n_bits} bits"
+            )
+        bound = copy.copy(self)
+        bound.n_bits = x.n_bits
+        return bound, x, y, 0
+    
+    def _as_compute_block(self, block: np.ndarray, compute_dtype: Any = None) -> np.ndarray:
+        return block  # Packed words are used as they are
+    
+    def _aux_key(self) -> Any:
+        return "popcount"  # Shared by all binary metrics
+    
+    def _precompute(self, array: np.ndarray) -> np.ndarray:
+        """Number of set bits of every row."""
+        return popcount(_words(array))
+    
+    def _compute(self, x: np.ndarray, y: np.ndarray) -> float:
+        x_words, y_words = _words(x), _words(y)
+        counts = popcount(self._op(x_words, y_words))
+        return float(self._finish(counts, popcount(x_words), popcount(y_words)))
+    
+    def _compute_one_to_many(self, point: np.ndarray, array: np.ndarray) -> np.ndarray:
+        point_words, array_words = _words(point), _words(array)
+        counts = popcount(self._op(array_words, point_words))
+        return self._finish(counts, popcount(point_words), popcount(array_words))
+    
+    def _compute_rowwise(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        x_words, y_words = _words(x), _words(y)
+        counts = popcount(self._op(x_words, y_words))
+        return self._finish(counts, popcount(x_words), popcount(y_words))
+    
+    def _compute_cross(self, x: np.ndarray, y: np.ndarray,
+                       x_aux: np.ndarray = None, y_aux: np.ndarray = None) -> np.ndarray:
+        """
+        Compute all row pairs by broadcasting the bitwise operation.
+        
+        Rows of ``x`` are taken a few at a time so that the temporary of
+        ``len(x) * len(y)`` word rows stays below ``_CROSS_WORDS`` words.
+        """
+        x_words, y_words = _words(x), _words(y)
+        if x_aux is None:
+            x_aux = popcount(x_words)
+        if y_aux is None:
+            y_aux = popcount(y_words)
+        counts = np.empty((x_words.shape[0], y_words.shape[0]), dtype=np.int64)
+        step = max(1, _CROSS_WORDS // max(1, y_words.shape[0] * y_words.shape[1]))
+        for start, stop in iter_row_blocks(x_words.shape[0], step):
+            counts[start:stop] = popcount(self._op(x_words[start:stop, None, :], y_words[None, :, :]))
+        return self._finish(counts, x_aux[:, None], y_aux[None, :])
+    
+    def _compute_self(self, x: np.ndarray, aux: np.ndarray = None) -> np.ndarray:
+        # Integer counts are symmetric, so the result is exactly symmetric with a zero diagonal.
+        return self._compute_cross(x, x, aux, aux)
+
+
+class HammingDistance(BinaryDistance):
+    """
+    Hamming distance implementation.
+    
+    Formula: popcount(x XOR y) / n_bits, the fraction of differing bits
+    """
+    
+    _op = staticmethod(np.bitwise_xor)
+    
+    def __init__(self):
+        super().__init__("hamming")
+    
+    def _finish(self, counts, x_counts, y_counts):
+        return counts / self.n_bits
+
+
+class JaccardDistance(BinaryDistance):
+    """
+    Jaccard distance implementation.
+    
+    Formula: 1 - |x AND y| / |x OR y|, and 0 for two all-zero vectors
+    """
+    
+    def __init__(self):
+        super().__init__("jaccard")
+    
+    def _finish(self, counts, x_counts, y_counts):
+        union = x_counts + y_counts - counts
+        return 1.0 - np.divide(counts, union, out=np.ones(np.shape(counts)), where=union > 0)
+
+
+class DiceDistance(BinaryDistance):
+    """
+    Dice distance implementation.
+    
+    Formula: 1 - 2 |x AND y| / (|x| + |y|), and 0 for two all-zero vectors
+    """
+    
+    def __init__(self):
+        super().__init__("dice")
+    
+    def _finish(self, counts, x_counts, y_counts):
+        total = x_counts + y_counts
+        return 1.0 - np.divide(2 * counts, total, out=np.ones(np.shape(counts)), where=total > 0)
+
+
+# Create singleton instances
+hamming = HammingDistance()
+jaccard = JaccardDistance()
+dice = DiceDistance()
@@ -0,0 +1,129 @@
+"""Distances for categorical and mixed-type data (overlap, Gower)."""
+
+import copy
+import numpy as np
+from typing import Any, Optional, Tuple
+from ..core.base import BaseDistance
+from ..core.exceptions import InputError
+from ..core.mixed import MixedData, is_record
+from ..core.parsers import DataParser
+from ..core.prepared import PreparedData
+
+
+class GowerDistance(BaseDistance):
+    """
+    Gower distance between records with numeric and categorical columns.
+    
+    Numeric columns contribute their absolute difference divided by the
+    column's range, categorical columns 0 for equal and 1 for different
+    values, and the distance is the mean over the columns present in both
+    records (missing values are skipped).
+    
+    Inputs are parsed with ``DataParser.parse_mixed_input`` and encoded once
+    into a float array of range-scaled numeric columns followed by categorical
+    codes, which then runs through the usual blocked engine. Ranges are taken
+    over both inputs, and categorical codes of the second input are expressed
+    in the first input's dictionaries.
+    
+    Formula: mean_k(|x_k - y_k| / range_k for numeric k, [x_k != y_k] for categorical k)
+    
+    Args:
+        categorical: Columns to treat as categorical even though they are
+            numeric, by name or position, or True for all columns
+    """
+    
+    def __init__(self, categorical: Any = None, name: str = "gower"):
+        super().__init__(name)
+        self.categorical = categorical
+        self.n_numeric = 0
+    
+    def _encode(self, x: Any, y: Any = None) -> Tuple[MixedData, Optional[MixedData]]:
+        """Parse both inputs and share the first input's dictionaries."""
+        x_table = DataParser.parse_mixed_input(x, self.categorical)
+        if y is None:
+            return x_table, None
+        return x_table, x_table.recode(DataParser.parse_mixed_input(y, self.categorical))
+    
+    def _bind_inputs(self, x: Any, y: Any = None, axis: int = 0) -> Tuple[Any, Any, Any, int]:
+        """Encode both inputs and return a copy of the metric that knows the column split."""
+        if axis != 0:
+            raise InputError(f"{self.name} distance compares records (rows); use axis=0")
+        x_table, y_table = self._encode(x, y)
+        tables = [x_table] if y_table is None else [x_table, y_table]
+        
+        numeric = np.vstack([table.numeric for table in tables])
+        # Columns that are constant or entirely missing keep a range of 1
+        with np.errstate(invalid='ignore'):
+            ranges = (np.nanmax(numeric, axis=0, initial=-np.inf)
+                      - np.nanmin(numeric, axis=0, initial=np.inf))
+        ranges = np.where(np.isfinite(ranges) & (ranges > 0), ranges, 1.0)
+        
+        bound = copy.copy(self)
+        bound.n_numeric = x_table.numeric.shape[1]
+        encoded = []
+        for table, original in zip(tables, (x, y)):
+            array = table.to_array()
+            array[:, :bound.n_numeric] /= ranges
+            encoded.append(PreparedData(array[0] if is_record(original) else array))
+        return bound, encoded[0], encoded[1] if y is not None else None, 0
+    
+    def _combine(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """
+        Distances between broadcastable blocks of encoded records.
+        
+        Works one column at a time, so the temporaries have the size of the
+        result rather than of the result times the number of columns.
+        """
+        n_columns = x.shape[-1]
+        missing = np.isnan(x).any() or np.isnan(y).any()
+        total = weight = 0.0
+        for k in range(n_columns):
+            a, b = x[..., k], y[..., k]
+            term = np.abs(a - b) if k < self.n_numeric else (a != b).astype(np.float64)
+            if missing:
+                present = ~(np.isnan(a) | np.isnan(b))
+                total = total + np.where(present, term, 0.0)
+                weight = weight + present
+            else:
+                total = total + term
+        if not missing:
+            return total / n_columns
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return total / weight  # NaN when two records share no column
+    
+    def _compute(self, x: np.ndarray, y: np.ndarray) -> float:
+        return float(self._combine(x, y))
+    
+    def _compute_one_to_many(self, point: np.ndarray, array: np.ndarray) -> np.ndarray:
+        return self._combine(point[None, :], array)
+    
+    def _compute_rowwise(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return self._combine(x, y)
+    
+    def _compute_cross(self, x: np.ndarray, y: np.ndarray, x_aux=None, y_aux=None) -> np.ndarray:
+        return np.asarray(self._combine(x[:, None, :], y[None, :, :]), dtype=np.float64)
+    
+    def _compute_self(self, x: np.ndarray, aux=None) -> np.ndarray:
+        # Keep the upper triangle only so the result is exactly symmetric with a zero diagonal.
+        distances = np.triu(self._compute_cross(x, x), 1)
+        return distances + distances.T
+
+
+class CategoricalDistance(GowerDistance):
+    """
+    Overlap (categorical Hamming) distance: the fraction of columns that differ.
+    
+    Every column is treated as categorical, whatever its type, and encoded
+    into integer codes once; missing values are skipped.
+    
+    Formula: mean_k([x_k != y_k])
+    """
+    
+    def __init__(self):
+        super().__init__(categorical=True, name="categorical")
+
+
+# Create singleton instances
+gower = GowerDistance()
+# Not "categorical", which would clash with this module's name in the package
+categorical_metric = CategoricalDistance()
@@ -0,0 +1,189 @@
+"""Distances between probability distributions (Hellinger, Bhattacharyya, Wasserstein)."""
+
+import numpy as np
+from abc import abstractmethod
+from typing import Callable
+from ..core.base import NumericDistance
+from ..core.blocking import iter_row_blocks
+from ..core.exceptions import InputError
+
+# Maximum number of values in the broadcast temporary of a cross computation.
+_CROSS_VALUES = 1 << 20
+
+
+def normalize_rows(array: np.ndarray, eps: float = 0.0) -> np.ndarray:
+    """
+    Turn rows of non-negative weights (e.g. histogram counts) into probabilities.
+    
+    With ``eps > 0`` every entry is first raised to at least ``eps``, so that
+    zero-probability bins do not produce infinite logarithms.
+    """
+    if np.any(array < 0):
+        raise InputError("Distributions must not contain negative values")
+    if eps > 0:
+        array = np.maximum(array, eps)
+    totals = array.sum(axis=1, keepdims=True)
+    if np.any(totals == 0):
+        raise InputError("Distributions must have a positive total")
+    return array / totals
+
+
+def cross_reduce(x: np.ndarray, y: np.ndarray,
+                 reduce: Callable[[np.ndarray, np.ndarray], np.ndarray]) -> np.ndarray:
+    """
+    Evaluate ``reduce`` on broadcast row pairs, a few rows of ``x`` at a time.
+    
+    ``reduce`` receives blocks of shape (b, 1, d) and (1, len(y), d) and
+    returns the (b, len(y)) values; blocks are sized so that the temporary
+    stays below ``_CROSS_VALUES`` values.
+    """
+    result = np.empty((x.shape[0], y.shape[0]), dtype=np.result_type(x, y, np.float32))
+    step = max(1, _CROSS_VALUES // max(1, y.shape[0] * y.shape[1]))
+    for start, stop in iter_row_blocks(x.shape[0], step):
+        result[start:stop] = reduce(x[start:stop, None, :], y[None, :, :])
+    return result
+
+
+class DistributionDistance(NumericDistance):
+    """
+    Base class for metrics between rows of non-negative weights.
+    
+    Rows are normalized to sum to 1 (see ``normalize_rows``) and the per-row
+    terms of the metric (roots, logarithms, entropies) are computed once in
+    ``_precompute``, so all-pairs blocks only combine precomputed rows.
+    Subclasses implement ``_precompute`` and ``_compute_cross``; the other
+    kernels are derived from them.
+    
+    Args:
+        name: Metric name
+        eps: Floor applied to every probability before normalizing; 0 keeps
+            zero-probability entries as they are
+    """
+    
+    def __init__(self, name: str, eps: float = 0.0):
+        super().__init__(name)
+        if eps < 0:
+            raise InputError(f"eps must be non-negative, got {eps}")
+        self.eps = float(eps)
+    
+    def _aux_key(self):
+        return (self.name, self.eps)
+    
+    def _normalize(self, array: np.ndarray) -> np.ndarray:
+        return normalize_rows(array, self.eps)
+    
+    def _compute(self, x: np.ndarray, y: np.ndarray) -> float:
+        return float(self._compute_cross(np.atleast_2d(x), np.atleast_2d(y))[0, 0])
+    
+    def _compute_one_to_many(self, point: np.ndarray, array: np.ndarray) -> np.ndarray:
+        return self._compute_cross(point.reshape(1, -1), array)[0]
+    
+    def _compute_self(self, x: np.ndarray, aux=None) -> np.ndarray:
+        distances = self._compute_cross(x, x, aux, aux)
+        if self.symmetric:
+            # Keep the upper triangle only so the result is exactly symmetric
+            distances = np.triu(distances, 1)
+            return distances + distances.T
+        np.fill_diagonal(distances, 0.0)
+        return distances
+
+
+class _BhattacharyyaBase(DistributionDistance):
+    """Shared kernels of the metrics built on the Bhattacharyya coefficient sum(sqrt(p * q))."""
+    
+    @abstractmethod
+    def _from_coefficient(self, coefficient: np.ndarray) -> np.ndarray:
+        """Turn Bhattacharyya coefficients into this metric's values."""
+        pass
+    
+    def _precompute(self, array: np.ndarray) -> np.ndarray:
+        """Square roots of the normalized rows."""
+        return np.sqrt(self._normalize(array))
+    
+    def _compute_rowwise(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        coefficient = np.einsum('ij,ij->i', self._precompute(x), self._precompute(y))
+        return self._from_coefficient(np.clip(coefficient, 0.0, 1.0))
+    
+    def _compute_cross(self, x: np.ndarray, y: np.ndarray, x_aux=None, y_aux=None) -> np.ndarray:
+        if x_aux is None:
+            x_aux = self._precompute(x)
+        if y_aux is None:
+            y_aux = self._precompute(y)
+        return self._from_coefficient(np.clip(x_aux @ y_aux.T, 0.0, 1.0))
+
+
+class HellingerDistance(_BhattacharyyaBase):
+    """
+    Hellinger distance implementation.
+    
+    Formula: sqrt(1 - sum(sqrt(p_i * q_i))), in [0, 1]
+    """
+    
+    def __init__(self, eps: float = 0.0):
+        super().__init__("hellinger", eps)
+    
+    def _from_coefficient(self, coefficient: np.ndarray) -> np.ndarray:
+        return np.sqrt(1.0 - coefficient)
+
+
+class BhattacharyyaDistance(_BhattacharyyaBase):
+    """
+    Bhattacharyya distance implementation.
+    
+    Formula: -ln(sum(sqrt(p_i * q_i))); infinite for distributions with
+    disjoint support unless ``eps`` > 0
+    """
+    
+    def __init__(self, eps: float = 0.0):
+        super().__init__("bhattacharyya", eps)
+    
+    def _from_coefficient(self, coefficient: np.ndarray) -> np.ndarray:
+        with np.errstate(divide='ignore'):
+            return np.abs(-np.log(coefficient))  # abs turns -0.0 into 0.0
+
+
+class WassersteinDistance(NumericDistance):
+    """
+    1-D Wasserstein (earth mover's) distance between rows of samples.
+    
+    Each row holds samples of a one-dimensional distribution. For equally
+    sized samples the distance is the mean absolute difference of the sorted
+    samples (the area between the two empirical CDFs), so every row is
+    sorted once in ``_precompute`` and all-pairs blocks need no sorting.
+    
+    Formula: mean(|sort(x)_i - sort(y)_i|)
+    """
+    
+    def __init__(self):
+        super().__init__("wasserstein")
+    
+    def _precompute(self, array: np.ndarray) -> np.ndarray:
+        """Sorted samples of every row."""
+        return np.sort(array, axis=1)
+    
+    def _compute(self, x: np.ndarray, y: np.ndarray) -> float:
+        return float(np.mean(np.abs(np.sort(x) - np.sort(y))))
+    
+    def _compute_one_to_many(self, point: np.ndarray, array: np.ndarray) -> np.ndarray:
+        return np.mean(np.abs(self._precompute(array) - np.sort(point)), axis=1)
+    
+    def _compute_rowwise(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        return np.mean(np.abs(self._precompute(x) - self._precompute(y)), axis=1)
+    
+    def _compute_cross(self, x: np.ndarray, y: np.ndarray, x_aux=None, y_aux=None) -> np.ndarray:
+        if x_aux is None:
+            x_aux = self._precompute(x)
+        if y_aux is None:
+            y_aux = self._precompute(y)
+        return cross_reduce(x_aux, y_aux, lambda a, b: np.abs(a - b).mean(axis=-1))
+    
+    def _compute_self(self, x: np.ndarray, aux=None) -> np.ndarray:
+        # Keep the upper triangle only so the result is exactly symmetric with a zero diagonal.
+        distances = np.triu(self._compute_cross(x, x, aux, aux), 1)
+        return distances + distances.T
+
+
+# Create singleton instances
+hellinger = HellingerDistance()
+bhattacharyya = BhattacharyyaDistance()
+wasserstein = WassersteinDistance()
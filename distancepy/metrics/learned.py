@@ -0,0 +1,222 @@
+"""Distances under a learned linear map (Mahalanobis and general linear maps)."""
+
+import copy
+import numpy as np
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+from ..core.base import NumericDistance
+from ..core.blocking import iter_row_blocks, resolve_row_block
+from ..core.exceptions import DimensionMismatchError, FileFormatError, InputError
+from ..core.output import data_fingerprint
+from ..core.parsers import DataParser
+from ..core.prepared import PreparedData
+from .numeric import euclidean
+
+
+class LinearMapDistance(NumericDistance):
+    """
+    Euclidean distance after a linear map: d(x, y) = |W (x - y)|.
+    
+    Inputs are mapped once, block by block, when a computation starts, and the
+    mapped rows then go through the Euclidean kernels (Gram-matrix cross
+    blocks) instead of evaluating a quadratic form per pair. For
+    ``PreparedData`` inputs the mapped rows are cached on the prepared data,
+    so repeated calls map them only once.
+    
+    Args:
+        transform: (k, d) matrix W mapping d-dimensional points to k dimensions
+    """
+    
+    kind = "linear_map"
+    
+    def __init__(self, transform: Any = None, name: str = "linear_map"):
+        super().__init__(name)
+        self.transform: Optional[np.ndarray] = None
+        self._key: Any = None
+        if transform is not None:
+            self.set_transform(transform)
+    
+    def set_transform(self, transform: Any) -> "LinearMapDistance":
+        """Set the (k, d) matrix of the map."""
+        transform = np.array(transform, dtype=np.float64, ndmin=2)
+        if transform.ndim != 2 or not np.isfinite(transform).all():
+            raise InputError("transform must be a finite 2-D matrix")
+        transform.setflags(write=False)
+        self.transform = transform
+        self._key = (self.name, data_fingerprint(transform))
+        return self
+    
+    @property
+    def fitted(self) -> bool:
+        return self.transform is not None
+    
+    def _aux_key(self) -> Any:
+        return self._key
+    
+    def _precompute(self, array: np.ndarray) -> np.ndarray:
+        """The rows mapped into the space where the distance is Euclidean."""
+        return array @ self.transform.T
+    
+    def _compute(self, x: np.ndarray, y: np.ndarray) -> float:
+        diff = self.transform @ (x - y)
+        return float(np.sqrt(diff @ diff))
+    
+    def _fitted_for(self, x: Any, y: Any, axis: int) -> "LinearMapDistance":
+        """The fitted metric to use for these inputs."""
+        if not self.fitted:
+            raise InputError(f"{self.name} metric has no transform; fit or load it first")
+        return self
+    
+    def _map(self, data: Any, axis: int) -> np.ndarray:
+        """Parse an input and map its points, reusing a prepared input's cached result."""
+        features = self.transform.shape[1]
+        array = data.array if isinstance(data, PreparedData) else DataParser.parse_single_input(data)
+        if array.ndim == 1:
+            if array.shape[0] != features:
+                raise DimensionMismatchError(f"Point has {array.shape[0]} dimensions, "
+                                             f"the map expects {features}")
+            return self._precompute(array.astype(np.float64)[None, :])[0]
+        rows = array if axis == 0 else array.T
+        if rows.shape[1] != features:
+            raise DimensionMismatchError(f"Points have {rows.shape[1]} dimensions, "
+                                         f"the map expects {features}")
+        if isinstance(data, PreparedData) and axis == 0:
+            return data.aux(self)
+        return self._precompute_rows(rows)
+    
+    def _bind_inputs(self, x: Any, y: Any = None, axis: int = 0) -> Tuple[Any, Any, Any, int]:
+        """Map both inputs once and hand them to the Euclidean kernels."""
+        metric = self._fitted_for(x, y, axis)
+        x = PreparedData(metric._map(x, axis))
+        y = None if y is None else PreparedData(metric._map(y, axis))
+        return euclidean, x, y, 0
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the fitted map to an ``.npz`` file readable by ``load_metric``."""
+        if not self.fitted:
+            raise InputError(f"{self.name} metric has no transform to save")
+        np.savez(path, kind=self.kind, **self._state())
+    
+    def _state(self) -> dict:
+        return {"transform": self.transform}
+    
+    @classmethod
+    def _from_state(cls, state: dict) -> "LinearMapDistance":
+        return cls(state["transform"])
+
+
+class MahalanobisDistance(LinearMapDistance):
+    """
+    Mahalanobis distance: sqrt((x - y)^T S^-1 (x - y)) for a covariance S.
+    
+    The covariance's Cholesky factor K (S = K K^T) is computed once and
+    inverted, so that W = K^-1 is a triangular factor of S^-1
+    (S^-1 = W^T W) and the distance is the Euclidean distance between
+    mapped points W x. The factor is cached on the instance.
+    
+    Without a covariance, each call estimates one from its own inputs (both
+    inputs stacked), like a fresh ``fit`` per call.
+    
+    Args:
+        covariance: (d, d) covariance matrix. Use ``fit`` to estimate it.
+        regularization: Value added to the covariance diagonal, for data
+            whose covariance is singular
+    """
+    
+    kind = "mahalanobis"
+    
+    def __init__(self, covariance: Any = None, regularization: float = 0.0):
+        super().__init__(name="mahalanobis")
+        self.regularization = float(regularization)
+        self.covariance: Optional[np.ndarray] = None
+        if covariance is not None:
+            self.set_covariance(covariance)
+    
+    def set_covariance(self, covariance: Any) -> "MahalanobisDistance":
+        """Use ``covariance`` (plus the regularization) and cache its whitening map."""
+        covariance = np.array(covariance, dtype=np.float64, ndmin=2)
+        if covariance.ndim != 2 or covariance.shape[0] != covariance.shape[1]:
+            raise InputError(f"covariance must be a square matrix, got shape {covariance.shape}")
+        covariance = covariance + self.regularization * np.eye(covariance.shape[0])
+        try:
+            factor = np.linalg.cholesky(covariance)
+        except np.linalg.LinAlgError:
+            raise InputError("Covariance matrix is not positive definite; "
+                             "set regularization > 0 for singular data")
+        self.covariance = covariance
+        return self.set_transform(np.tril(np.linalg.inv(factor)))
+    
+    def fit(self, data: Any, axis: int = 0) -> "MahalanobisDistance":
+        """
+        Estimate the covariance of ``data`` (array, list, file path, or PreparedData).
+        
+        The mean and the scatter matrix are accumulated over blocks of rows, so
+        memory-mapped files are never loaded whole.
+        
+        Returns:
+            self, for chaining
+        
+        Examples:
+            >>> metric = MahalanobisDistance().fit("train.csv")
+            >>> metric.save("metric.npz")
+        """
+        array = DataParser.parse_single_input(data)
+        rows = array.reshape(-1, 1) if array.ndim == 1 else (array if axis == 0 else array.T)
+        return self.set_covariance(_covariance(rows))
+    
+    def _fitted_for(self, x: Any, y: Any, axis: int) -> "MahalanobisDistance":
+        if self.fitted:
+            return self
+        arrays = [DataParser.parse_single_input(item) for item in (x, y) if item is not None]
+        rows = [array if axis == 0 else array.T for array in arrays if array.ndim == 2]
+        if not rows or sum(len(r) for r in rows) < 2:
+            raise InputError("Mahalanobis distance needs a covariance; pass one, call fit, "
+                             "or give at least two points")
+        return copy.copy(self).set_covariance(_covariance(np.vstack(rows)))
+    
+    def _state(self) -> dict:
+        return {"transform": self.transform, "covariance": self.covariance}
+    
+    @classmethod
+    def _from_state(cls, state: dict) -> "MahalanobisDistance":
+        metric = cls()
+        metric.covariance = state["covariance"]
+        return metric.set_transform(state["transform"])
+
+
+def _covariance(rows: np.ndarray) -> np.ndarray:
+    """Sample covariance of the rows, computed in two passes over blocks."""
+    n, d = rows.shape
+    if n < 2:
+        raise InputError("At least two points are needed to estimate a covariance")
+    block = resolve_row_block(n, d)
+    mean = np.zeros(d)
+    for start, stop in iter_row_blocks(n, block):
+        mean += rows[start:stop].sum(axis=0)
+    mean /= n
+    scatter = np.zeros((d, d))
+    for start, stop in iter_row_blocks(n, block):
+        centered = rows[start:stop] - mean
+        scatter += centered.T @ centered
+    return scatter / (n - 1)
+
+
+_METRIC_TYPES = {cls.kind: cls for cls in (LinearMapDistance, MahalanobisDistance)}
+
+
+def load_metric(path: Union[str, Path]) -> LinearMapDistance:
+    """Load a metric saved with ``save``."""
+    try:
+        with np.load(path) as arrays:
+            kind = str(arrays["kind"])
+            if kind not in _METRIC_TYPES:
+                raise FileFormatError(f"Unknown metric kind in {path}: {kind!r}")
+            return _METRIC_TYPES[kind]._from_state({name: arrays[name] for name in arrays.files})
+    except FileFormatError:
+        raise
+    except Exception as e:
+        raise FileFormatError(f"Failed to load metric {path}: {str(e)}")
+
+
+# Create singleton instance (estimates the covariance from each call's inputs)
+mahalanobis = MahalanobisDistance()
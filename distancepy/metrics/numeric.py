@@ -18,7 +18,88 @@ class EuclideanDistance(NumericDistance):
         """
         diff = x - y
         return np.sqrt(np.sum(diff * diff))
-
+    
+    def _precompute(self, array: np.ndarray) -> np.ndarray:
+        """Squared norm of every row, shared by all blocks of a cross computation."""
+        return np.einsum('ij,ij->i', array, array)
+    
+    def _compute_one_to_many(self, point: np.ndarray, array: np.ndarray) -> np.ndarray:
+        diff = array - point
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+    
+    def _compute_rowwise(self, x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        diff = x - y
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+    
+    def _compute_cross(self, x: np.ndarray, y: np.ndarray,
+                       x_aux: np.ndarray = None, y_aux: np.ndarray = None) -> np.ndarray:
+        """
+        Compute all row distances with the Gram-matrix expansion.
+        
+        Formula: sqrt(|x|^2 + |y|^2 - 2 x.y), with the entries the expansion
+        cannot resolve recomputed by ``_refine``.
+        """
+        if x_aux is None:
+            x_aux = self._precompute(x)
+        if y_aux is None:
+            y_aux = self._precompute(y)
+        squared = self._expand(x, y, x_aux, y_aux)
+        self._refine(squared, x, y, x_aux, y_aux)
+        np.maximum(squared, 0.0, out=squared)
+        return np.sqrt(squared, out=squared)
+    
+    def _compute_self(self, x: np.ndarray, aux: np.ndarray = None) -> np.ndarray:
+        if aux is None:
+            aux = self._precompute(x)
+        squared = self._expand(x, x, aux, aux)
+        np.fill_diagonal(squared, np.inf)  # The diagonal is zero anyway; don't refine it
+        self._refine(squared, x, x, aux, aux)
+        np.maximum(squared, 0.0, out=squared)
+        # Keep the upper triangle only so the result is exactly symmetric with a zero diagonal.
+        distances = np.triu(np.sqrt(squared, out=squared), 1)
+        return distances + distances.T
+    
+    @staticmethod
+    def _expand(x: np.ndarray, y: np.ndarray, x_aux: np.ndarray, y_aux: np.ndarray) -> np.ndarray:
+        """Squared distances |x|^2 + |y|^2 - 2 x.y, unclipped."""
+        squared = np.multiply(x @ y.T, -2.0)
+        squared += x_aux[:, None]
+        squared += y_aux[None, :]
+        return squared
+    
+    def _refine(self, squared: np.ndarray, x: np.ndarray, y: np.ndarray,
+                x_aux: np.ndarray, y_aux: np.ndarray) -> None:
+        """
+        Recompute in place the squared distances the expansion cannot resolve.
+        
+        The expansion's rounding error grows with |x|^2 + |y|^2 rather than
+        with the distance, so entries below sqrt(eps) * (|x|^2 + |y|^2) may
+        have lost most of their digits. When a block has many of them (data
+        far from the origin), it is expanded again around the mean of ``y``;
+        entries still below the bound (near-duplicate rows) are computed
+        directly as |x - y|^2.
+        """
+        if squared.size == 0:
+            return
+        tol = np.sqrt(np.finfo(squared.dtype).eps)
+        # Screen with the largest column norm before building the exact mask.
+        if not np.any(squared.min(axis=1) < tol * (x_aux + y_aux.max())):
+            return
+        inaccurate = squared < tol * (x_aux[:, None] + y_aux[None, :])
+        if np.count_nonzero(inaccurate) > max(squared.shape):
+            shift = y.mean(axis=0)
+            x_centred, y_centred = x - shift, y - shift
+            x_centred_aux, y_centred_aux = self._precompute(x_centred), self._precompute(y_centred)
+            centred = self._expand(x_centred, y_centred, x_centred_aux, y_centred_aux)
+            squared[inaccurate] = centred[inaccurate]
+            inaccurate &= centred < tol * (x_centred_aux[:, None] + y_centred_aux[None, :])
+        
+        rows, columns = np.nonzero(inaccurate)
+        step = max(squared.shape)  # Bounds the temporary differences to step x d
+        for start in range(0, rows.size, step):
+            i, j = rows[start:start + step], columns[start:start + step]
+            diff = x[i] - y[j]
+            squared[i, j] = np.einsum('ij,ij->i', diff, diff)
 
 # Create singleton instance
-euclidean = EuclideanDistance()
\ No newline at end of file
+euclidean = EuclideanDistance()
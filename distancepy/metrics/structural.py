@@ -0,0 +1,370 @@
+"""Distances between sequences of different lengths (DTW, edit distance)."""
+
+import numpy as np
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+from numpy.lib.stride_tricks import sliding_window_view
+from ..core.base import BaseDistance
+from ..core.blocking import (
+    DEFAULT_MEMORY_BUDGET,
+    allocate_pairwise,
+    condensed_offset,
+    iter_row_blocks,
+    resolve_dtypes,
+)
+from ..core.exceptions import DimensionMismatchError, InputError
+from ..core.output import store_result
+from ..core.parsers import DataParser
+from ..core.validators import validate_numeric_array
+
+# Candidates whose exact distance is computed together during a pruned search.
+_SEARCH_BATCH = 64
+
+
+class SequenceDistance(BaseDistance):
+    """
+    Base class for metrics between sequences, which may differ in length.
+    
+    Inputs are a single sequence (a 1-D list or array), a batch of sequences
+    of the same length (the rows of a 2-D array or file, or its columns with
+    axis=1), or a ragged batch given as a list of sequences. Sequences of
+    equal length are stacked and computed together by ``_compute_batch``,
+    so a ragged batch costs one vectorized kernel call per distinct length.
+    
+    Subclasses implement ``_compute_batch`` and may provide a cheap
+    ``_lower_bound`` that ``knn`` uses to skip candidates without computing
+    their exact distance.
+    """
+    
+    @abstractmethod
+    def _compute_batch(self, query: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """Distances from ``query`` to each row of ``candidates`` (all of one length)."""
+        pass
+    
+    def _lower_bound(self, query: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """Lower bounds of ``_compute_batch(query, candidates)``; 0 when none is known."""
+        return np.zeros(candidates.shape[0])
+    
+    def _batch_rows(self, query_length: int, candidate_length: int,
+                    memory_budget: Optional[int] = None) -> int:
+        """Number of candidates of one length to compute per ``_compute_batch`` call."""
+        budget = DEFAULT_MEMORY_BUDGET if memory_budget is None else memory_budget
+        return max(1, budget // (8 * 4 * (query_length + candidate_length + 1)))
+    
+    def _as_sequence(self, item: Any) -> np.ndarray:
+        return validate_numeric_array(np.asarray(item), "sequence").astype(np.float64, copy=False)
+    
+    def _parse_sequences(self, data: Any, axis: int = 0) -> Tuple[List[np.ndarray], bool]:
+        """
+        Parse an input into a list of 1-D sequences.
+        
+        Returns:
+            sequences, whether the input was a single sequence
+        """
+        if isinstance(data, (list, tuple)) and any(np.ndim(item) > 0 for item in data):
+            return [self._as_sequence(item).reshape(-1) for item in data], False
+        array = DataParser.parse_single_input(data)
+        if array.ndim == 1:
+            return [self._as_sequence(array)], True
+        if array.ndim != 2:
+            raise InputError(f"Sequences must be 1-D or 2-D input, got {array.ndim} dimensions")
+        rows = array if axis == 0 else array.T
+        return [self._as_sequence(row) for row in rows], False
+    
+    @staticmethod
+    def _group_by_length(sequences: List[np.ndarray]) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Stack sequences of equal length: ``(indices, stacked rows)`` per length."""
+        groups: Dict[int, List[int]] = {}
+        for index, sequence in enumerate(sequences):
+            groups.setdefault(len(sequence), []).append(index)
+        return [(np.array(indices), np.stack([sequences[i] for i in indices]))
+                for indices in groups.values()]
+    
+    def _compute_many(self, query: np.ndarray, groups: List[Tuple[np.ndarray, np.ndarray]],
+                      n: int, memory_budget: Optional[int] = None) -> np.ndarray:
+        """Distances from ``query`` to ``n`` sequences grouped by ``_group_by_length``."""
+        result = np.empty(n)
+        for indices, stacked in groups:
+            block = self._batch_rows(len(query), stacked.shape[1], memory_budget)
+            for start, stop in iter_row_blocks(len(indices), block):
+                result[indices[start:stop]] = self._compute_batch(query, stacked[start:stop])
+        return result
+    
+    def _compute(self, x: np.ndarray, y: np.ndarray) -> float:
+        return float(self._compute_batch(np.ravel(x), np.ravel(y)[None, :])[0])
+    
+    def _compute_one_to_many(self, point: np.ndarray, array: np.ndarray) -> np.ndarray:
+        return self._compute_batch(point, array)
+    
+    def _evaluate(self, x: Any, y: Any, axis: int, condensed: bool = False,
+                  memory_budget: Optional[int] = None,
+                  out: Union[str, Path, np.ndarray, None] = None,
+                  n_jobs: Optional[int] = None, chunk_size: Optional[int] = None,
+                  dtype: Any = None, accumulate: Any = None,
+                  pairwise: bool = False) -> Union[float, np.ndarray]:
+        """
+        Compute distances between sequences (see ``BaseDistance.__call__``).
+        
+        A sequence against a batch gives one distance per sequence; two batches
+        with the same number of sequences give element-wise distances; a single
+        batch gives all pairwise distances, and two batches with ``pairwise=True``
+        all distances between them. Results, including the single distance
+        between two sequences, are converted to ``dtype``; the dynamic programs
+        always run in float64, so ``accumulate``, like ``n_jobs`` and
+        ``chunk_size``, is not supported and raises InputError, as does ``out``
+        for a single distance.
+        """
+        for option, value in (("n_jobs", n_jobs), ("chunk_size", chunk_size), ("accumulate", accumulate)):
+            if value is not None:
+                raise InputError(f"{option} is not supported by sequence metrics such as {self.name}")
+        out_dtype, _ = resolve_dtypes(dtype)
+        xs, x_single = self._parse_sequences(x, axis)
+        
+        if y is None:
+            result = self._compute_pairwise_sequences(xs, condensed, memory_budget)
+        else:
+            ys, y_single = self._parse_sequences(y, axis)
+            if pairwise:
+                if condensed:
+                    raise InputError("Condensed output is only available for distances "
+                                     "within one input")
+                groups = self._group_by_length(ys)
+                result = np.empty((len(xs), len(ys)))
+                for i, query in enumerate(xs):
+                    result[i] = self._compute_many(query, groups, len(ys), memory_budget)
+            elif x_single and y_single:
+                if out is not None:
+                    raise InputError("out= needs an array of distances; two sequences give a single one")
+                return out_dtype.type(self._compute(xs[0], ys[0]))
+            elif x_single or y_single:
+                query, others = (xs[0], ys) if x_single else (ys[0], xs)
+                result = self._compute_many(query, self._group_by_length(others), len(others),
+                                            memory_budget)
+            elif len(xs) == len(ys):
+                result = np.array([self._compute(a, b) for a, b in zip(xs, ys)])
+            else:
+                raise DimensionMismatchError(
+                    f"Cannot compare batches of {len(xs)} and {len(ys)} sequences element-wise "
+                    f"(use pairwise=True for all pairs)"
+                )
+        result = result.astype(out_dtype, copy=False)
+        return result if out is None else store_result(out, result)
+    
+    def _compute_pairwise_sequences(self, sequences: List[np.ndarray], condensed: bool = False,
+                                    memory_budget: Optional[int] = None) -> np.ndarray:
+        """Square or condensed distances between all pairs of ``sequences``."""
+        n = len(sequences)
+        result = allocate_pairwise(n, condensed)
+        groups = self._group_by_length(sequences)
+        for i in range(n - 1):
+            # Sequences after i, as slices of the groups (their indices are sorted)
+            rest = []
+            for indices, stacked in groups:
+                start = np.searchsorted(indices, i, side="right")
+                if start < len(indices):
+                    rest.append((indices[start:] - (i + 1), stacked[start:]))
+            distances = self._compute_many(sequences[i], rest, n - i - 1, memory_budget)
+            if condensed:
+                offset = condensed_offset(n, i)
+                result[offset:offset + n - i - 1] = distances
+            else:
+                result[i, i + 1:] = result[i + 1:, i] = distances
+        return result
+    
+    def knn(self, query: Any, data: Any = None, k: int = 1, exclude_self: Optional[bool] = None,
+            memory_budget: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the exact k nearest sequences, pruning candidates by lower bound.
+        
+        For each query, the lower bounds of all candidates are computed first
+        (vectorized per sequence length). Candidates are then visited in order
+        of increasing bound, and the search stops as soon as the next bound
+        exceeds the current k-th best distance, so the exact (expensive)
+        distance is only computed for candidates that could still qualify.
+        
+        Returns:
+            indices, distances: arrays of shape (n_queries, k), or (k,) for a
+            single query sequence
+        """
+        queries, single = self._parse_sequences(query)
+        self_search = data is None or data is query
+        if exclude_self is None:
+            exclude_self = self_search
+        sequences = queries if self_search else self._parse_sequences(data)[0]
+        n = len(sequences)
+        if isinstance(k, bool) or not isinstance(k, (int, np.integer)) or k < 1:
+            raise InputError(f"k must be a positive integer, got {k!r}")
+        if k > n - int(bool(exclude_self and self_search)):
+            raise InputError(f"k={k} is larger than the number of candidate sequences")
+        
+        groups = self._group_by_length(sequences)
+        indices = np.empty((len(queries), k), dtype=np.intp)
+        distances = np.empty((len(queries), k))
+        for q, sequence in enumerate(queries):
+            bounds = np.empty(n)
+            for group_indices, stacked in groups:
+                bounds[group_indices] = self._lower_bound(sequence, stacked)
+            if exclude_self and self_search:
+                bounds[q] = np.inf
+            indices[q], distances[q] = self._pruned_search(sequence, sequences, bounds, k,
+                                                           memory_budget)
+        if single:
+            return indices[0], distances[0]
+        return indices, distances
+    
+    def _pruned_search(self, query: np.ndarray, sequences: List[np.ndarray], bounds: np.ndarray,
+                       k: int, memory_budget: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Visit candidates by increasing lower bound until none can enter the top k."""
+        order = np.argsort(bounds, kind="stable")
+        order = order[bounds[order] < np.inf]  # Drop the excluded query itself
+        best_i = np.empty(0, dtype=np.intp)
+        best_d = np.empty(0)
+        for start in range(0, len(order), _SEARCH_BATCH):
+            kth = best_d[k - 1] if len(best_d) >= k else np.inf
+            batch = order[start:start + _SEARCH_BATCH]
+            batch = batch[bounds[batch] <= kth]
+            if len(batch) == 0:
+                break
+            groups = self._group_by_length([sequences[i] for i in batch])
+            batch_d = self._compute_many(query, groups, len(batch), memory_budget)
+            best_i = np.concatenate([best_i, batch])
+            best_d = np.concatenate([best_d, batch_d])
+            keep = np.lexsort((best_i, best_d))[:k]
+            best_i, best_d = best_i[keep], best_d[keep]
+        return best_i, best_d
+
+
+class DTWDistance(SequenceDistance):
+    """
+    Dynamic time warping distance, optionally constrained to a Sakoe-Chiba band.
+    
+    The cost of aligning two samples is their squared difference, and the
+    distance is the square root of the cheapest alignment's total cost, so
+    that with ``window=0`` and equal lengths it equals the Euclidean distance.
+    The dynamic program runs along anti-diagonals, whose cells are
+    independent, so each diagonal is one vectorized step for a whole batch of
+    candidates, and only the last two diagonals are kept in memory.
+    
+    Args:
+        window: Sakoe-Chiba band: sample i may only be aligned with samples
+            within ``window`` positions of it (widened to the length difference
+            for sequences of different lengths). None for no constraint.
+    """
+    
+    def __init__(self, window: Optional[int] = None):
+        super().__init__("dtw")
+        valid = isinstance(window, (int, np.integer)) and not isinstance(window, bool)
+        if window is not None and not (valid and window >= 0):
+            raise InputError(f"window must be a non-negative integer or None, got {window!r}")
+        self.window = window
+    
+    def _aux_key(self) -> Any:
+        return (self.name, self.window)
+    
+    def _band(self, n: int, m: int) -> int:
+        if self.window is None:
+            return max(n, m)
+        return max(self.window, abs(n - m))
+    
+    def _compute_batch(self, query: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        n, m = len(query), candidates.shape[1]
+        w = self._band(n, m)
+        b = candidates.shape[0]
+        # diagonals[s % 3][:, i] holds D[i, s - i] for the cumulative cost matrix D
+        diagonals = np.full((3, b, n + 1), np.inf)
+        diagonals[0][:, 0] = 0.0
+        for s in range(2, n + m + 1):
+            lo = max(1, s - m, (s - w + 1) // 2)
+            hi = min(n, s - 1, (s + w) // 2)
+            current, previous = diagonals[s % 3], diagonals[(s - 1) % 3]
+            before = diagonals[(s - 2) % 3]
+            if lo <= hi:
+                i = np.arange(lo, hi + 1)
+                cost = query[i - 1] - candidates[:, s - i - 1]
+                cost *= cost
+                cost += np.minimum(np.minimum(before[:, i - 1], previous[:, i - 1]), previous[:, i])
+                current[:, lo:hi + 1] = cost
+            # Cells next to the band may hold values from three diagonals ago
+            current[:, lo - 1] = np.inf
+            if hi + 1 <= n:
+                current[:, hi + 1] = np.inf
+        return np.sqrt(diagonals[(n + m) % 3][:, n])
+    
+    def _envelope(self, query: np.ndarray, w: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Running maximum and minimum of ``query`` over windows of +-w samples."""
+        if w >= len(query) - 1:
+            return np.full(len(query), query.max()), np.full(len(query), query.min())
+        upper = sliding_window_view(np.pad(query, w, constant_values=-np.inf), 2 * w + 1).max(axis=1)
+        lower = sliding_window_view(np.pad(query, w, constant_values=np.inf), 2 * w + 1).min(axis=1)
+        return upper, lower
+    
+    def _lower_bound(self, query: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """
+        The larger of LB_Kim and (for equal lengths) LB_Keogh.
+        
+        LB_Kim: the first and the last samples are aligned by every warping
+        path. LB_Keogh: every candidate sample is aligned with a query sample
+        within the band, so it costs at least its distance to the band's
+        running maximum/minimum of the query.
+        """
+        first = query[0] - candidates[:, 0]
+        last = query[-1] - candidates[:, -1]
+        kim = first * first
+        if len(query) + candidates.shape[1] > 2:
+            kim += last * last
+        if candidates.shape[1] != len(query):
+            return np.sqrt(kim)
+        upper, lower = self._envelope(query, self._band(len(query), len(query)))
+        excess = np.maximum(candidates - upper, 0.0) + np.maximum(lower - candidates, 0.0)
+        keogh = np.einsum('ij,ij->i', excess, excess)
+        return np.sqrt(np.maximum(kim, keogh))
+
+
+class LevenshteinDistance(SequenceDistance):
+    """
+    Levenshtein (edit) distance: the fewest insertions, deletions and substitutions.
+    
+    Strings are compared character by character, other sequences element by
+    element. The dynamic program runs one query position at a time for a whole
+    batch of candidates; within a row, insertions are resolved with a running
+    minimum instead of a loop over the candidate positions.
+    """
+    
+    def __init__(self):
+        super().__init__("levenshtein")
+    
+    def _as_sequence(self, item: Any) -> np.ndarray:
+        if isinstance(item, str):
+            if not item:
+                return np.empty(0, dtype=np.uint32)
+            return np.frombuffer(item.encode("utf-32-le"), dtype=np.uint32)
+        return super()._as_sequence(item)
+    
+    def _parse_sequences(self, data: Any, axis: int = 0) -> Tuple[List[np.ndarray], bool]:
+        if isinstance(data, str):
+            return [self._as_sequence(data)], True
+        if isinstance(data, (list, tuple)) and any(isinstance(item, str) for item in data):
+            return [self._as_sequence(item).reshape(-1) for item in data], False
+        return super()._parse_sequences(data, axis)
+    
+    def _compute_batch(self, query: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        m = candidates.shape[1]
+        offsets = np.arange(m + 1)
+        row = np.tile(offsets, (candidates.shape[0], 1))
+        step = np.empty_like(row)
+        for i, value in enumerate(query, start=1):
+            step[:, 0] = i
+            np.minimum(row[:, 1:] + 1, row[:, :-1] + (candidates != value), out=step[:, 1:])
+            # D[i, j] = min over k <= j of (step[k] + j - k): a running minimum
+            row = np.minimum.accumulate(step - offsets, axis=1) + offsets
+        return row[:, m].astype(np.float64)
+    
+    def _lower_bound(self, query: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+        """At least the length difference must be inserted or deleted."""
+        return np.full(candidates.shape[0], float(abs(len(query) - candidates.shape[1])))
+
+
+# Create singleton instances
+dtw = DTWDistance()
+levenshtein = LevenshteinDistance()
@@ -0,0 +1,66 @@
+"""Test angular distance implementations."""
+
+import pytest
+import numpy as np
+from distancepy import (
+    angular_distance,
+    cosine_distance,
+    cosine_similarity,
+    knn,
+    prepare,
+    radius_neighbors,
+)
+from distancepy.core.exceptions import InputError
+from distancepy.metrics import METRICS
+from distancepy.metrics.angular import cosine, cosine_similarity as similarity_metric
+from distancepy.utils import DistanceMatrix, LazyDistanceMatrix
+
+
+def _reference_similarity(x, y):
+    return np.array([[a @ b / (np.linalg.norm(a) * np.linalg.norm(b)) for b in y] for a in x])
+
+
+def test_cosine_point_to_point():
+    """Test basic cosine metrics between two points."""
+    assert abs(cosine_distance([1, 0], [0, 1]) - 1.0) < 1e-10
+    assert abs(cosine_similarity([1, 1], [2, 2]) - 1.0) < 1e-10
+    assert abs(angular_distance([1, 0], [-1, 0]) - 1.0) < 1e-10
+
+
+def test_cosine_pairwise_matches_reference():
+    """Test blocked pairwise and point-to-array cosine distances."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(50, 16))
+    expected = 1 - _reference_similarity(data, data)
+    np.fill_diagonal(expected, 0)
+    result = cosine_distance(data, memory_budget=8192)
+    np.testing.assert_allclose(result, expected, atol=1e-10)
+    np.testing.assert_array_equal(result, result.T)
+    np.testing.assert_allclose(cosine_distance(data[3], data), expected[3], atol=1e-10)
+    np.testing.assert_allclose(cosine_distance(prepare(data, metric=cosine), condensed=True),
+                               expected[np.triu_indices(50, 1)], atol=1e-10)
+
+
+def test_cosine_zero_vectors():
+    """Test that zero vectors are handled without NaN."""
+    data = np.array([[0.0, 0.0], [1.0, 0.0], [0.0, 0.0]])
+    result = cosine_distance(data)
+    np.testing.assert_array_almost_equal(result, [[0, 1, 0], [1, 0, 1], [0, 1, 0]])
+    np.testing.assert_array_almost_equal(cosine_similarity(data), 1 - result)
+    assert cosine_distance([0, 0], [0, 0]) == 0.0
+
+
+def test_similarity_is_not_a_ranking_metric():
+    """Test that cosine similarity cannot be used where distances are ranked."""
+    data = np.random.default_rng(0).normal(size=(20, 3))
+    assert "cosine_similarity" not in METRICS
+    for metric in ("cosine_similarity", similarity_metric):
+        with pytest.raises(InputError):
+            knn(data[0], data, k=3, metric=metric)
+        with pytest.raises(InputError):
+            radius_neighbors(data, data, r=0.5, metric=metric)
+        with pytest.raises(InputError):
+            DistanceMatrix(data, metric=metric)
+        with pytest.raises(InputError):
+            LazyDistanceMatrix(data, metric=metric)
+    assert knn(data[0], data, k=1, metric="cosine")[0][0] == 0
@@ -2,7 +2,8 @@
 
 import pytest
 import numpy as np
-from distancepy import euclidean_distance
+from distancepy import cdist, cosine_distance, dtw_distance, euclidean_distance, kl_divergence
+from distancepy.core.exceptions import DimensionMismatchError, InputError
 
 
 def test_point_to_point():
@@ -31,3 +32,125 @@ def test_point_to_array():
     expected = np.array([5, 10, 0])
     np.testing.assert_array_almost_equal(result, expected)
 
+
+
+def test_pairwise_condensed():
+    """Test condensed pairwise output uses the row-major upper triangle."""
+    points = [[0, 0], [3, 4], [6, 8]]
+    result = euclidean_distance(points, condensed=True)
+    np.testing.assert_array_almost_equal(result, [5, 10, 5])
+
+
+def test_pairwise_blocked_matches_single_tile():
+    """Test that a tiny memory budget gives the same result as one tile."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(57, 3))
+    full = euclidean_distance(data)
+    blocked = euclidean_distance(data, memory_budget=2048)
+    np.testing.assert_allclose(blocked, full, atol=1e-12)
+    condensed = euclidean_distance(data, condensed=True, memory_budget=2048)
+    np.testing.assert_allclose(condensed, full[np.triu_indices(57, 1)], atol=1e-12)
+    np.testing.assert_allclose(euclidean_distance(data[0], data, memory_budget=256),
+                               full[0], atol=1e-12)
+
+
+def test_point_to_file_streaming(tmp_path):
+    """Test streaming point-to-file distances block by block."""
+    path = tmp_path / "points.csv"
+    path.write_text("x,y\n3,4\n6,8\n0,0\n5,12\n")
+    result = euclidean_distance([0, 0], path, chunk_size=3)
+    np.testing.assert_array_almost_equal(result, [5, 10, 0, 13])
+    np.testing.assert_array_almost_equal(euclidean_distance(path, [0, 0], chunk_size=1), result)
+
+
+def test_file_streaming_keeps_argument_order(tmp_path):
+    """Test that streaming a non-symmetric metric matches the unchunked call in both orders."""
+    rng = np.random.default_rng(3)
+    rows, p = rng.random(size=(5, 4)), rng.random(4)
+    path = tmp_path / "rows.csv"
+    np.savetxt(path, rows, delimiter=",")
+    np.testing.assert_allclose(kl_divergence(path, p, chunk_size=2), kl_divergence(rows, p))
+    np.testing.assert_allclose(kl_divergence(p, path, chunk_size=2), kl_divergence(p, rows))
+    assert not np.allclose(kl_divergence(rows, p), kl_divergence(p, rows))
+
+
+def test_integer_memmap_input(tmp_path):
+    """Test that integer memory-mapped inputs are converted block by block."""
+    data = np.array([[0, 0], [3, 4], [250, 0]], dtype=np.uint8)
+    np.save(tmp_path / "points.npy", data)
+    result = euclidean_distance(tmp_path / "points.npy", memory_budget=64)
+    np.testing.assert_array_almost_equal(result, euclidean_distance(data.astype(float)))
+    np.testing.assert_array_almost_equal(euclidean_distance([0, 0], tmp_path / "points.npy"), [0, 5, 250])
+
+
+def test_float32_compute():
+    """Test float32 inputs, results and configurable accumulation."""
+    rng = np.random.default_rng(3)
+    data = rng.normal(size=(40, 8))
+    reference = euclidean_distance(data)
+    
+    single = euclidean_distance(data, dtype=np.float32)
+    assert single.dtype == np.float32
+    np.testing.assert_allclose(single, reference, atol=1e-4)
+    
+    accumulated = euclidean_distance(data, dtype=np.float32, accumulate=np.float64, memory_budget=4096)
+    assert accumulated.dtype == np.float32
+    np.testing.assert_allclose(accumulated, reference, atol=1e-5)
+    
+    row = euclidean_distance(data[0], data, dtype=np.float32)
+    assert row.dtype == np.float32
+    np.testing.assert_allclose(row, reference[0], atol=1e-4)
+
+
+def test_cross_distances():
+    """Test M x N cross distances against a per-pair reference."""
+    rng = np.random.default_rng(3)
+    x, y = rng.normal(size=(23, 4)), rng.normal(size=(31, 4))
+    expected = np.sqrt(((x[:, None, :] - y[None, :, :]) ** 2).sum(axis=-1))
+    np.testing.assert_allclose(euclidean_distance(x, y, pairwise=True), expected, atol=1e-12)
+    np.testing.assert_allclose(cdist(x, y, memory_budget=2048), expected, atol=1e-12)
+    np.testing.assert_allclose(cdist(x.T, y.T, axis=1), expected, atol=1e-12)
+    np.testing.assert_allclose(cdist(x[0], y), expected[:1], atol=1e-12)
+    
+    cosine = 1 - (x @ y.T) / np.outer(np.linalg.norm(x, axis=1), np.linalg.norm(y, axis=1))
+    np.testing.assert_allclose(cosine_distance(x, y, pairwise=True), cosine, atol=1e-12)
+    # Non-symmetric metrics keep the argument order
+    p, q = rng.random(size=(5, 6)), rng.random(size=(7, 6))
+    np.testing.assert_allclose(cdist(p, q, "kl_divergence"),
+                               np.array([[kl_divergence(a, b) for b in q] for a in p]))
+    sequences = [[0.0, 1.0, 2.0], [1.0, 3.0], [2.0, 2.0, 0.0, 1.0]]
+    np.testing.assert_allclose(dtw_distance(sequences[:2], sequences, pairwise=True),
+                               [[dtw_distance(a, b) for b in sequences] for a in sequences[:2]])
+
+
+def test_cross_distances_to_npy_and_parallel(tmp_path):
+    """Test tiled cross distances written to a file and computed across processes."""
+    rng = np.random.default_rng(4)
+    x, y = rng.normal(size=(40, 3)), rng.normal(size=(25, 3))
+    serial = cdist(x, y, memory_budget=2048)
+    np.testing.assert_array_equal(cdist(x, y, memory_budget=2048, n_jobs=2), serial)
+    cdist(x, y, memory_budget=2048, out=tmp_path / "cross.npy")
+    np.testing.assert_array_equal(np.load(tmp_path / "cross.npy"), serial)
+
+
+def test_shape_mismatch_raises():
+    """Test that mismatched shapes raise instead of being truncated."""
+    with pytest.raises(DimensionMismatchError):
+        euclidean_distance([[1, 2], [3, 4]], [[1, 2], [3, 4], [5, 6]])
+    with pytest.raises(DimensionMismatchError):
+        cdist([[1, 2], [3, 4]], [[1, 2, 3]])
+    with pytest.raises(InputError):
+        cdist([[1, 2], [3, 4]], [[1, 2]], condensed=True)
+
+
+@pytest.mark.parametrize("point, array", [([1, 2], [[1], [2], [3]]), ([1, 2, 3], [[1, 2]])])
+def test_point_length_mismatch_raises(point, array):
+    """Test that a point and an array with different dimensions raise in both orders."""
+    with pytest.raises(DimensionMismatchError):
+        euclidean_distance(point, array)
+    with pytest.raises(DimensionMismatchError):
+        euclidean_distance(array, point)
+    with pytest.raises(DimensionMismatchError):
+        euclidean_distance(point, np.asarray(array).T, axis=1)
+    with pytest.raises(DimensionMismatchError):
+        kl_divergence(array, point)
@@ -0,0 +1,96 @@
+"""Test bit-packed binary distance implementations."""
+
+import numpy as np
+import pytest
+import tracemalloc
+from distancepy import (
+    dice_distance,
+    hamming_distance,
+    jaccard_distance,
+    knn,
+    pack_bits,
+    PackedBits,
+)
+from distancepy.core.exceptions import DimensionMismatchError
+
+
+def _reference(x, y):
+    x, y = x.astype(bool), y.astype(bool)
+    inter = (x[:, None, :] & y[None, :, :]).sum(-1)
+    union = (x[:, None, :] | y[None, :, :]).sum(-1)
+    counts_sum = x.sum(1)[:, None] + y.sum(1)[None, :]
+    hamming = (x[:, None, :] != y[None, :, :]).mean(-1)
+    jaccard = np.where(union > 0, 1 - inter / np.maximum(union, 1), 0.0)
+    dice = np.where(counts_sum > 0, 1 - 2 * inter / np.maximum(counts_sum, 1), 0.0)
+    return hamming, jaccard, dice
+
+
+def test_binary_point_to_point():
+    """Test binary metrics between two vectors."""
+    assert hamming_distance([1, 0, 1, 1], [1, 1, 1, 0]) == 0.5
+    assert abs(jaccard_distance([1, 1, 0, 0], [1, 0, 1, 0]) - 2 / 3) < 1e-12
+    assert dice_distance([1, 1, 0, 0], [1, 0, 1, 0]) == 0.5
+    assert jaccard_distance([0, 0, 0], [0, 0, 0]) == 0.0
+    assert dice_distance([0, 0, 0], [0, 0, 0]) == 0.0
+
+
+def test_binary_pairwise_matches_reference():
+    """Test blocked pairwise, point-to-array and row-wise distances, odd bit lengths included."""
+    rng = np.random.default_rng(0)
+    data = (rng.random((60, 133)) < 0.3).astype(np.uint8)
+    data[5] = 0
+    hamming, jaccard, dice = _reference(data, data)
+    
+    np.testing.assert_allclose(hamming_distance(data, memory_budget=4096), hamming)
+    np.testing.assert_allclose(jaccard_distance(data), jaccard)
+    np.testing.assert_allclose(dice_distance(data, condensed=True), dice[np.triu_indices(60, 1)])
+    np.testing.assert_allclose(jaccard_distance(data[3], data), jaccard[3])
+    np.testing.assert_allclose(hamming_distance(data, data[::-1]),
+                               np.diag(_reference(data, data[::-1])[0]))
+    np.testing.assert_allclose(jaccard_distance(data.T, axis=1), jaccard)
+
+
+def test_packed_input_is_used_directly():
+    """Test that PackedBits (including uint64 words) give the same results as raw input."""
+    rng = np.random.default_rng(1)
+    data = (rng.random((40, 256)) < 0.5).astype(np.uint8)
+    packed = pack_bits(data)
+    assert packed.array.nbytes == data.size // 8
+    np.testing.assert_array_equal(packed.unpack(), data)
+    expected = jaccard_distance(data)
+    np.testing.assert_array_equal(jaccard_distance(packed), expected)
+    words = PackedBits(np.packbits(data, axis=1).view(np.uint64))
+    assert words.n_bits == 256
+    np.testing.assert_array_equal(jaccard_distance(words), expected)
+    np.testing.assert_array_equal(jaccard_distance(packed, data), np.diag(expected))
+
+
+def test_binary_errors_and_neighbors():
+    """Test length checks and nearest-neighbour search on packed inputs."""
+    with pytest.raises(DimensionMismatchError):
+        hamming_distance([1, 0, 1], [1, 0, 1, 1])
+    data = np.array([[1, 1, 0, 0], [1, 1, 1, 0], [0, 0, 1, 1]])
+    indices, distances = knn(pack_bits(data), k=1, metric="jaccard")
+    np.testing.assert_array_equal(indices[:, 0], [1, 0, 1])
+    np.testing.assert_allclose(distances[:, 0], [1 / 3, 1 / 3, 3 / 4])
+
+
+def test_pack_bits_makes_no_float_copy(tmp_path):
+    """Test that boolean arrays and files are packed without a float64 copy."""
+    rng = np.random.default_rng(2)
+    data = rng.random((2048, 1024)) < 0.5
+    tracemalloc.start()
+    try:
+        packed = pack_bits(data)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < data.nbytes  # A float64 copy alone would take 8 * data.nbytes
+    np.testing.assert_array_equal(packed.unpack(), data)
+    
+    counts = np.array([[0, 2, 1], [3, 0, 0]])  # Non-zero integers become 1
+    np.testing.assert_array_equal(pack_bits(counts).unpack(), counts != 0)
+    path = tmp_path / "bits.csv"
+    np.savetxt(path, data[:100].astype(int), fmt="%d", delimiter=",")
+    np.testing.assert_array_equal(pack_bits(str(path)).array, pack_bits(data[:100]).array)
+    np.testing.assert_array_equal(jaccard_distance(str(path), axis=1), jaccard_distance(data[:100].T))
@@ -0,0 +1,86 @@
+"""Test distribution and information-theoretic distance implementations."""
+
+import numpy as np
+import pytest
+from distancepy import (
+    bhattacharyya_distance,
+    hellinger_distance,
+    jensen_shannon_distance,
+    kl_divergence,
+    prepare,
+    wasserstein_distance,
+)
+from distancepy.core.exceptions import InputError
+from distancepy.metrics.information import kl_divergence as kl_metric
+
+
+def _histograms(n=40, bins=12, seed=0):
+    rng = np.random.default_rng(seed)
+    counts = rng.integers(0, 20, size=(n, bins)).astype(float)
+    counts[:, 0] += 1  # No empty rows
+    return counts
+
+
+def _probabilities(counts, eps):
+    p = np.maximum(counts, eps)
+    return p / p.sum(axis=1, keepdims=True)
+
+
+def test_kl_divergence_matches_reference_and_is_directional():
+    """Test blocked pairwise KL against a per-pair reference, in both directions."""
+    counts = _histograms()
+    p = _probabilities(counts, 1e-10)
+    expected = np.array([[np.sum(a * np.log(a / b)) for b in p] for a in p])
+    result = kl_divergence(counts, memory_budget=4096)
+    np.testing.assert_allclose(result, expected, atol=1e-9)
+    assert not np.allclose(result, result.T)
+    np.testing.assert_allclose(kl_divergence(counts[2], counts), expected[2], atol=1e-9)
+    np.testing.assert_allclose(kl_divergence(counts, counts[2]), expected[:, 2], atol=1e-9)
+    np.testing.assert_allclose(kl_divergence(counts, counts[::-1]),
+                               np.diag(expected[:, ::-1]), atol=1e-9)
+    np.testing.assert_allclose(kl_divergence(prepare(counts, metric=kl_metric)), result)
+    with pytest.raises(InputError):
+        kl_divergence(counts, condensed=True)
+
+
+def test_kl_divergence_epsilon():
+    """Test zero-probability handling with and without a floor."""
+    assert kl_divergence([1, 0], [1, 0], eps=0) == 0.0
+    assert kl_divergence([1, 1], [1, 0], eps=0) == np.inf
+    assert np.isfinite(kl_divergence([1, 1], [1, 0]))
+    with pytest.raises(InputError):
+        kl_divergence([1, -1], [1, 1])
+
+
+def test_symmetric_distribution_metrics_match_reference():
+    """Test Jensen-Shannon, Hellinger and Bhattacharyya against per-pair formulas."""
+    counts = _histograms(seed=1)
+    counts[3, 1:] = 0
+    p = _probabilities(counts, 0)
+    m = 0.5 * (p[:, None, :] + p[None, :, :])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        def kl(a, b):
+            return np.where(a > 0, a * np.log(a / b), 0).sum(-1)
+        js = np.sqrt(np.maximum(0.5 * kl(p[:, None, :], m) + 0.5 * kl(p[None, :, :], m), 0))
+    coefficient = np.sqrt(p[:, None, :] * p[None, :, :]).sum(-1)
+    
+    result = jensen_shannon_distance(counts, eps=0, memory_budget=4096)
+    np.testing.assert_allclose(result, js, atol=1e-7)
+    np.testing.assert_array_equal(result, result.T)
+    np.testing.assert_allclose(hellinger_distance(counts, condensed=True),
+                               np.sqrt(np.maximum(1 - coefficient, 0))[np.triu_indices(40, 1)],
+                               atol=1e-7)
+    np.testing.assert_allclose(bhattacharyya_distance(counts[0], counts),
+                               -np.log(np.minimum(coefficient[0], 1)), atol=1e-12)
+    assert np.all(np.diag(hellinger_distance(counts)) == 0)
+
+
+def test_wasserstein_distance():
+    """Test 1-D Wasserstein distances between rows of samples."""
+    rng = np.random.default_rng(2)
+    samples = rng.normal(size=(30, 50)) + np.arange(30)[:, None]
+    ordered = np.sort(samples, axis=1)
+    expected = np.abs(ordered[:, None, :] - ordered[None, :, :]).mean(-1)
+    np.testing.assert_allclose(wasserstein_distance(samples), expected, atol=1e-12)
+    np.testing.assert_allclose(wasserstein_distance(samples[4], samples), expected[4], atol=1e-12)
+    assert wasserstein_distance([0, 1, 3], [5, 6, 8]) == 5.0
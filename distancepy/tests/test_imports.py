@@ -0,0 +1,68 @@
+"""Test that importing the package is fast and loads dependencies lazily."""
+
+import subprocess
+import sys
+import textwrap
+
+# Upper bound for ``import distancepy`` in a fresh interpreter, in seconds.
+IMPORT_BUDGET = 0.1
+
+
+def _run(code):
+    result = subprocess.run([sys.executable, "-c", textwrap.dedent(code)],
+                            capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_import_stays_within_budget():
+    """Benchmark ``import distancepy`` (best of three fresh interpreters)."""
+    code = """
+        import time
+        start = time.perf_counter()
+        import distancepy
+        print(time.perf_counter() - start)
+    """
+    elapsed = min(float(_run(code)[0]) for _ in range(3))
+    assert elapsed < IMPORT_BUDGET
+
+
+def test_pandas_and_metrics_load_on_first_use(tmp_path):
+    """Test that pandas is only imported when a file is parsed."""
+    path = tmp_path / "points.csv"
+    path.write_text("1,2\n3,4\n")
+    code = f"""
+        import sys
+        import distancepy
+        print("pandas" in sys.modules, "distancepy.metrics" in sys.modules)
+        distancepy.euclidean_distance([[1, 2], [3, 4]])
+        print("pandas" in sys.modules, "distancepy.metrics.numeric" in sys.modules)
+        distancepy.euclidean_distance({str(path)!r})
+        print("pandas" in sys.modules)
+    """
+    assert _run(code) == ["False", "False", "False", "True", "True"]
+
+
+def test_euclidean_loads_only_its_metric():
+    """Test that a Euclidean call loads neither other metrics, asyncio nor process pools."""
+    code = """
+        import sys
+        import distancepy
+        distancepy.euclidean_distance([[1, 2], [3, 4]], [[0, 0]], pairwise=True)
+        for module in ("distancepy.metrics.structural", "distancepy.metrics.categorical",
+                       "distancepy.metrics.angular", "asyncio", "concurrent.futures.process"):
+            print(module in sys.modules)
+    """
+    assert _run(code) == ["False"] * 5
+
+
+def test_lazy_metric_names():
+    """Test that metric instances and submodules keep their own names after lazy imports."""
+    code = """
+        import types
+        import distancepy.metrics.angular as angular_module
+        import distancepy.metrics.categorical
+        from distancepy import metrics
+        print(isinstance(angular_module, types.ModuleType), isinstance(metrics.categorical, types.ModuleType),
+              type(metrics.angular_metric).__name__, metrics.get_metric("angular") is metrics.angular_metric)
+    """
+    assert _run(code) == ["True", "True", "AngularDistance", "True"]
@@ -0,0 +1,100 @@
+"""Test Mahalanobis and learned linear-map distances."""
+
+import numpy as np
+import pytest
+from distancepy import (
+    LinearMapDistance,
+    MahalanobisDistance,
+    load_metric,
+    mahalanobis_distance,
+    prepare,
+)
+from distancepy.core.exceptions import DimensionMismatchError, FileFormatError, InputError
+
+
+def _points(n=30, d=4, seed=0):
+    rng = np.random.default_rng(seed)
+    mixing = rng.normal(size=(d, d))
+    return rng.normal(size=(n, d)) @ mixing
+
+
+def _quadratic(x, y, inverse):
+    diff = x - y
+    return float(np.sqrt(diff @ inverse @ diff))
+
+
+def test_mahalanobis_matches_quadratic_form():
+    """Test pairwise, row-wise and point results against the explicit quadratic form."""
+    data = _points()
+    covariance = np.cov(data, rowvar=False)
+    inverse = np.linalg.inv(covariance)
+    expected = np.array([[_quadratic(a, b, inverse) for b in data] for a in data])
+    
+    metric = MahalanobisDistance(covariance)
+    np.testing.assert_allclose(metric(data, memory_budget=4096), expected, atol=1e-9)
+    np.testing.assert_allclose(metric(data[:5], data[5:10]), np.diag(expected[:5, 5:10]), atol=1e-9)
+    np.testing.assert_allclose(metric(data[3], data), expected[3], atol=1e-9)
+    assert metric(data[0], data[1]) == pytest.approx(expected[0, 1])
+    # Without a covariance, it is estimated from the call's own inputs
+    np.testing.assert_allclose(mahalanobis_distance(data), expected, atol=1e-9)
+    np.testing.assert_allclose(mahalanobis_distance(data.T, axis=1), expected, atol=1e-9)
+
+
+def test_fit_from_file_and_save_load_round_trip(tmp_path):
+    """Test fitting from a CSV file and persisting the fitted transform."""
+    data = _points(seed=1)
+    path = tmp_path / "train.csv"
+    np.savetxt(path, data, delimiter=",")
+    
+    metric = MahalanobisDistance().fit(str(path))
+    np.testing.assert_allclose(metric.covariance, np.cov(data, rowvar=False), atol=1e-9)
+    np.testing.assert_allclose(metric.transform, np.tril(metric.transform))
+    
+    metric.save(tmp_path / "metric.npz")
+    loaded = load_metric(tmp_path / "metric.npz")
+    assert isinstance(loaded, MahalanobisDistance)
+    np.testing.assert_allclose(loaded(data), metric(data), atol=1e-12)
+    
+    linear = LinearMapDistance([[2.0, 0.0, 0.0, 0.0]])
+    linear.save(tmp_path / "linear.npz")
+    assert load_metric(tmp_path / "linear.npz")(data[0], data[1]) == pytest.approx(
+        2 * abs(data[0, 0] - data[1, 0]))
+    
+    with pytest.raises(FileFormatError):
+        load_metric(path)
+
+
+def test_prepared_inputs_are_mapped_once():
+    """Test that a prepared input caches its mapped rows per transform."""
+    data = _points(seed=2)
+    prepared = prepare(data)
+    first = MahalanobisDistance().fit(data)
+    second = MahalanobisDistance(regularization=1.0).fit(data)
+    
+    result = first(prepared)
+    mapped = prepared.aux(first)
+    np.testing.assert_allclose(result, first(data), atol=1e-12)
+    np.testing.assert_allclose(first(prepared), result)
+    assert prepared.aux(first) is mapped
+    assert not np.allclose(second(prepared), result)
+
+
+def test_learned_metric_errors():
+    """Test dimension mismatches, singular covariances and unfitted maps."""
+    data = _points(n=10, d=3)
+    metric = MahalanobisDistance().fit(data)
+    with pytest.raises(DimensionMismatchError):
+        metric(data[:, :2])
+    with pytest.raises(DimensionMismatchError):
+        metric(data, np.ones(4))
+    
+    singular = np.column_stack([data[:, 0], data[:, 0], data[:, 1]])
+    with pytest.raises(InputError):
+        MahalanobisDistance().fit(singular)
+    regularized = MahalanobisDistance(regularization=1e-6).fit(singular)
+    assert np.isfinite(regularized(singular)).all()
+    
+    with pytest.raises(InputError):
+        LinearMapDistance()(data)
+    with pytest.raises(InputError):
+        mahalanobis_distance(data[0], data[1])
@@ -0,0 +1,146 @@
+"""Test incrementally updated distance matrices."""
+
+import pytest
+import numpy as np
+import tracemalloc
+from distancepy import euclidean_distance, kl_divergence
+from distancepy.core.base import BaseDistance
+from distancepy.core.exceptions import DimensionMismatchError, InputError
+from distancepy.utils import DistanceMatrix, LazyDistanceMatrix
+
+
+class ShiftedDistance(BaseDistance):
+    """A non-symmetric test metric that is not zero between a point and itself."""
+    
+    symmetric = False
+    
+    def __init__(self):
+        super().__init__("shifted")
+    
+    def _compute(self, x, y):
+        return float(np.sum(np.abs(x - y)) + np.sum(x))
+
+
+@pytest.mark.parametrize("condensed", [False, True])
+def test_append_and_delete_match_full_recomputation(condensed):
+    """Test that a sequence of updates gives the same matrix as recomputing it."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(10, 3))
+    matrix = DistanceMatrix(data, condensed=condensed)
+    for step in range(6):
+        new = rng.normal(size=(int(rng.integers(1, 15)), 3))
+        np.testing.assert_array_equal(matrix.append(new), np.arange(len(data), len(data) + len(new)))
+        data = np.vstack([data, new])
+        removed = rng.choice(len(data), size=int(rng.integers(0, 8)), replace=False)
+        matrix.delete(removed)
+        data = np.delete(data, removed, axis=0)
+        assert len(matrix) == len(data)
+        np.testing.assert_array_equal(matrix.data, data)
+        np.testing.assert_allclose(matrix.toarray(), euclidean_distance(data), atol=1e-12)
+    if condensed:
+        rows, columns = np.tril_indices(len(data), -1)
+        np.testing.assert_allclose(matrix.distances, euclidean_distance(data)[rows, columns],
+                                   atol=1e-12)
+
+
+def test_capacity_doubles_and_shrinks():
+    """Test amortized growth and shrinking of the buffers."""
+    matrix = DistanceMatrix()
+    for value in range(40):
+        matrix.append([value, 0.0])
+    assert matrix.capacity == 64
+    assert matrix.distances[39, 0] == 39.0
+    matrix.delete(np.arange(30))
+    assert matrix.capacity == 32
+    np.testing.assert_array_equal(matrix.data[:, 0], np.arange(30, 40))
+    np.testing.assert_allclose(matrix.distances, euclidean_distance(matrix.data), atol=1e-12)
+
+
+def test_delete_moves_square_storage_in_place():
+    """Test that deleting points allocates no copy of the distances."""
+    rng = np.random.default_rng(5)
+    data = rng.normal(size=(600, 2))
+    matrix = DistanceMatrix(data)
+    removed = [0, 1, 250, 599]
+    tracemalloc.start()
+    try:
+        matrix.delete(removed)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert peak < matrix.distances.nbytes // 10  # Fancy indexing copied the whole matrix
+    np.testing.assert_allclose(matrix.distances, euclidean_distance(np.delete(data, removed, axis=0)),
+                               atol=1e-12)
+
+
+def test_non_symmetric_metric():
+    """Test that both off-diagonal blocks are computed for non-symmetric metrics."""
+    rng = np.random.default_rng(1)
+    data = rng.random(size=(12, 5))
+    matrix = DistanceMatrix(data[:7], metric="kl_divergence")
+    matrix.append(data[7:])
+    np.testing.assert_allclose(matrix.distances, kl_divergence(data), atol=1e-12)
+    with pytest.raises(InputError):
+        DistanceMatrix(data, metric="kl_divergence", condensed=True)
+
+
+def test_invalid_updates():
+    """Test dimension and index errors."""
+    matrix = DistanceMatrix([[0, 0], [1, 1]])
+    with pytest.raises(DimensionMismatchError):
+        matrix.append([1, 2, 3])
+    with pytest.raises(InputError):
+        matrix.delete([2])
+
+
+def test_lazy_matrix_rows_match_pairwise():
+    """Test rows, row slices, lists, columns and entries against the full matrix."""
+    rng = np.random.default_rng(2)
+    data = rng.normal(size=(50, 4))
+    expected = euclidean_distance(data)
+    matrix = LazyDistanceMatrix(data, memory_budget=2048)
+    assert matrix.shape == (50, 50)
+    np.testing.assert_allclose(matrix[7], expected[7], atol=1e-12)
+    np.testing.assert_allclose(matrix[-1], expected[-1], atol=1e-12)
+    np.testing.assert_allclose(matrix[10:30:3], expected[10:30:3], atol=1e-12)
+    np.testing.assert_allclose(matrix[[4, 2, 4], 5:9], expected[[4, 2, 4], 5:9], atol=1e-12)
+    assert matrix[3, 9] == pytest.approx(expected[3, 9])
+    assert matrix[9, 7] == pytest.approx(expected[9, 7])  # From the cached row 7
+    assert matrix[5, 5] == 0.0
+    np.testing.assert_allclose(np.asarray(matrix), expected, atol=1e-12)
+    
+    kl = LazyDistanceMatrix(rng.random(size=(20, 6)), metric="kl_divergence")
+    np.testing.assert_allclose(kl[2:5], kl.toarray()[2:5], atol=1e-12)
+    with pytest.raises(IndexError):
+        matrix[50]
+    with pytest.raises(IndexError):
+        matrix[1, 2, 3]
+
+
+def test_lazy_matrix_cache_is_bounded():
+    """Test that cached rows are reused and evicted under the memory cap."""
+    data = np.random.default_rng(3).normal(size=(100, 3))
+    matrix = LazyDistanceMatrix(data, cache_bytes=10 * 100 * 8)
+    matrix[:10]
+    first = matrix[0]
+    assert matrix.cache_info().hits == 1
+    matrix[10:20]
+    info = matrix.cache_info()
+    assert info.entries == 10 and info.current_bytes <= info.max_bytes
+    assert info.evictions == 10
+    np.testing.assert_allclose(matrix[0], first, atol=1e-12)  # Recomputed after eviction
+    
+    matrix.clear_cache()
+    matrix[3, 4]
+    assert matrix.cache_info().misses == 1  # One lookup, one miss
+
+
+def test_lazy_matrix_diagonal_matches_toarray():
+    """Test that diagonal entries are computed, not assumed to be zero."""
+    data = np.random.default_rng(4).random(size=(8, 3))
+    matrix = LazyDistanceMatrix(data, metric=ShiftedDistance(), memory_budget=256)
+    expected = matrix.toarray()
+    assert np.all(np.diag(expected) > 0)
+    np.testing.assert_allclose(matrix[2:6], expected[2:6])
+    assert matrix[5, 5] == pytest.approx(expected[5, 5])
+    assert matrix[6, 6] == pytest.approx(expected[6, 6])  # Not cached
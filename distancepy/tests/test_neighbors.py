@@ -0,0 +1,83 @@
+"""Test neighbour queries."""
+
+import pytest
+import numpy as np
+from distancepy import euclidean_distance, knn, prepare, radius_neighbors
+from distancepy.core.exceptions import DimensionMismatchError, InputError
+
+
+def _brute_force_knn(queries, data, k, exclude_self=False):
+    distances = euclidean_distance(np.vstack([queries, data]))[:len(queries), len(queries):]
+    if exclude_self:
+        np.fill_diagonal(distances, np.inf)
+    order = np.argsort(distances, axis=1, kind="stable")[:, :k]
+    return order, np.take_along_axis(distances, order, axis=1)
+
+
+def test_knn_matches_brute_force():
+    """Test blocked kNN against a full distance matrix."""
+    rng = np.random.default_rng(0)
+    queries = rng.normal(size=(25, 3))
+    data = rng.normal(size=(70, 3))
+    indices, distances = knn(queries, data, k=4, memory_budget=4096)
+    expected_indices, expected_distances = _brute_force_knn(queries, data, 4)
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(distances, expected_distances, atol=1e-10)
+
+
+def test_knn_self_exclusion():
+    """Test that searching a dataset against itself skips each point."""
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(50, 2))
+    indices, distances = knn(data, k=3, memory_budget=2048)
+    assert not np.any(indices == np.arange(50)[:, None])
+    expected_indices, expected_distances = _brute_force_knn(data, data, 3, exclude_self=True)
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(distances, expected_distances, atol=1e-10)
+    
+    prepared = prepare(data)
+    np.testing.assert_array_equal(knn(prepared, prepared, k=3)[0], indices)
+
+
+def test_knn_single_point_and_file(tmp_path):
+    """Test a single query point against a file."""
+    path = tmp_path / "points.csv"
+    path.write_text("x,y\n3,4\n1,1\n6,8\n")
+    indices, distances = knn([0, 0], path, k=2)
+    np.testing.assert_array_equal(indices, [1, 0])
+    np.testing.assert_array_almost_equal(distances, [np.sqrt(2), 5])
+
+
+def test_knn_invalid_inputs():
+    """Test invalid k values and dimension mismatches."""
+    with pytest.raises(InputError):
+        knn([[0, 0], [1, 1]], k=2)
+    with pytest.raises(DimensionMismatchError):
+        knn([0, 0, 0], [[1, 1], [2, 2]])
+    with pytest.raises(InputError):
+        knn([0, 0], [[1, 1]], metric="unknown")
+
+
+def test_radius_neighbors_matches_dense():
+    """Test blocked radius search against a dense distance matrix."""
+    rng = np.random.default_rng(2)
+    data = rng.uniform(size=(80, 2))
+    result = radius_neighbors(data, r=0.2, memory_budget=2048)
+    dense = euclidean_distance(data)
+    np.fill_diagonal(dense, np.inf)
+    assert result.indptr.shape == (81,)
+    for i in range(80):
+        neighbours = result.indices[result.indptr[i]:result.indptr[i + 1]]
+        np.testing.assert_array_equal(neighbours, np.flatnonzero(dense[i] <= 0.2))
+        np.testing.assert_allclose(result.distances[result.indptr[i]:result.indptr[i + 1]],
+                                   dense[i, neighbours], atol=1e-10)
+
+
+def test_radius_neighbors_cross():
+    """Test radius search between two point sets."""
+    result = radius_neighbors([[0, 0], [10, 10]], [[0, 1], [3, 4], [0, 0]], r=1)
+    np.testing.assert_array_equal(result.indptr, [0, 2, 2])
+    np.testing.assert_array_equal(result.indices, [0, 2])
+    np.testing.assert_array_almost_equal(result.distances, [1, 0])
+    with pytest.raises(InputError):
+        radius_neighbors([[0, 0]])
@@ -20,3 +20,36 @@ def test_euclidean_same_point():
     result = euclidean._compute(x, x)
     assert abs(result - 0.0) < 1e-10
 
+
+
+def test_euclidean_batched_kernels_match_scalar():
+    """Test that the vectorized kernels agree with the scalar fallback."""
+    rng = np.random.default_rng(0)
+    x = rng.normal(size=(20, 4))
+    y = rng.normal(size=(15, 4))
+    expected = np.array([[euclidean._compute(a, b) for b in y] for a in x])
+    np.testing.assert_allclose(euclidean._compute_cross(x, y), expected, atol=1e-10)
+    np.testing.assert_allclose(euclidean._compute_one_to_many(x[0], y), expected[0], atol=1e-10)
+    np.testing.assert_allclose(euclidean._compute_rowwise(x[:15], y), np.diag(expected[:15]), atol=1e-10)
+
+
+def test_euclidean_pairwise_symmetric():
+    """Test that pairwise results are exactly symmetric with a zero diagonal."""
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(30, 3))
+    result = euclidean(data)
+    np.testing.assert_array_equal(result, result.T)
+    np.testing.assert_array_equal(np.diag(result), np.zeros(30))
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_euclidean_accurate_far_from_origin(dtype):
+    """Test pairwise and cross distances of closely spaced points near 1e4."""
+    rng = np.random.default_rng(2)
+    data = 1e4 + np.cumsum(rng.uniform(0.5e-3, 1.5e-3, size=(100, 3)), axis=0)
+    rows = data.astype(dtype).astype(np.float64)  # Exact values of the cast inputs
+    expected = np.sqrt(((rows[:, None] - rows[None]) ** 2).sum(axis=-1))
+    rtol = 1e-9 if dtype == np.float64 else 1e-5
+    np.testing.assert_allclose(euclidean(data, dtype=dtype), expected, rtol=rtol)
+    np.testing.assert_allclose(euclidean(data[:10], data, pairwise=True, dtype=dtype),
+                               expected[:10], rtol=rtol)
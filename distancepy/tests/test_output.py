@@ -0,0 +1,57 @@
+"""Test writing results to memory-mapped files."""
+
+import pytest
+import numpy as np
+from distancepy import euclidean_distance
+from distancepy.metrics.numeric import euclidean
+
+
+def test_pairwise_to_npy(tmp_path):
+    """Test pairwise distances streamed into a .npy file."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(40, 3))
+    out = tmp_path / "distances.npy"
+    result = euclidean_distance(data, out=out, memory_budget=2048)
+    assert isinstance(result, np.memmap)
+    np.testing.assert_allclose(np.load(out), euclidean_distance(data), atol=1e-12)
+    assert not (tmp_path / "distances.npy.progress").exists()
+
+
+def test_pairwise_resumes_after_interruption(tmp_path, monkeypatch):
+    """Test that a rerun only computes the tiles an interrupted run did not finish."""
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(40, 3))
+    out = tmp_path / "condensed.npy"
+    original = euclidean._compute_tile
+    calls = []
+    
+    def failing_tile(*args):
+        if len(calls) == 5:
+            raise KeyboardInterrupt
+        calls.append(args[2:])
+        return original(*args)
+    
+    monkeypatch.setattr(euclidean, "_compute_tile", failing_tile)
+    with pytest.raises(KeyboardInterrupt):
+        euclidean_distance(data, condensed=True, out=out, memory_budget=2048)
+    assert (tmp_path / "condensed.npy.progress").exists()
+    
+    resumed = []
+    
+    def counting_tile(*args):
+        resumed.append(args[2:])
+        return original(*args)
+    
+    monkeypatch.setattr(euclidean, "_compute_tile", counting_tile)
+    result = euclidean_distance(data, condensed=True, out=out, memory_budget=2048)
+    assert not set(resumed) & set(calls)
+    expected = euclidean_distance(data, condensed=True)
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+
+
+def test_point_to_array_to_npy(tmp_path):
+    """Test that non-pairwise results are written to the output file too."""
+    out = tmp_path / "row.npy"
+    result = euclidean_distance([0, 0], [[3, 4], [6, 8]], out=out)
+    np.testing.assert_array_almost_equal(np.load(out), [5, 10])
+    np.testing.assert_array_almost_equal(result, [5, 10])
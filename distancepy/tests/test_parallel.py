@@ -0,0 +1,42 @@
+"""Test multi-process execution."""
+
+import pytest
+import numpy as np
+from distancepy import euclidean_distance
+from distancepy.core.exceptions import InputError
+
+
+def test_pairwise_parallel_identical():
+    """Test that process-pool pairwise results match the serial path exactly."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(60, 4))
+    serial = euclidean_distance(data, memory_budget=4096)
+    parallel = euclidean_distance(data, memory_budget=4096, n_jobs=2)
+    np.testing.assert_array_equal(parallel, serial)
+    condensed = euclidean_distance(data, condensed=True, memory_budget=4096, n_jobs=2)
+    np.testing.assert_array_equal(condensed, serial[np.triu_indices(60, 1)])
+
+
+def test_pairwise_parallel_to_npy(tmp_path):
+    """Test that workers write tiles straight into a memory-mapped output."""
+    rng = np.random.default_rng(1)
+    data = rng.normal(size=(50, 3))
+    out = tmp_path / "parallel.npy"
+    euclidean_distance(data, out=out, memory_budget=4096, n_jobs=2)
+    np.testing.assert_array_equal(np.load(out), euclidean_distance(data, memory_budget=4096))
+
+
+def test_point_to_array_parallel_identical():
+    """Test process-pool point-to-array and array-to-array distances."""
+    rng = np.random.default_rng(2)
+    data = rng.normal(size=(500, 3))
+    serial = euclidean_distance(data[0], data, memory_budget=1024)
+    np.testing.assert_array_equal(euclidean_distance(data[0], data, memory_budget=1024, n_jobs=2), serial)
+    rowwise = euclidean_distance(data, data[::-1], memory_budget=1024, n_jobs=2)
+    np.testing.assert_array_equal(rowwise, euclidean_distance(data, data[::-1], memory_budget=1024))
+
+
+def test_invalid_n_jobs():
+    """Test that n_jobs=0 is rejected."""
+    with pytest.raises(InputError):
+        euclidean_distance([[0, 0], [1, 1]], n_jobs=0)
@@ -4,7 +4,9 @@ import pytest
 import numpy as np
 import tempfile
 from pathlib import Path
-from distancepy.core.parsers import DataParser
+from distancepy.core.parsers import BinarySource, DataParser
+from distancepy.core.exceptions import FileFormatError, InputError, ParsingError
+from distancepy.core.cache import DEFAULT_CACHE_BYTES
 
 
 def test_parse_list():
@@ -41,4 +43,141 @@ def test_parse_csv_with_header():
         expected = np.array([[1, 2, 3], [4, 5, 6]])
         np.testing.assert_array_equal(result, expected)
     finally:
-        Path(temp_path).unlink()
\ No newline at end of file
+        Path(temp_path).unlink()
+
+def test_iter_file_blocks():
+    """Test streaming a CSV file with a header in fixed-size row blocks."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
+        f.write("x,y,label\n")
+        for i in range(10):
+            f.write(f"{i},{2 * i},a\n")
+        temp_path = f.name
+    
+    try:
+        blocks = list(DataParser.iter_file_blocks(temp_path, chunk_size=4))
+        assert [block.shape for block in blocks] == [(4, 2), (4, 2), (2, 2)]
+        np.testing.assert_array_equal(np.vstack(blocks)[:, 1], np.arange(10) * 2)
+    finally:
+        Path(temp_path).unlink()
+
+
+def test_iter_file_blocks_rejects_nan_block():
+    """Test that NaN values are reported for the block that contains them."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+        f.write("1 2\n3 4\n5 nan\n")
+        temp_path = f.name
+    
+    try:
+        blocks = DataParser.iter_file_blocks(temp_path, chunk_size=2)
+        np.testing.assert_array_equal(next(blocks), [[1, 2], [3, 4]])
+        with pytest.raises(InputError):
+            next(blocks)
+    finally:
+        Path(temp_path).unlink()
+
+
+def test_parse_txt_sniffs_delimiter_and_header():
+    """Test that delimiter and header are detected from the first lines."""
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
+        f.write("a;b\n1.5;2\n3;4\n")
+        temp_path = f.name
+    
+    try:
+        assert DataParser._sniff(Path(temp_path)) == (";", True)
+        result = DataParser.parse_single_input(temp_path)
+        np.testing.assert_array_equal(result, [[1.5, 2], [3, 4]])
+        assert result.dtype == np.float64
+    finally:
+        Path(temp_path).unlink()
+
+
+def test_file_cache(tmp_path):
+    """Test that parsed files are cached until they change."""
+    DataParser.clear_cache()
+    path = tmp_path / "cached.csv"
+    path.write_text("1,2\n3,4\n")
+    
+    first = DataParser.parse_single_input(path)
+    second = DataParser.parse_single_input(path)
+    assert second is first
+    assert not first.flags.writeable
+    info = DataParser.cache_info()
+    assert (info.hits, info.misses, info.entries) == (1, 1, 1)
+    
+    path.write_text("1,2\n3,4\n5,6\n")
+    assert DataParser.parse_single_input(path).shape == (3, 2)
+    
+    DataParser.set_cache_size(0)
+    try:
+        assert DataParser.cache_info().entries == 0
+    finally:
+        DataParser.set_cache_size(DEFAULT_CACHE_BYTES)
+        DataParser.clear_cache()
+
+
+def test_parse_npy_is_memory_mapped(tmp_path):
+    """Test that .npy files are memory-mapped without conversion."""
+    path = tmp_path / "data.npy"
+    np.save(path, np.arange(12, dtype=np.float32).reshape(4, 3))
+    result = DataParser.parse_single_input(path)
+    assert isinstance(result, np.memmap)
+    assert result.dtype == np.float32
+
+
+def test_parse_npz_and_raw_binary(tmp_path):
+    """Test array selection from .npz archives and raw binary files."""
+    data = np.arange(6, dtype='<i4').reshape(3, 2)
+    np.savez(tmp_path / "arrays.npz", a=data, b=data * 2)
+    with pytest.raises(ParsingError):
+        DataParser.parse_single_input(tmp_path / "arrays.npz")
+    result = DataParser.parse_single_input(BinarySource(tmp_path / "arrays.npz", key="b"))
+    np.testing.assert_array_equal(result, data * 2)
+    
+    data.tofile(tmp_path / "raw.bin")
+    raw = DataParser.parse_single_input(BinarySource(tmp_path / "raw.bin", shape=(-1, 2), dtype='<i4'))
+    np.testing.assert_array_equal(raw, data)
+    with pytest.raises(FileFormatError):
+        DataParser.parse_single_input(BinarySource(tmp_path / "raw.bin", shape=(4, 2), dtype='<i4'))
+
+
+def test_sidecar_cache(tmp_path):
+    """Test that parsed files are reused from, and invalidated in, the sidecar cache."""
+    source = tmp_path / "reference.csv"
+    source.write_text("x,y\n1,2\n3,4\n")
+    cache = DataParser.enable_sidecar_cache(tmp_path / "cache")
+    try:
+        DataParser.clear_cache()
+        first = DataParser.parse_single_input(source)
+        assert len(list((tmp_path / "cache").glob("*.npy"))) == 1
+        
+        DataParser.clear_cache()  # As if in a new process
+        second = DataParser.parse_single_input(source)
+        assert isinstance(second, np.memmap)
+        np.testing.assert_array_equal(second, first)
+        assert DataParser.parse_single_input(source) is second  # Kept in the in-process cache
+        assert DataParser.cache_info().hits == 1
+        
+        source.write_text("x,y\n1,2\n3,4\n5,6\n")
+        DataParser.clear_cache()
+        assert cache.load(source) is None
+        assert DataParser.parse_single_input(source).shape == (3, 2)
+    finally:
+        DataParser.disable_sidecar_cache()
+        DataParser.clear_cache()
+
+
+def test_parse_mixed_input_keeps_string_columns(tmp_path):
+    """Test that string columns are encoded to integer codes with per-column dictionaries."""
+    path = tmp_path / "mixed.csv"
+    path.write_text("name,x,y,category\npoint1,1,2,A\npoint2,3,4,B\npoint3,5,,A\n")
+    table = DataParser.parse_mixed_input(path)
+    assert table.numeric_names == ["x", "y"]
+    assert table.categorical_names == ["name", "category"]
+    np.testing.assert_array_equal(table.codes[:, 1], [0, 1, 0])
+    assert list(table.categories[1]) == ["A", "B"]
+    assert np.isnan(table.numeric[2, 1])
+    
+    other = DataParser.parse_mixed_input([["point4", 0, 0, "C"], ["point5", 1, 1, "A"]])
+    recoded = table.recode(other)
+    np.testing.assert_array_equal(recoded.codes[:, 1], [2, 0])
+    assert list(recoded.categories[1]) == ["A", "B", "C"]
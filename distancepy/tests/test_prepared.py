@@ -0,0 +1,35 @@
+"""Test prepared inputs."""
+
+import pytest
+import numpy as np
+from distancepy import euclidean_distance, prepare, PreparedData
+from distancepy.core.exceptions import InputError
+from distancepy.metrics.numeric import euclidean
+
+
+def test_prepare_reuses_precomputation(monkeypatch):
+    """Test that row norms are computed once and reused across calls."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(30, 4))
+    prepared = prepare(data, metric=euclidean)
+    assert isinstance(prepared, PreparedData)
+    assert prepared.array.flags.c_contiguous and not prepared.array.flags.writeable
+    assert data.flags.writeable
+    
+    calls = []
+    original = euclidean._precompute
+    monkeypatch.setattr(euclidean, "_precompute", lambda array: calls.append(1) or original(array))
+    first = euclidean_distance(prepared)
+    second = euclidean_distance(prepared, condensed=True)
+    assert calls == []
+    np.testing.assert_allclose(first, euclidean_distance(data), atol=1e-12)
+    np.testing.assert_allclose(second, first[np.triu_indices(30, 1)], atol=1e-12)
+    np.testing.assert_allclose(euclidean_distance(data[0], prepared), first[0], atol=1e-12)
+
+
+def test_prepare_dtype():
+    """Test storing prepared data in a chosen floating-point type."""
+    prepared = prepare([[1, 2], [3, 4]], dtype=np.float32)
+    assert prepared.dtype == np.float32
+    with pytest.raises(InputError):
+        prepare([[1, 2]], dtype=np.int32)
@@ -0,0 +1,81 @@
+"""Test the asyncio distance service."""
+
+import asyncio
+import pytest
+import numpy as np
+from distancepy import AsyncDistanceService, euclidean_distance, mahalanobis_distance
+from distancepy.core.exceptions import DimensionMismatchError, InputError
+
+
+def _data(seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(size=(200, 3)), rng.normal(size=(20, 3))
+
+
+def test_concurrent_queries_are_batched():
+    """Test that queries arriving together share one batch with correct results."""
+    reference, queries = _data()
+    
+    async def main():
+        async with AsyncDistanceService(reference, max_wait=0.05) as service:
+            results = await asyncio.gather(*(service.distance(q) for q in queries))
+            return results, service.stats()
+    
+    results, stats = asyncio.run(main())
+    for query, result in zip(queries, results):
+        np.testing.assert_allclose(result, euclidean_distance(query, reference), atol=1e-12)
+    assert stats.requests == 20 and stats.batches == 1
+    assert stats.mean_batch_size == 20
+    assert 0 < stats.mean_latency <= stats.max_latency
+    assert stats.throughput > 0
+
+
+def test_max_batch_size_and_multi_point_queries():
+    """Test that full batches are sent at once and that k-point queries get k rows."""
+    reference, queries = _data(1)
+    
+    async def main():
+        async with AsyncDistanceService(reference, max_batch_size=4, max_wait=10.0) as service:
+            results = await asyncio.gather(*(service.distance(q) for q in queries[:8]),
+                                           service.distance(queries[8:12]))
+            return results, service.stats()
+    
+    results, stats = asyncio.run(main())
+    assert stats.batches == 3
+    np.testing.assert_allclose(results[-1], euclidean_distance(queries[8:12], reference,
+                                                               pairwise=True), atol=1e-12)
+
+
+def test_service_errors():
+    """Test invalid queries, invalid options and a closed service."""
+    reference, _ = _data(2)
+    with pytest.raises(InputError):
+        AsyncDistanceService(reference, max_batch_size=0)
+    with pytest.raises(InputError):
+        AsyncDistanceService(reference, metric="gower")
+    
+    async def main():
+        service = AsyncDistanceService(reference)
+        with pytest.raises(DimensionMismatchError):
+            await service.distance([1.0, 2.0])
+        await service.close()
+        with pytest.raises(InputError):
+            await service.distance([1.0, 2.0, 3.0])
+    
+    asyncio.run(main())
+
+
+def test_data_dependent_metric_is_fitted_once():
+    """Test that a query gets the same distances alone and batched with others."""
+    reference, queries = _data(3)
+    queries = queries * 10  # Batches that would shift a covariance fitted on them
+    
+    async def distances(batch):
+        async with AsyncDistanceService(reference, metric="mahalanobis", max_wait=0.05) as service:
+            return await asyncio.gather(*(service.distance(q) for q in batch))
+    
+    alone = asyncio.run(distances(queries[:1]))[0]
+    batched = asyncio.run(distances(queries))[0]
+    np.testing.assert_allclose(batched, alone, atol=1e-12)
+    np.testing.assert_allclose(alone, mahalanobis_distance(queries[0], reference,
+                                                           covariance=np.cov(reference.T)), atol=1e-10)
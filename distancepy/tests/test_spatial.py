@@ -0,0 +1,54 @@
+"""Test spatial indexes."""
+
+import pytest
+import numpy as np
+from distancepy import euclidean_distance, knn
+from distancepy.core.exceptions import DimensionMismatchError
+from distancepy.utils import BallTree, BruteForceIndex, KDTree, build_index, load_index
+
+
+@pytest.mark.parametrize("tree_type", [KDTree, BallTree, BruteForceIndex])
+def test_tree_knn_matches_brute_force(tree_type):
+    """Test exact kNN queries against the brute-force path."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(300, 4))
+    queries = rng.normal(size=(20, 4))
+    tree = tree_type(data) if tree_type is BruteForceIndex else tree_type(data, leaf_size=8)
+    indices, distances = tree.query(queries, k=5)
+    expected_indices, expected_distances = knn(queries, data, k=5)
+    np.testing.assert_array_equal(indices, expected_indices)
+    np.testing.assert_allclose(distances, expected_distances, atol=1e-10)
+
+
+@pytest.mark.parametrize("kind", ["kd_tree", "ball_tree", "brute"])
+def test_tree_radius_query(kind):
+    """Test radius queries against point-to-array distances."""
+    rng = np.random.default_rng(1)
+    data = rng.uniform(size=(200, 3))
+    tree = build_index(data, kind=kind, leaf_size=10)
+    indices, distances = tree.query_radius(data[0], r=0.3)
+    expected = euclidean_distance(data[0], data)
+    np.testing.assert_array_equal(np.sort(indices), np.flatnonzero(expected <= 0.3))
+    np.testing.assert_allclose(distances, expected[indices])
+    assert np.all(np.diff(distances) >= 0)
+
+
+@pytest.mark.parametrize("kind", ["ball_tree", "brute"])
+def test_index_save_and_load(tmp_path, kind):
+    """Test that a saved index answers queries like the original."""
+    rng = np.random.default_rng(2)
+    data = rng.normal(size=(100, 20))
+    tree = build_index(data, kind=kind)
+    tree.save(tmp_path / "index.npz")
+    loaded = load_index(tmp_path / "index.npz")
+    assert type(loaded) is type(tree)
+    np.testing.assert_array_equal(loaded.query(data[:5], k=3)[0], tree.query(data[:5], k=3)[0])
+    with pytest.raises(DimensionMismatchError):
+        loaded.query([0, 0], k=1)
+
+
+def test_auto_index_kind():
+    """Test that auto only picks a tree where it beats brute force."""
+    rng = np.random.default_rng(3)
+    assert isinstance(build_index(rng.normal(size=(50, 3))), KDTree)
+    assert isinstance(build_index(rng.normal(size=(50, 8))), BruteForceIndex)
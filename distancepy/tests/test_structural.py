@@ -0,0 +1,105 @@
+"""Test sequence distance implementations (DTW, Levenshtein)."""
+
+import numpy as np
+import pytest
+from distancepy import dtw_distance, knn, levenshtein_distance
+from distancepy.core.exceptions import DimensionMismatchError, InputError
+from distancepy.metrics.structural import DTWDistance, SequenceDistance
+
+
+def _reference_dtw(a, b, window=None):
+    n, m = len(a), len(b)
+    band = max(n, m) if window is None else max(window, abs(n - m))
+    cost = np.full((n + 1, m + 1), np.inf)
+    cost[0, 0] = 0
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            if abs(i - j) <= band:
+                cost[i, j] = (a[i - 1] - b[j - 1]) ** 2 + min(cost[i - 1, j - 1],
+                                                              cost[i - 1, j], cost[i, j - 1])
+    return np.sqrt(cost[n, m])
+
+
+def _ragged(n=25, seed=0):
+    rng = np.random.default_rng(seed)
+    return [rng.normal(size=rng.integers(2, 12)).cumsum() for _ in range(n)]
+
+
+@pytest.mark.parametrize("window", [None, 0, 3])
+def test_dtw_matches_reference_on_ragged_batches(window):
+    """Test banded DTW on sequences of different lengths against the textbook recursion."""
+    sequences = _ragged()
+    expected = np.array([[_reference_dtw(a, b, window) for b in sequences] for a in sequences])
+    result = dtw_distance(sequences, window=window)
+    np.testing.assert_allclose(result, expected, atol=1e-12)
+    np.testing.assert_allclose(dtw_distance(sequences[4], sequences, window=window), expected[4])
+    np.testing.assert_allclose(dtw_distance(sequences, condensed=True, window=window),
+                               expected[np.triu_indices(len(sequences), 1)])
+
+
+def test_dtw_equal_lengths():
+    """Test 2-D inputs and the Euclidean special case."""
+    x, y = np.array([1.0, 2.0, 3.0]), np.array([2.0, 2.0, 5.0])
+    assert dtw_distance(x, y, window=0) == pytest.approx(np.linalg.norm(x - y))
+    assert dtw_distance([0, 1, 2], [0, 0, 1, 1, 2]) == 0.0
+    batch = np.array([[0.0, 1.0, 2.0], [1.0, 1.0, 1.0]])
+    np.testing.assert_allclose(dtw_distance(batch, batch[::-1]),
+                               [_reference_dtw(batch[0], batch[1])] * 2)
+    np.testing.assert_allclose(dtw_distance(batch.T, axis=1), dtw_distance(batch))
+    with pytest.raises(DimensionMismatchError):
+        dtw_distance(_ragged(3), _ragged(4))
+
+
+def test_dtw_lower_bounds_and_pruned_knn():
+    """Test that LB_Kim/LB_Keogh never exceed DTW and that pruned search stays exact."""
+    rng = np.random.default_rng(1)
+    data = np.cumsum(rng.normal(size=(400, 32)), axis=1)
+    metric = DTWDistance(window=2)
+    for query in data[:5]:
+        assert np.all(metric._lower_bound(query, data) <= metric._compute_batch(query, data) + 1e-9)
+    
+    computed = []
+    compute_batch = metric._compute_batch
+    metric._compute_batch = lambda q, c: computed.append(len(c)) or compute_batch(q, c)
+    indices, distances = knn(data[:5], data[5:], k=3, metric=metric)
+    metric._compute_batch = compute_batch
+    full = np.array([metric._compute_batch(query, data[5:]) for query in data[:5]])
+    np.testing.assert_allclose(distances, np.sort(full, axis=1)[:, :3])
+    np.testing.assert_array_equal(indices, np.argsort(full, axis=1, kind="stable")[:, :3])
+    assert sum(computed) < full.size
+
+
+def test_levenshtein():
+    """Test edit distance on strings, ragged lists and numeric sequences."""
+    assert levenshtein_distance("kitten", "sitting") == 3.0
+    assert levenshtein_distance("", "abc") == 3.0
+    np.testing.assert_array_equal(
+        levenshtein_distance(["kitten", "flaw", ""], ["sitting", "lawn", "ab"]), [3, 2, 2])
+    np.testing.assert_array_equal(levenshtein_distance(["abc", "abd", "b"]),
+                                  [[0, 1, 2], [1, 0, 2], [2, 2, 0]])
+    assert levenshtein_distance([1, 2, 3, 4], [1, 3, 4]) == 1.0
+    indices, distances = knn("abx", ["abc", "xyz", "ab", "abxy"], k=2, metric="levenshtein")
+    np.testing.assert_array_equal(indices, [0, 2])
+    np.testing.assert_array_equal(distances, [1, 1])
+
+
+def test_unsupported_options_are_rejected():
+    """Test that options sequence metrics cannot honour raise instead of being ignored."""
+    sequences = [[1, 2, 3], [1, 3], [2, 2, 2, 2]]
+    assert dtw_distance(sequences, dtype=np.float32).dtype == np.float32
+    assert isinstance(dtw_distance([1, 2, 3], [1, 3], dtype=np.float32), np.float32)
+    with pytest.raises(InputError):
+        levenshtein_distance("kitten", "sitting", out=np.empty(1))
+    for option in ({"n_jobs": 2}, {"chunk_size": 10}, {"accumulate": np.float32}):
+        with pytest.raises(InputError):
+            dtw_distance(sequences, **option)
+        with pytest.raises(InputError):
+            levenshtein_distance("kitten", ["sitting", "mitten"], **option)
+
+
+def test_sequence_subclass_must_implement_compute_batch():
+    class Incomplete(SequenceDistance):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -1,2 +1,6 @@
 """Utility functions and helpers."""
 
+from .matrix import DistanceMatrix, LazyDistanceMatrix
+from .spatial import BallTree, BruteForceIndex, KDTree, build_index, load_index
+
+__all__ = ["BallTree", "BruteForceIndex", "KDTree", "build_index", "load_index", "DistanceMatrix", "LazyDistanceMatrix"]
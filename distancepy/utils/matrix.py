@@ -0,0 +1,409 @@
+"""Distance matrices that are kept up to date as points are added and removed."""
+
+import numpy as np
+from typing import Any, List, Optional, Tuple
+from ..core.blocking import iter_row_blocks, resolve_block_size, resolve_dtypes, slice_aux
+from ..core.cache import CacheInfo, LRUCache
+from ..core.exceptions import DimensionMismatchError, InputError
+from ..core.parsers import DataParser
+from ..core.prepared import PreparedData
+from ..metrics import SequenceDistance, get_metric
+
+
+# Smallest number of points storage is allocated for.
+MIN_CAPACITY = 16
+
+# Default upper bound on the memory held by the row cache of a LazyDistanceMatrix.
+DEFAULT_ROW_CACHE_BYTES = 64 * 1024 * 1024
+
+
+def _condensed_offset(i: int) -> int:
+    """Offset of row ``i`` in lower-triangular condensed storage."""
+    return i * (i - 1) // 2
+
+
+def _compacting_moves(keep: np.ndarray) -> List[Tuple[int, int, int]]:
+    """
+    Slice moves that bring the kept entries to the front, in order.
+    
+    Returns (start, stop, destination) triples to apply in sequence. Each run
+    of consecutive kept entries moves down in pieces no longer than its
+    shift, so no piece overlaps its destination and numpy copies it without
+    a temporary.
+    """
+    kept = np.flatnonzero(keep)
+    moves = []
+    for run in np.split(kept, np.flatnonzero(np.diff(kept) != 1) + 1):
+        if run.size == 0:
+            continue
+        start, stop = int(run[0]), int(run[-1]) + 1
+        shift = start - int(np.searchsorted(kept, start))
+        if shift == 0:
+            continue  # Already in place
+        for piece in range(start, stop, shift):
+            moves.append((piece, min(piece + shift, stop), piece - shift))
+    return moves
+
+
+class DistanceMatrix:
+    """
+    Pairwise distances of a set of points that grows and shrinks over time.
+    
+    Appending k points computes only the new rows against all points (k x n
+    distances) and deleting points moves the remaining distances in place, so
+    updates cost O(k * n) instead of recomputing all n^2 entries. Points and
+    distances live in buffers whose capacity doubles when full and halves
+    when less than a quarter is used, so resizes are amortized.
+    
+    With ``condensed=True`` only the strict lower triangle is stored, row by
+    row (entry (i, j) with j < i at offset i*(i-1)/2 + j). New rows then go at
+    the end of the buffer, and ``distances`` is this packing; ``toarray``
+    always returns the square matrix.
+    
+    The metric must not depend on the whole data set, so an unfitted
+    Mahalanobis or a Gower metric (ranges taken over the inputs) do not give
+    the same results as a full recomputation.
+    
+    Args:
+        data: Initial points (list, array, file path, or PreparedData), one per row
+        metric: Metric name or instance (see ``distancepy.metrics.METRICS``)
+        condensed: Store only the lower triangle (symmetric metrics only)
+        memory_budget, n_jobs: Options of the distance computations
+        dtype: Floating-point type of the stored distances, float64 by default
+    
+    Examples:
+        >>> matrix = DistanceMatrix("reference.csv")
+        >>> new_rows = matrix.append([[0.5, 1.0], [2.0, 0.0]])
+        >>> matrix.delete([0, 3])
+        >>> matrix.distances.shape
+        (n, n)
+    """
+    
+    def __init__(self, data: Any = None, metric: Any = "euclidean", condensed: bool = False,
+                 memory_budget: Optional[int] = None, n_jobs: Optional[int] = None,
+                 dtype: Any = None):
+        self.metric = get_metric(metric)
+        if condensed and not self.metric.symmetric:
+            raise InputError(f"{self.metric.name} is not symmetric; condensed storage is not available")
+        self.condensed = condensed
+        self.dtype, _ = resolve_dtypes(dtype)
+        self._options = {"memory_budget": memory_budget, "n_jobs": n_jobs, "dtype": dtype}
+        self._n = 0
+        self._points: Optional[np.ndarray] = None
+        self._distances: Optional[np.ndarray] = None
+        if data is not None:
+            self.append(data)
+    
+    def __len__(self) -> int:
+        return self._n
+    
+    def __repr__(self) -> str:
+        layout = "condensed" if self.condensed else "square"
+        return (f"DistanceMatrix(n_points={self._n}, metric={self.metric.name!r}, "
+                f"{layout}, capacity={self.capacity})")
+    
+    @property
+    def capacity(self) -> int:
+        """Number of points the buffers hold before they are reallocated."""
+        return 0 if self._points is None else self._points.shape[0]
+    
+    @property
+    def data(self) -> np.ndarray:
+        """The current points, one per row (a view into the buffer)."""
+        if self._points is None:
+            raise InputError("DistanceMatrix has no points yet")
+        return self._points[:self._n]
+    
+    @property
+    def distances(self) -> np.ndarray:
+        """
+        The current distances, a view into the buffer.
+        
+        Square storage gives the (n, n) matrix; condensed storage the
+        n*(n-1)/2 lower-triangular entries described in the class docstring.
+        """
+        if self._distances is None:
+            raise InputError("DistanceMatrix has no points yet")
+        if self.condensed:
+            return self._distances[:_condensed_offset(self._n)]
+        return self._distances[:self._n, :self._n]
+    
+    def toarray(self) -> np.ndarray:
+        """Return a copy of the distances as a square (n, n) matrix."""
+        if not self.condensed:
+            return self.distances.copy()
+        n = self._n
+        result = np.zeros((n, n), dtype=self.dtype)
+        rows, columns = np.tril_indices(n, -1)
+        result[rows, columns] = result[columns, rows] = self.distances
+        return result
+    
+    def append(self, points: Any) -> np.ndarray:
+        """
+        Add points and compute their distances to all points.
+        
+        Args:
+            points: A single point or several points, one per row
+        
+        Returns:
+            Indices of the new points
+        """
+        new = DataParser.parse_single_input(points)
+        if new.ndim == 1:
+            new = new.reshape(1, -1)
+        if new.ndim != 2:
+            raise DimensionMismatchError(f"Points must be a 2-D array. Got shape {new.shape}")
+        if self._points is not None and new.shape[1] != self._points.shape[1]:
+            raise DimensionMismatchError(
+                f"New points have {new.shape[1]} dimensions, the matrix holds {self._points.shape[1]}"
+            )
+        n, k = self._n, new.shape[0]
+        if k == 0:
+            return np.arange(n, n)
+        self._reserve(n + k, new)
+        
+        # Only distances involving the new points are computed
+        within = self.metric(new, **self._options)
+        to_old = self.metric(new, self.data, pairwise=True, **self._options) if n else None
+        self._points[n:n + k] = new
+        if self.condensed:
+            offset = _condensed_offset(n)
+            for r in range(k):
+                if n:
+                    self._distances[offset:offset + n] = to_old[r]
+                self._distances[offset + n:offset + n + r] = within[r, :r]
+                offset += n + r
+        else:
+            self._distances[n:n + k, n:n + k] = within
+            if n:
+                self._distances[n:n + k, :n] = to_old
+                self._distances[:n, n:n + k] = (to_old.T if self.metric.symmetric else
+                                                self.metric(self.data, new, pairwise=True,
+                                                            **self._options))
+        self._n = n + k
+        return np.arange(n, n + k)
+    
+    def delete(self, indices: Any) -> None:
+        """
+        Remove points, moving the remaining points and distances down in place.
+        
+        Later points keep their order and their indices shift down. Square
+        storage is compacted with slice moves of whole rows, then of whole
+        columns, and condensed storage one row at a time, so no temporary is
+        larger than one row.
+        """
+        n = self._n
+        indices = np.unique(np.asarray(indices, dtype=np.intp).reshape(-1))
+        if indices.size == 0:
+            return
+        if indices[0] < -n or indices[-1] >= n:
+            raise InputError(f"Indices out of range for {n} points")
+        keep = np.ones(n, dtype=bool)
+        keep[indices] = False
+        kept = np.flatnonzero(keep)
+        m = kept.size
+        first = int(np.argmin(keep)) if m < n else n  # Entries before it do not move
+        
+        moves = _compacting_moves(keep)
+        for start, stop, destination in moves:
+            self._points[destination:destination + stop - start] = self._points[start:stop]
+        if self.condensed:
+            # Rows only ever move to lower offsets, so each can be rewritten in place
+            for r in range(max(first, 1), m):
+                i = kept[r]
+                row = self._distances[_condensed_offset(i):_condensed_offset(i) + i][kept[:r]]
+                self._distances[_condensed_offset(r):_condensed_offset(r) + r] = row
+        else:
+            for start, stop, destination in moves:
+                self._distances[destination:destination + stop - start, :n] = self._distances[start:stop, :n]
+            for start, stop, destination in moves:
+                self._distances[:m, destination:destination + stop - start] = self._distances[:m, start:stop]
+        self._n = m
+        if self.capacity > MIN_CAPACITY and m <= self.capacity // 4:
+            self._resize(max(self.capacity // 2, MIN_CAPACITY))
+    
+    def _reserve(self, size: int, sample: np.ndarray) -> None:
+        """Make room for ``size`` points, at least doubling the capacity."""
+        if self._points is None:
+            capacity = max(size, MIN_CAPACITY)
+            self._points = np.empty((capacity, sample.shape[1]), dtype=np.float64)
+            self._distances = self._allocate(capacity)
+        elif size > self.capacity:
+            self._resize(max(size, 2 * self.capacity))
+    
+    def _allocate(self, capacity: int) -> np.ndarray:
+        if self.condensed:
+            return np.zeros(_condensed_offset(capacity), dtype=self.dtype)
+        return np.zeros((capacity, capacity), dtype=self.dtype)
+    
+    def _resize(self, capacity: int) -> None:
+        n = self._n
+        points = np.empty((capacity, self._points.shape[1]), dtype=self._points.dtype)
+        points[:n] = self._points[:n]
+        distances = self._allocate(capacity)
+        if self.condensed:
+            distances[:_condensed_offset(n)] = self._distances[:_condensed_offset(n)]
+        else:
+            distances[:n, :n] = self._distances[:n, :n]
+        self._points, self._distances = points, distances
+
+
+class LazyDistanceMatrix:
+    """
+    A pairwise distance matrix whose rows are computed when they are read.
+    
+    Indexing computes only the requested rows, with the metric's cross kernel
+    against blocks of all points, and keeps recently used rows in an LRU cache
+    bounded by ``cache_bytes``. The metric's per-row precomputation (e.g.
+    squared norms) is done once for all points. ``toarray`` (or
+    ``numpy.asarray``) computes the whole matrix with the blocked pairwise
+    engine.
+    
+    Supported keys are those of a 2-D array whose first part selects rows: an
+    index, a slice or a list of indices, optionally followed by a column key.
+    A single entry ``matrix[i, j]`` is read from a cached row of i (or of j for
+    symmetric metrics) and otherwise computed on its own.
+    
+    Args:
+        data: Points (list, array, file path, or PreparedData)
+        metric: Metric name or instance (see ``distancepy.metrics.METRICS``)
+        axis: Whether points are rows (0) or columns (1) of ``data``
+        cache_bytes: Memory budget of the row cache
+        memory_budget: Approximate working-set size in bytes per block
+        n_jobs: Worker processes used by ``toarray``
+        dtype, accumulate: Floating-point types of the results and of the
+            computation, as for ``euclidean_distance``
+    
+    Examples:
+        >>> matrix = LazyDistanceMatrix("reference.csv")
+        >>> matrix[42]          # One row, computed now and cached
+        >>> matrix[10:20, :5]   # Ten rows, restricted to five columns
+        >>> matrix[3, 7]        # One entry
+        >>> matrix.cache_info()
+    """
+    
+    def __init__(self, data: Any, metric: Any = "euclidean", axis: int = 0,
+                 cache_bytes: int = DEFAULT_ROW_CACHE_BYTES, memory_budget: Optional[int] = None,
+                 n_jobs: Optional[int] = None, dtype: Any = None, accumulate: Any = None):
+        metric = get_metric(metric)
+        if isinstance(metric, SequenceDistance):
+            raise InputError(f"{metric.name} compares sequences; LazyDistanceMatrix needs points")
+        self.metric, data, _, axis = metric._bind_inputs(data, None, axis)
+        self.dtype, self._compute_dtype = resolve_dtypes(dtype, accumulate)
+        self._memory_budget = memory_budget
+        self._n_jobs = n_jobs
+        
+        if isinstance(data, PreparedData) and axis == 0 and data.ndim == 2:
+            self._points = data  # Reuses the precomputation cached on it
+        else:
+            array = data.array if isinstance(data, PreparedData) else DataParser.parse_single_input(data)
+            self._points = PreparedData(self.metric._pairwise_rows(array, axis))
+        rows = self._points.array
+        self._aux = self._points.aux(self.metric, self._compute_dtype)
+        self._block = resolve_block_size(rows.shape[0], rows.shape[1], memory_budget=memory_budget)
+        self._cache = LRUCache(cache_bytes)
+    
+    @property
+    def shape(self) -> Tuple[int, int]:
+        n = self._points.shape[0]
+        return n, n
+    
+    def __len__(self) -> int:
+        return self._points.shape[0]
+    
+    def __repr__(self) -> str:
+        return f"LazyDistanceMatrix(shape={self.shape}, metric={self.metric.name!r})"
+    
+    def __array__(self, dtype=None, copy=None):
+        result = self.toarray()
+        return result if dtype is None else result.astype(dtype)
+    
+    def __getitem__(self, key: Any) -> Any:
+        if isinstance(key, tuple) and len(key) != 2:
+            raise IndexError(f"A 2-D distance matrix takes one or two indices, got {len(key)}")
+        rows_key, columns_key = key if isinstance(key, tuple) else (key, slice(None))
+        if _is_index(rows_key) and _is_index(columns_key):
+            return self._entry(self._check_index(rows_key), self._check_index(columns_key))
+        if _is_index(rows_key):
+            return self._rows([self._check_index(rows_key)])[0][columns_key]
+        if isinstance(rows_key, slice):
+            indices = np.arange(len(self))[rows_key]
+        else:
+            indices = np.asarray(rows_key)
+            if indices.dtype == bool:
+                if indices.shape != (len(self),):
+                    raise IndexError(f"Boolean index must have length {len(self)}")
+                indices = np.flatnonzero(indices)
+            indices = np.array([self._check_index(i) for i in indices.reshape(-1)], dtype=np.intp)
+        return self._rows(indices)[:, columns_key]
+    
+    def toarray(self) -> np.ndarray:
+        """Compute the whole (n, n) matrix with the blocked pairwise engine."""
+        return self.metric._compute_pairwise(self._points.array, 0, aux=self._aux,
+                                             memory_budget=self._memory_budget, n_jobs=self._n_jobs,
+                                             out_dtype=self.dtype, compute_dtype=self._compute_dtype)
+    
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss statistics and the current size of the row cache."""
+        return self._cache.info()
+    
+    def clear_cache(self) -> None:
+        """Drop every cached row."""
+        self._cache.clear()
+    
+    def _check_index(self, index: Any) -> int:
+        n = len(self)
+        index = int(index)
+        if not -n <= index < n:
+            raise IndexError(f"Index {index} is out of bounds for {n} points")
+        return index % n
+    
+    def _entry(self, i: int, j: int) -> float:
+        """One distance, from a cached row when there is one."""
+        index, row = self._cache.get_any((i, j) if self.metric.symmetric else (i,))
+        if row is not None:
+            return row[j if index == i else i].item()
+        return self._compute_block(np.array([i]), j, j + 1)[0, 0].item()
+    
+    def _rows(self, indices: Any) -> np.ndarray:
+        """Rows ``indices`` of the matrix, computing the ones that are not cached."""
+        indices = np.asarray(indices, dtype=np.intp)
+        result = np.empty((indices.size, len(self)), dtype=self.dtype)
+        missing = []
+        for position, index in enumerate(indices):
+            row = self._cache.get(int(index))
+            if row is None:
+                missing.append(position)
+            else:
+                result[position] = row
+        
+        # Rows requested more than once are computed once
+        computed = {}
+        needed = np.unique(indices[missing])
+        for start, stop in iter_row_blocks(needed.size, self._block):
+            block = needed[start:stop]
+            for index, row in zip(block, self._compute_block(block, 0, len(self))):
+                computed[int(index)] = self._cache.put(int(index), row.copy())
+        for position in missing:
+            result[position] = computed[int(indices[position])]
+        return result
+    
+    def _compute_block(self, indices: np.ndarray, j0: int, j1: int) -> np.ndarray:
+        """Distances from the points ``indices`` to the points ``j0:j1``."""
+        metric, rows, dtype = self.metric, self._points.array, self._compute_dtype
+        queries = metric._as_compute_block(rows[indices], dtype)
+        query_aux = metric._precompute(queries)
+        result = np.empty((indices.size, j1 - j0), dtype=self.dtype)
+        for start, stop in iter_row_blocks(j1 - j0, self._block):
+            result[:, start:stop] = metric._compute_cross(
+                queries, metric._as_compute_block(rows[j0 + start:j0 + stop], dtype),
+                query_aux, slice_aux(self._aux, j0 + start, j0 + stop))
+        # Diagonal entries come from the metric's self kernel, as in toarray
+        for position in np.flatnonzero((indices >= j0) & (indices < j1)):
+            result[position, indices[position] - j0] = metric._compute_self(
+                queries[position:position + 1], slice_aux(query_aux, position, position + 1))[0, 0]
+        return result
+
+
+def _is_index(key: Any) -> bool:
+    return isinstance(key, (int, np.integer))
@@ -0,0 +1,399 @@
+"""Indexes (KD-tree, ball tree, blocked brute force) for repeated exact Euclidean queries."""
+
+import heapq
+import numpy as np
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, List, Optional, Tuple, Union
+from ..core.exceptions import DimensionMismatchError, FileFormatError, InputError
+from ..core.parsers import DataParser
+from ..core.search import knn_search, radius_search
+from ..metrics.numeric import euclidean
+
+
+# Dimension up to which build_index(kind="auto") picks a KD-tree; above it the
+# blocked brute-force index answers query batches faster (see benchmark_index.py).
+KD_TREE_MAX_DIMENSIONS = 3
+
+
+class _Index:
+    """Query parsing shared by every index type."""
+    
+    kind = ""
+    
+    @property
+    def n_points(self) -> int:
+        return self.data.shape[0]
+    
+    @property
+    def n_features(self) -> int:
+        return self.data.shape[1]
+    
+    @staticmethod
+    def _parse_data(data: Any) -> np.ndarray:
+        points = DataParser.parse_single_input(data)
+        if points.ndim != 2:
+            raise DimensionMismatchError(f"Index data must be a 2-D array of points. Got shape {points.shape}")
+        return np.ascontiguousarray(points, dtype=np.float64)
+    
+    def _parse_queries(self, points: Any) -> Tuple[np.ndarray, bool]:
+        queries = np.asarray(DataParser.parse_single_input(points), dtype=np.float64)
+        single = queries.ndim == 1
+        queries = queries.reshape(1, -1) if single else queries
+        if queries.ndim != 2 or queries.shape[1] != self.n_features:
+            raise DimensionMismatchError(
+                f"Queries must have {self.n_features} dimensions. Got shape {queries.shape}"
+            )
+        return queries, single
+    
+    def _check_k(self, k: int) -> None:
+        if not 1 <= k <= self.n_points:
+            raise InputError(f"k must be between 1 and {self.n_points}, got {k}")
+
+
+class BruteForceIndex(_Index):
+    """
+    Exact Euclidean queries by comparing whole query batches with every point.
+    
+    Queries go through the blocked matrix kernels of ``knn`` and
+    ``radius_neighbors``, with the points' squared norms computed once. Beyond
+    a few dimensions this is much faster than walking a tree query by query,
+    so ``build_index(kind="auto")`` picks it there.
+    
+    Args:
+        data: Points to index (list, array, file path, or PreparedData)
+        memory_budget: Approximate working-set size in bytes per block
+    """
+    
+    kind = "brute"
+    
+    def __init__(self, data: Any, memory_budget: Optional[int] = None):
+        self.data = self._parse_data(data)
+        self.memory_budget = memory_budget
+        self._aux = euclidean._precompute_rows(self.data, memory_budget)
+    
+    def query(self, points: Any, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the exact k nearest indexed points of each query point.
+        
+        Args:
+            points: Query point or (m, d) batch of query points
+            k: Number of neighbours per query
+        
+        Returns:
+            indices, distances: arrays of shape (m, k) sorted by increasing
+            distance, or shape (k,) for a single query point
+        """
+        self._check_k(k)
+        queries, single = self._parse_queries(points)
+        indices, distances = knn_search(euclidean, queries, self.data, k,
+                                        memory_budget=self.memory_budget, data_aux=self._aux)
+        return (indices[0], distances[0]) if single else (indices, distances)
+    
+    def query_radius(self, points: Any, r: float) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Find every indexed point within distance ``r`` of each query point.
+        
+        Returns:
+            indices, distances: one array per query, sorted by increasing
+            distance (single arrays for a single query point)
+        """
+        if r < 0:
+            raise InputError(f"r must be non-negative, got {r}")
+        queries, single = self._parse_queries(points)
+        result = radius_search(euclidean, queries, self.data, float(r),
+                               memory_budget=self.memory_budget, data_aux=self._aux)
+        indices, distances = [], []
+        for start, stop in zip(result.indptr[:-1], result.indptr[1:]):
+            order = np.argsort(result.distances[start:stop], kind="stable")
+            indices.append(result.indices[start:stop][order])
+            distances.append(result.distances[start:stop][order])
+        return (indices[0], distances[0]) if single else (indices, distances)
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the index to an ``.npz`` file readable by ``load_index``."""
+        np.savez(path, kind=self.kind, data=self.data)
+    
+    @classmethod
+    def _from_arrays(cls, arrays: Any) -> "BruteForceIndex":
+        return cls(arrays["data"])
+
+
+class _BinaryTree(_Index, ABC):
+    """
+    Shared structure of the KD-tree and the ball tree.
+    
+    The points are reordered so that every node owns a contiguous slice
+    ``[start, end)`` of ``self.data``; ``self.indices`` maps positions back to
+    rows of the original data. Leaves hold at most ``leaf_size`` points and are
+    scanned with vectorized NumPy; subclasses only differ in the bounds they
+    store per node and in the lower bound used to prune them.
+    """
+    
+    _bound_names: Tuple[str, ...] = ()
+    
+    def __init__(self, data: Any, leaf_size: int = 40):
+        if leaf_size < 1:
+            raise InputError(f"leaf_size must be positive, got {leaf_size}")
+        points = self._parse_data(data)
+        
+        self.leaf_size = int(leaf_size)
+        n = points.shape[0]
+        order = np.arange(n)
+        starts, ends, children = [], [], []
+        stack = [(0, n, -1, 0)]  # start, end, parent, which child
+        while stack:
+            start, end, parent, side = stack.pop()
+            node = len(starts)
+            starts.append(start)
+            ends.append(end)
+            children.append([-1, -1])
+            if parent >= 0:
+                children[parent][side] = node
+            if end - start <= self.leaf_size:
+                continue
+            # Split at the median of the dimension with the largest spread
+            segment = points[order[start:end]]
+            dim = int(np.argmax(segment.max(axis=0) - segment.min(axis=0)))
+            mid = (end - start) // 2
+            part = np.argpartition(segment[:, dim], mid)
+            order[start:end] = order[start:end][part]
+            stack.append((start + mid, end, node, 1))
+            stack.append((start, start + mid, node, 0))
+        
+        self.indices = order
+        self.data = points[order]
+        self.starts = np.array(starts, dtype=np.intp)
+        self.ends = np.array(ends, dtype=np.intp)
+        self.children = np.array(children, dtype=np.intp).reshape(-1, 2)
+        self._build_bounds()
+    
+    @abstractmethod
+    def _build_bounds(self) -> None:
+        """Compute the bounding volume of every node."""
+        pass
+    
+    @abstractmethod
+    def _lower_bound(self, point: np.ndarray, node: int) -> float:
+        """Smallest possible distance from ``point`` to any point of ``node``."""
+        pass
+    
+    @abstractmethod
+    def _upper_bound(self, point: np.ndarray, node: int) -> float:
+        """Largest possible distance from ``point`` to any point of ``node``."""
+        pass
+    
+    def _leaf_distances(self, point: np.ndarray, node: int) -> np.ndarray:
+        diff = self.data[self.starts[node]:self.ends[node]] - point
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+    
+    def _query_one(self, point: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        best_d = np.full(k, np.inf)
+        best_i = np.full(k, -1, dtype=np.intp)
+        heap = [(self._lower_bound(point, 0), 0)]
+        while heap:
+            bound, node = heapq.heappop(heap)
+            if bound >= best_d[-1]:
+                break  # Every remaining node is at least this far away
+            left, right = self.children[node]
+            if left < 0:
+                distances = self._leaf_distances(point, node)
+                cand_d = np.concatenate([best_d, distances])
+                cand_i = np.concatenate([best_i, np.arange(self.starts[node], self.ends[node])])
+                keep = np.argsort(cand_d, kind="stable")[:k]
+                best_d, best_i = cand_d[keep], cand_i[keep]
+                continue
+            for child in (left, right):
+                child_bound = self._lower_bound(point, child)
+                if child_bound < best_d[-1]:
+                    heapq.heappush(heap, (child_bound, child))
+        return self.indices[best_i], best_d
+    
+    def query(self, points: Any, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the exact k nearest indexed points of each query point.
+        
+        Each query point walks the tree on its own (a Python loop over the
+        queries), which only pays off in a few dimensions; see ``build_index``.
+        
+        Args:
+            points: Query point or (m, d) array of query points
+            k: Number of neighbours per query
+        
+        Returns:
+            indices, distances: arrays of shape (m, k) sorted by increasing
+            distance, or shape (k,) for a single query point
+        """
+        self._check_k(k)
+        queries, single = self._parse_queries(points)
+        indices = np.empty((queries.shape[0], k), dtype=np.intp)
+        distances = np.empty((queries.shape[0], k))
+        for row, point in enumerate(queries):
+            indices[row], distances[row] = self._query_one(point, k)
+        return (indices[0], distances[0]) if single else (indices, distances)
+    
+    def _query_radius_one(self, point: np.ndarray, r: float) -> Tuple[np.ndarray, np.ndarray]:
+        found_i: List[np.ndarray] = []
+        found_d: List[np.ndarray] = []
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            if self._lower_bound(point, node) > r:
+                continue
+            left, right = self.children[node]
+            if left < 0 or self._upper_bound(point, node) <= r:
+                distances = self._leaf_distances(point, node)
+                mask = distances <= r
+                found_i.append(np.arange(self.starts[node], self.ends[node])[mask])
+                found_d.append(distances[mask])
+            else:
+                stack.extend((right, left))
+        if not found_i:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+        positions, distances = np.concatenate(found_i), np.concatenate(found_d)
+        order = np.argsort(distances, kind="stable")
+        return self.indices[positions[order]], distances[order]
+    
+    def query_radius(self, points: Any, r: float) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Find every indexed point within distance ``r`` of each query point.
+        
+        Like ``query``, each query point walks the tree on its own.
+        
+        Returns:
+            indices, distances: one array per query, sorted by increasing
+            distance (single arrays for a single query point)
+        """
+        if r < 0:
+            raise InputError(f"r must be non-negative, got {r}")
+        queries, single = self._parse_queries(points)
+        results = [self._query_radius_one(point, float(r)) for point in queries]
+        indices = [item[0] for item in results]
+        distances = [item[1] for item in results]
+        return (indices[0], distances[0]) if single else (indices, distances)
+    
+    def save(self, path: Union[str, Path]) -> None:
+        """Save the index to an ``.npz`` file readable by ``load_index``."""
+        np.savez(path, kind=self.kind, leaf_size=self.leaf_size, data=self.data,
+                 indices=self.indices, starts=self.starts, ends=self.ends,
+                 children=self.children,
+                 **{name: getattr(self, name) for name in self._bound_names})
+    
+    @classmethod
+    def _from_arrays(cls, arrays: Any) -> "_BinaryTree":
+        tree = cls.__new__(cls)
+        tree.leaf_size = int(arrays["leaf_size"])
+        for name in ["data", "indices", "starts", "ends", "children"]:
+            setattr(tree, name, arrays[name])
+        for name in tree._bound_names:
+            setattr(tree, name, arrays[name])
+        return tree
+
+
+class KDTree(_BinaryTree):
+    """
+    KD-tree for exact Euclidean queries in low dimensions.
+    
+    Each node stores the bounding box of its points; the distance from a query
+    to the box bounds the distance to every point inside it.
+    """
+    
+    kind = "kd_tree"
+    _bound_names = ("lower", "upper")
+    
+    def _build_bounds(self) -> None:
+        self.lower = np.empty((len(self.starts), self.n_features))
+        self.upper = np.empty((len(self.starts), self.n_features))
+        for node, (start, end) in enumerate(zip(self.starts, self.ends)):
+            self.lower[node] = self.data[start:end].min(axis=0)
+            self.upper[node] = self.data[start:end].max(axis=0)
+    
+    def _lower_bound(self, point: np.ndarray, node: int) -> float:
+        gap = np.maximum(self.lower[node] - point, 0.0) + np.maximum(point - self.upper[node], 0.0)
+        return float(np.sqrt(gap @ gap))
+    
+    def _upper_bound(self, point: np.ndarray, node: int) -> float:
+        far = np.maximum(np.abs(point - self.lower[node]), np.abs(point - self.upper[node]))
+        return float(np.sqrt(far @ far))
+
+
+class BallTree(_BinaryTree):
+    """
+    Ball tree for exact Euclidean queries in moderate dimensions.
+    
+    Each node stores the centroid of its points and the radius of the ball
+    around it, which stays a tight bound where bounding boxes become loose.
+    """
+    
+    kind = "ball_tree"
+    _bound_names = ("centers", "radii")
+    
+    def _build_bounds(self) -> None:
+        self.centers = np.empty((len(self.starts), self.n_features))
+        self.radii = np.empty(len(self.starts))
+        for node, (start, end) in enumerate(zip(self.starts, self.ends)):
+            center = self.data[start:end].mean(axis=0)
+            diff = self.data[start:end] - center
+            self.centers[node] = center
+            self.radii[node] = np.sqrt(np.einsum('ij,ij->i', diff, diff).max())
+    
+    def _center_distance(self, point: np.ndarray, node: int) -> float:
+        diff = point - self.centers[node]
+        return float(np.sqrt(diff @ diff))
+    
+    def _lower_bound(self, point: np.ndarray, node: int) -> float:
+        return max(0.0, self._center_distance(point, node) - self.radii[node])
+    
+    def _upper_bound(self, point: np.ndarray, node: int) -> float:
+        return self._center_distance(point, node) + self.radii[node]
+
+
+_INDEX_TYPES = {KDTree.kind: KDTree, BallTree.kind: BallTree, BruteForceIndex.kind: BruteForceIndex}
+
+
+def build_index(data: Any, kind: str = "auto", leaf_size: int = 40) -> _Index:
+    """
+    Build an index over a set of points for repeated exact Euclidean queries.
+    
+    Tree queries walk the tree one query point at a time, so they only beat
+    the blocked brute-force scan in a few dimensions: a KD-tree wins up to
+    about three, and a ball tree is slower than brute force at any dimension
+    measured by ``benchmark_index.py``.
+    
+    Args:
+        data: Points to index (list, array, file path, or PreparedData)
+        kind: "kd_tree", "ball_tree", "brute", or "auto" to pick a KD-tree
+            for up to ``KD_TREE_MAX_DIMENSIONS`` dimensions and brute force above
+        leaf_size: Maximum number of points scanned together in a tree leaf
+    
+    Returns:
+        KDTree, BallTree or BruteForceIndex
+    
+    Examples:
+        >>> index = build_index("reference.csv")
+        >>> indices, distances = index.query([[0, 0], [1, 1]], k=3)
+        >>> index.save("reference_index.npz")
+    """
+    if kind == "auto":
+        points = DataParser.parse_single_input(data)
+        kind = KDTree.kind if points.ndim == 2 and points.shape[1] <= KD_TREE_MAX_DIMENSIONS else BruteForceIndex.kind
+        data = points
+    if kind not in _INDEX_TYPES:
+        raise InputError(f"Unknown index kind: {kind!r}. Use 'auto', 'kd_tree', 'ball_tree' or 'brute'")
+    if kind == BruteForceIndex.kind:
+        return BruteForceIndex(data)
+    return _INDEX_TYPES[kind](data, leaf_size=leaf_size)
+
+
+def load_index(path: Union[str, Path]) -> _Index:
+    """Load an index saved with ``save``."""
+    try:
+        with np.load(path) as arrays:
+            kind = str(arrays["kind"])
+            if kind not in _INDEX_TYPES:
+                raise FileFormatError(f"Unknown index kind in {path}: {kind!r}")
+            return _INDEX_TYPES[kind]._from_arrays({name: arrays[name] for name in arrays.files})
+    except FileFormatError:
+        raise
+    except Exception as e:
+        raise FileFormatError(f"Failed to load index {path}: {str(e)}")